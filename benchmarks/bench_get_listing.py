@@ -0,0 +1,32 @@
+"""
+Compares get_listing against the delete_nulls based parser it replaced.
+
+    python benchmarks/bench_get_listing.py
+"""
+import json
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from realestate_com_au.objects.listing import get_listing
+from legacy_listing import get_listing as get_listing_legacy
+
+FIXTURE_PATH = os.path.join(os.path.dirname(__file__), "fixtures", "listing.json")
+NUMBER = 20000
+
+
+def main():
+    with open(FIXTURE_PATH, encoding="utf8") as f:
+        listing = json.load(f)
+
+    assert get_listing(listing) == get_listing_legacy(listing)
+
+    for name, fn in [("legacy", get_listing_legacy), ("get_listing", get_listing)]:
+        seconds = min(timeit.repeat(lambda: fn(listing), number=NUMBER, repeat=5))
+        print(f"{name:>12}: {seconds / NUMBER * 1e6:.2f}us per listing")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""
+Compares KeywordFilter against the alternation regex search used to build for exclude_keywords.
+
+    python benchmarks/bench_keyword_filter.py
+"""
+import json
+import os
+import random
+import re
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from realestate_com_au.utils.keyword_filter import KeywordFilter
+
+FIXTURE_PATH = os.path.join(os.path.dirname(__file__), "fixtures", "listing.json")
+KEYWORD_COUNT = 300
+NUMBER = 2000
+
+
+def get_keywords(count):
+    random.seed(0)
+    prefixes = ["pool", "granny", "solar", "shed", "view", "tenant", "body corp", "strata", "flood", "acreage"]
+    return [
+        f"{random.choice(prefixes)} {''.join(random.choices('abcdefghijklmnopqrstuvwxyz', k=6))}"
+        for _ in range(count)
+    ]
+
+
+def main():
+    with open(FIXTURE_PATH, encoding="utf8") as f:
+        description = json.load(f)["description"] * 5
+
+    keywords = get_keywords(KEYWORD_COUNT)
+    pattern = re.compile("|".join(re.escape(keyword) for keyword in keywords))
+    keyword_filter = KeywordFilter(keywords)
+    assert bool(pattern.search(description)) == keyword_filter.matches(description)
+
+    for name, fn in [
+        ("alternation", lambda: pattern.search(description)),
+        ("KeywordFilter", lambda: keyword_filter.matches(description)),
+    ]:
+        seconds = min(timeit.repeat(fn, number=NUMBER, repeat=5))
+        print(f"{name:>13}: {seconds / NUMBER * 1e6:.2f}us per description")
+
+
+if __name__ == "__main__":
+    main()
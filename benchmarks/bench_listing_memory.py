@@ -0,0 +1,77 @@
+"""
+Measures the memory held per parsed listing, compared to the dict-backed dataclasses and
+uninterned strings that get_listing used to return.
+
+    python benchmarks/bench_listing_memory.py
+"""
+from dataclasses import MISSING, field, fields, make_dataclass
+import gc
+import json
+import os
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from realestate_com_au.objects.listing import (
+    Inspection,
+    Listing,
+    Lister,
+    MediaItem,
+    get_listing,
+)
+import legacy_listing
+
+FIXTURE_PATH = os.path.join(os.path.dirname(__file__), "fixtures", "listing.json")
+COUNT = 20000
+
+
+def without_slots(cls):
+    return make_dataclass(
+        cls.__name__,
+        [
+            (
+                f.name,
+                f.type,
+                field(default_factory=f.default_factory)
+                if f.default_factory is not MISSING
+                else field(),
+            )
+            for f in fields(cls)
+        ],
+    )
+
+
+def measure(parse, fixture):
+    gc.collect()
+    tracemalloc.start()
+    listings = []
+    for listing_id in range(COUNT):
+        # decode the fixture for every listing, so strings aren't shared unless they are interned
+        listing = json.loads(fixture)
+        listing["id"] = str(listing_id)
+        listings.append(parse(listing))
+        del listing
+    gc.collect()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return size / COUNT
+
+
+def main():
+    with open(FIXTURE_PATH, encoding="utf8") as f:
+        fixture = f.read()
+
+    # parse with the old parser, into dataclasses without __slots__
+    for cls in (Listing, Lister, MediaItem, Inspection):
+        setattr(legacy_listing, cls.__name__, without_slots(cls))
+
+    for name, parse in [
+        ("legacy", legacy_listing.get_listing),
+        ("get_listing", get_listing),
+    ]:
+        print(f"{name:>12}: {measure(parse, fixture):.0f} bytes per listing")
+
+
+if __name__ == "__main__":
+    main()
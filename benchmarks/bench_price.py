@@ -0,0 +1,57 @@
+"""
+Measures parse_prices throughput on 100k price texts, against parse_price_text.
+
+    python benchmarks/bench_price.py
+"""
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from realestate_com_au.objects.listing import parse_price_text
+from realestate_com_au.objects.price import parse_price, parse_prices
+
+COUNT = 100000
+
+
+def get_price_texts(count):
+    random.seed(0)
+    templates = [
+        "${}",
+        "${},000",
+        "Offers over ${}k",
+        "${}k - ${}k",
+        "Buyers ${},000 to ${},000",
+        "Contact agent",
+        "Auction",
+        "${} per week",
+    ]
+    price_texts = []
+    for _ in range(count):
+        template = random.choice(templates)
+        amounts = sorted(random.randint(300, 2000) for _ in range(template.count("{}")))
+        price_texts.append(template.format(*amounts))
+    return price_texts
+
+
+def main():
+    price_texts = get_price_texts(COUNT)
+    print(f"{len(set(price_texts))} distinct price texts")
+
+    for name, parse in [
+        ("parse_price_text", lambda: [parse_price_text(text) for text in price_texts]),
+        ("parse_prices (cold)", lambda: parse_prices(price_texts)),
+        ("parse_prices (warm)", lambda: parse_prices(price_texts)),
+    ]:
+        started_at = time.perf_counter()
+        parse()
+        seconds = time.perf_counter() - started_at
+        print(f"{name:>20}: {COUNT / seconds:,.0f} price texts per second")
+
+    parse_price.cache_clear()
+
+
+if __name__ == "__main__":
+    main()
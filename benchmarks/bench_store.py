@@ -0,0 +1,56 @@
+"""
+Compares reloading listings from a ListingStore against unpickling them.
+
+    python benchmarks/bench_store.py
+"""
+from dataclasses import replace
+import json
+import os
+import pickle
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from realestate_com_au.objects.listing import get_listing
+from realestate_com_au.store import ListingStore
+
+FIXTURE_PATH = os.path.join(os.path.dirname(__file__), "fixtures", "listing.json")
+COUNT = 100000
+
+
+def timed(name, fn):
+    started_at = time.perf_counter()
+    result = fn()
+    print(f"{name:>14}: {time.perf_counter() - started_at:.2f}s")
+    return result
+
+
+def main():
+    with open(FIXTURE_PATH, encoding="utf8") as f:
+        listing = get_listing(json.load(f))
+    listings = [replace(listing, id=str(listing_id)) for listing_id in range(COUNT)]
+
+    with tempfile.TemporaryDirectory() as directory:
+        pickle_path = os.path.join(directory, "listings.pickle")
+
+        def dump():
+            with open(pickle_path, "wb") as f:
+                pickle.dump(listings, f)
+
+        def load():
+            with open(pickle_path, "rb") as f:
+                return pickle.load(f)
+
+        timed("pickle dump", dump)
+        timed("pickle load", load)
+
+        store = ListingStore(os.path.join(directory, "listings.sqlite"))
+        timed("store save", lambda: store.save_stream(iter(listings)))
+        assert timed("store load", store.load)[-1] == listings[-1]
+        store.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+"""
+The delete_nulls based listing parser that get_listing replaced, kept as a baseline for benchmarks
+"""
+from realestate_com_au.objects.listing import (
+    Inspection,
+    Listing,
+    Lister,
+    MediaItem,
+    parse_availability,
+    parse_description,
+    parse_phone,
+    parse_price_text,
+)
+from realestate_com_au.utils import delete_nulls
+
+
+def get_lister(lister):
+    lister = delete_nulls(lister)
+    lister_id = lister.get("id")
+    name = lister.get("name")
+    agent_id = lister.get("agentId")
+    job_title = lister.get("jobTitle")
+    url = lister.get("_links", {}).get("canonical", {}).get("href")
+    phone = parse_phone(lister.get("preferredPhoneNumber"))
+    email = lister.get("email")  # TODO untested, need to confirm
+    return Lister(
+        id=lister_id,
+        name=name,
+        agent_id=agent_id,
+        job_title=job_title,
+        url=url,
+        phone=phone,
+        email=email,
+    )
+
+def get_image(media):
+    """Creates an object representing an image from the listing. Replaces the {size} parameter with a known working varaible"""
+    size_to_insert_into_link = '1144x888-format=webp'
+    return MediaItem(
+        link=media.get('templatedUrl',{}).replace("{size}", size_to_insert_into_link)
+    )
+
+def get_inspection(inspection):
+    inspection = delete_nulls(inspection)
+    start_time = inspection.get("startTime")
+    end_time = inspection.get("endTime")
+    label = inspection.get("display", {}).get("longLabel")
+    label_short = inspection.get("display", {}).get("shortLabel")
+    return Inspection(
+        start_time=start_time,
+        end_time=end_time,
+        label=label,
+        label_short=label_short
+    )
+
+def get_listing(listing):
+    listing = delete_nulls(listing)
+    # delete null keys for convenience
+
+    property_id = listing.get("id")
+    badge = listing.get("badge", {}).get("label")
+    url = listing.get("_links", {}).get("canonical", {}).get("href")
+    address = listing.get("address", {})
+    suburb = address.get("suburb")
+    state = address.get("state")
+    postcode = address.get("postcode")
+    short_address = address.get("display", {}).get("shortAddress")
+    full_address = address.get("display", {}).get("fullAddress")
+    property_type = listing.get("propertyType", {}).get("id")
+    listing_company = listing.get("listingCompany", {})
+    listing_company_id = listing_company.get("id")
+    listing_company_name = listing_company.get("name")
+    listing_company_phone = parse_phone(listing_company.get("businessPhone"))
+    features = listing.get("generalFeatures", {})
+    bedrooms = features.get("bedrooms", {}).get("value")
+    bathrooms = features.get("bathrooms", {}).get("value")
+    parking_spaces = features.get("parkingSpaces", {}).get("value")
+    property_sizes = listing.get("propertySizes", {})
+    building_size = property_sizes.get("building", {}).get("displayValue")
+    building_size_unit = property_sizes.get(
+        "building", {}).get("sizeUnit", {}).get("displayValue")
+    land_size = float(''.join(property_sizes.get(
+        "land", {}).get("displayValue", '-1').split(',')))
+    land_size_unit = property_sizes.get("land", {}).get(
+        "sizeUnit", {}).get("displayValue")
+    price_text = listing.get("price", {}).get("display", "")
+    price = parse_price_text(price_text)
+    price_text = listing.get("price", {}).get("display")
+    sold_date = listing.get("dateSold", {}).get("display")
+    auction = listing.get("auction", {}) or {}
+    auction_date = auction.get("dateTime", {}).get("value")
+    available_date_text = listing.get("availableDate", {}).get("display")
+    available_date = parse_availability(available_date_text)
+    description = parse_description(listing.get("description"))
+    images = [get_image(media) for media in listing.get("media", {}).get('images',[])]
+    images_floorplans = [get_image(media) for media in listing.get("media", {}).get('floorplans',[])]
+    listers = [get_lister(lister) for lister in listing.get("listers", [])]
+    inspections = [get_inspection(inspection) for inspection in listing.get("inspections", [])]
+
+    return Listing(
+        id=property_id,
+        badge=badge,
+        url=url,
+        suburb=suburb,
+        state=state,
+        postcode=postcode,
+        short_address=short_address,
+        full_address=full_address,
+        property_type=property_type,
+        listing_company_id=listing_company_id,
+        listing_company_name=listing_company_name,
+        listing_company_phone=listing_company_phone,
+        bedrooms=bedrooms,
+        bathrooms=bathrooms,
+        parking_spaces=parking_spaces,
+        building_size=building_size,
+        building_size_unit=building_size_unit,
+        land_size=land_size,
+        land_size_unit=land_size_unit,
+        price=price,
+        price_text=price_text,
+        auction_date=auction_date,
+        available_date=available_date,
+        sold_date=sold_date,
+        description=description,
+        images=images,
+        images_floorplans=images_floorplans,
+        listers=listers,
+        inspections=inspections
+    )
@@ -0,0 +1,183 @@
+"""
+Runs the offline benchmark suite against synthetic fixtures and a local stub server,
+and optionally compares the results to a baseline from an earlier run.
+
+    python benchmarks/run.py --output results.json
+    python benchmarks/run.py --baseline results.json
+
+Exits with 1 if any result is worse than the baseline by more than --tolerance.
+"""
+import argparse
+import gc
+import json
+import os
+import platform
+import sys
+import time
+import timeit
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from realestate_com_au import RealestateComAu
+from realestate_com_au.rate_limit import RateLimiter
+from realestate_com_au.search import Search
+from realestate_com_au.transport import Transport
+from realestate_com_au.utils.fast_json import loads
+from stub_server import CHANNELS, FIXTURES_PATH, StubServer
+
+SEARCH_PAGES = 20
+SEARCH_LATENCY = 0.005
+SCALING_PAGES = 16
+SCALING_LATENCY = 0.05
+SCALING_WORKERS = (1, 2, 4, 8)
+MEMORY_PAGES = 200
+
+
+def read_page_body(channel):
+    with open(os.path.join(FIXTURES_PATH, f"{channel}_page.json"), "rb") as f:
+        return f.read()
+
+
+def get_api(server, workers=1):
+    transport = Transport(pool_size=max(workers, 1))
+    # pace requests with a limiter that never blocks, instead of Fajita's random 2-5s sleeps
+    api = RealestateComAu(
+        transport=transport, rate_limiter=RateLimiter(rate=1e6, burst=1e6, max_rate=1e6)
+    )
+    api._base_url = server.url
+    return api
+
+
+def bench_decode(results):
+    body = read_page_body("buy")
+    number = 200
+    seconds = min(timeit.repeat(lambda: loads(body), number=number, repeat=5))
+    results["decode_page_ms"] = (seconds / number * 1e3, "ms", False)
+
+
+def bench_parse(results):
+    for channel in CHANNELS:
+        data = loads(read_page_body(channel))
+        search = Search(channel=channel)
+        count = len(search.parse_items(data))
+        number = 200
+        seconds = min(
+            timeit.repeat(lambda: search.parse_items(data), number=number, repeat=5)
+        )
+        results[f"parse_{channel}_us_per_listing"] = (
+            seconds / number / count * 1e6,
+            "us",
+            False,
+        )
+
+
+def bench_memory(results):
+    body = read_page_body("buy")
+    search = Search()
+    gc.collect()
+    tracemalloc.start()
+    listings = []
+    for _ in range(MEMORY_PAGES):
+        # decode every page, so strings are only shared if parsing interns them
+        listings.extend(search.parse_items(loads(body)))
+    gc.collect()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    results["memory_bytes_per_listing"] = (size / len(listings), "bytes", False)
+
+
+def bench_search(results):
+    with StubServer(pages=SEARCH_PAGES, latency=SEARCH_LATENCY) as server:
+        api = get_api(server)
+        start = time.perf_counter()
+        listings = api.search(locations=["seventeen seventy, qld 4677"])
+        seconds = time.perf_counter() - start
+    results["search_listings_per_second"] = (len(listings) / seconds, "listings/s", True)
+
+
+def bench_scaling(results):
+    with StubServer(pages=SCALING_PAGES, latency=SCALING_LATENCY) as server:
+        for workers in SCALING_WORKERS:
+            api = get_api(server, workers)
+            start = time.perf_counter()
+            api.search(locations=["seventeen seventy, qld 4677"], workers=workers)
+            seconds = time.perf_counter() - start
+            results[f"search_workers_{workers}_seconds"] = (seconds, "s", False)
+
+
+BENCHMARKS = {
+    "decode": bench_decode,
+    "parse": bench_parse,
+    "memory": bench_memory,
+    "search": bench_search,
+    "scaling": bench_scaling,
+}
+
+
+def compare(results, baseline, tolerance):
+    """
+    Prints each result's change from the baseline, and returns the names of those that regressed.
+    """
+    regressions = []
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+        value, base = result["value"], baseline[name]["value"]
+        change = (value - base) / base if base else 0.0
+        worse = -change if result["higher_is_better"] else change
+        flag = ""
+        if worse > tolerance:
+            regressions.append(name)
+            flag = "  REGRESSION"
+        print(f"{name:>36}: {base:12.3f} -> {value:12.3f} {result['unit']:<10} {change:+7.1%}{flag}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "benchmarks", nargs="*", help=f"Benchmarks to run (default: all of {', '.join(BENCHMARKS)})"
+    )
+    parser.add_argument("--output", help="Write the results to this JSON file")
+    parser.add_argument("--baseline", help="Compare the results to this JSON file")
+    parser.add_argument("--tolerance", type=float, default=0.2)
+    args = parser.parse_args()
+    for name in args.benchmarks:
+        if name not in BENCHMARKS:
+            parser.error(f"unknown benchmark: {name}")
+
+    results = {}
+    for name in args.benchmarks or BENCHMARKS:
+        BENCHMARKS[name](results)
+
+    results = {
+        name: {"value": value, "unit": unit, "higher_is_better": higher_is_better}
+        for name, (value, unit, higher_is_better) in results.items()
+    }
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(
+                {
+                    "python": platform.python_version(),
+                    "machine": platform.machine(),
+                    "results": results,
+                },
+                f,
+                indent=2,
+            )
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)["results"]
+        if compare(results, baseline, args.tolerance):
+            return 1
+    else:
+        for name, result in results.items():
+            print(f"{name:>36}: {result['value']:12.3f} {result['unit']}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
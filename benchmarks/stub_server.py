@@ -0,0 +1,119 @@
+"""
+Local stub of the realestate.com.au GraphQL api, which serves synthetic pages of listings.
+
+    python benchmarks/stub_server.py --pages 10 --latency 0.05
+"""
+import argparse
+from copy import deepcopy
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+import os
+import threading
+import time
+
+FIXTURES_PATH = os.path.join(os.path.dirname(__file__), "fixtures")
+CHANNELS = ("buy", "rent", "sold")
+
+
+def load_page_fixture(channel):
+    with open(os.path.join(FIXTURES_PATH, f"{channel}_page.json"), encoding="utf8") as f:
+        return json.load(f)
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        payload = json.loads(self.rfile.read(int(self.headers["content-length"])))
+        query = json.loads(payload["variables"]["query"])
+        body = self.server.get_page(query["channel"], query["page"])
+
+        if self.server.latency:
+            time.sleep(self.server.latency)
+        self.send_response(200)
+        self.send_header("content-type", "application/json")
+        self.send_header("content-length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class StubServer(ThreadingHTTPServer):
+    """
+    Serves `pages` pages of each channel's synthetic fixture, after `latency` seconds per request.
+    Listing ids are rewritten per page, so every page's listings are distinct.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, pages=4, latency=0.0, port=0):
+        super().__init__(("127.0.0.1", port), StubHandler)
+        self.pages = pages
+        self.latency = latency
+        self.requests = 0
+        self._fixtures = {channel: load_page_fixture(channel) for channel in CHANNELS}
+        self._bodies = {}
+        self._lock = threading.Lock()
+        self._thread = None
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.server_port}"
+
+    def get_page(self, channel, page):
+        with self._lock:
+            self.requests += 1
+            key = (channel, page)
+            if key not in self._bodies:
+                self._bodies[key] = self._render_page(channel, page)
+            return self._bodies[key]
+
+    def _render_page(self, channel, page):
+        data = deepcopy(self._fixtures[channel])
+        results = data["data"][f"{channel}Search"]["results"]
+        items = results["exact"]["items"] if page <= self.pages else []
+        for position, item in enumerate(items):
+            item["listing"]["id"] = f"{page}{position:04d}"
+        results["exact"]["items"] = items
+        results["totalResultsCount"] = self.pages * len(
+            self._fixtures[channel]["data"][f"{channel}Search"]["results"]["exact"]["items"]
+        )
+        results["pagination"] = {
+            "page": page,
+            "moreResultsAvailable": page < self.pages,
+            "maxPageNumberAvailable": self.pages,
+        }
+        return json.dumps(data).encode("utf-8")
+
+    def start(self):
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--pages", type=int, default=4)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--port", type=int, default=8080)
+    args = parser.parse_args()
+
+    server = StubServer(pages=args.pages, latency=args.latency, port=args.port)
+    print(f"Serving {args.pages} pages per search on {server.url}")
+    server.serve_forever()
+
+
+if __name__ == "__main__":
+    main()
@@ -2,6 +2,7 @@
     realestate-com-au-api
 """
 from .realestate_com_au import RealestateComAu
+from .async_realestate_com_au import AsyncRealestateComAu
 
 __title__ = "realestate_com_au_api"
 __version__ = "0.0.1b1"
@@ -12,4 +13,4 @@ __license__ = "MIT"
 __author__ = "Tom Quirk"
 __email__ = "tomquirkacc@gmail.com"
 
-__all__ = ["RealestateComAu"]
+__all__ = ["RealestateComAu", "AsyncRealestateComAu"]
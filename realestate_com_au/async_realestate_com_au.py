@@ -0,0 +1,230 @@
+"""
+Provides an asyncio client for the realestate.com.au api
+"""
+import asyncio
+from collections import deque
+import logging
+
+from realestate_com_au.base import ClientBase
+from realestate_com_au.metrics import timer
+from realestate_com_au.rate_limit import RetryPolicy
+from realestate_com_au.realestate_com_au import RealestateComAu
+from realestate_com_au.search import Search
+from realestate_com_au.transport import DEFAULT_POOL_SIZE, _get_accept_encoding, _import_httpx
+
+logger = logging.getLogger(__name__)
+
+
+def _get_connection_errors():
+    try:
+        import httpx
+    except ImportError:
+        return (OSError, asyncio.TimeoutError)
+    return (OSError, asyncio.TimeoutError, httpx.TransportError)
+
+
+class AsyncRealestateComAu(ClientBase):
+    """
+    Class for accessing realestate.com.au API from asyncio.
+
+    `client` is the httpx.AsyncClient to send requests with, which can be shared
+    between instances. If it isn't given, one is created with a pool of `pool_size`
+    connections, and closed by `close`.
+
+    `semaphore` limits how many requests are in flight at once. Share one
+    asyncio.Semaphore between clients to limit concurrency across all of them.
+    """
+
+    API_BASE_URL = RealestateComAu.API_BASE_URL
+    AGENT_CONTACT_BASE_URL = RealestateComAu.AGENT_CONTACT_BASE_URL
+    REQUEST_HEADERS = RealestateComAu.REQUEST_HEADERS
+
+    def __init__(
+        self,
+        client=None,
+        semaphore=None,
+        cache=None,
+        retry_policy=None,
+        pool_size=DEFAULT_POOL_SIZE,
+        http2=False,
+        proxies={},
+        metrics=None,
+    ):
+        if proxies and client is not None:
+            raise ValueError("Pass proxies to the httpx client rather than with a client")
+
+        self._owns_client = client is None
+        if client is None:
+            httpx = _import_httpx()
+            client = httpx.AsyncClient(
+                http2=http2,
+                limits=httpx.Limits(
+                    max_connections=pool_size, max_keepalive_connections=pool_size
+                ),
+                headers={"accept-encoding": _get_accept_encoding()},
+                proxy=next(iter(proxies.values()), None),
+            )
+        self._client = client
+        self._pool_size = pool_size
+        self._semaphore = semaphore
+        self._default_semaphores = {}  # by the event loop they were created in
+        self._cache = cache
+        self._retry_policy = retry_policy if retry_policy is not None else RetryPolicy()
+        self._connection_errors = _get_connection_errors()
+        self._metrics = metrics
+        self.logger = logger
+
+    async def search(self, **search_kwargs):
+        """
+        Search for listings. Takes the same arguments as `RealestateComAu.search`,
+        and returns a list of listings.
+        """
+        return [
+            listing
+            async for listings in self.search_pages(**search_kwargs)
+            for listing in listings
+        ]
+
+    async def search_pages(self, workers=1, on_page=None, **search_kwargs):
+        """
+        Search for listings, yielding the listings of each page as it is parsed:
+
+            async for listings in api.search_pages(locations=["seventeen seventy, qld 4677"]):
+                ...
+
+        With `workers` > 1, up to `workers` of the remaining pages are requested at once
+        once the first page reports how many pages there are. Pages are still yielded in order.
+        """
+        search = Search(**search_kwargs, metrics=self._metrics)
+
+        def get_page(page):
+            return self._graphql(search.get_payload(page), search.channel)
+
+        async def fetch_pages(first_page):
+            page = first_page
+            while True:
+                yield await get_page(page)
+                page += 1
+
+        async def fetch_pages_concurrently(first_page, last_page):
+            pending = deque()
+            try:
+                for page in range(first_page, last_page + 1):
+                    pending.append(asyncio.ensure_future(get_page(page)))
+                    if len(pending) >= workers:
+                        yield await pending.popleft()
+                while pending:
+                    yield await pending.popleft()
+            finally:
+                for task in pending:
+                    task.cancel()
+
+        async def fetch_remaining_pages(max_page):
+            if max_page:
+                async for data in fetch_pages_concurrently(search.start_page + 1, max_page):
+                    yield data
+                pages = fetch_pages(max(search.start_page, max_page) + 1)
+            else:
+                pages = fetch_pages(search.start_page + 1)
+            async for data in pages:
+                yield data
+
+        data = await get_page(search.start_page)
+        max_page = search.get_max_page(data) if workers > 1 else None
+        pages = fetch_remaining_pages(max_page)
+
+        page = search.start_page
+        items_count = 0
+        try:
+            while True:
+                items = search.parse_items(data)
+                items_count += len(items)
+                yield items
+
+                if on_page is not None:
+                    on_page(page, search.get_results(data))
+
+                if search.is_done(items_count, data):
+                    return
+
+                data = await pages.__anext__()
+                page += 1
+        finally:
+            await pages.aclose()
+
+    def _get_semaphore(self):
+        if self._semaphore is not None:
+            return self._semaphore
+
+        # before Python 3.10 a semaphore binds to the event loop it's created in,
+        # so the default one is created in the running loop, once per loop
+        loop = asyncio.get_running_loop()
+        if loop not in self._default_semaphores:
+            self._default_semaphores.clear()
+            self._default_semaphores[loop] = asyncio.Semaphore(self._pool_size)
+        return self._default_semaphores[loop]
+
+    async def _post(self, uri, base_url=None, retry=False, **kwargs):
+        """
+        Sends a POST request once the semaphore allows, retrying it if `retry` is set.
+        """
+        semaphore = self._get_semaphore()
+        url = f"{base_url or self.API_BASE_URL}{uri}"
+        attempt = 0
+        while True:
+            try:
+                async with semaphore:
+                    with timer(self._metrics, "request"):
+                        res = await self._client.post(
+                            url, headers=self.REQUEST_HEADERS, **kwargs
+                        )
+            except self._connection_errors:
+                delay = self._on_response(url, None, attempt, retry)
+                if delay is None:
+                    raise
+            else:
+                delay = self._on_response(url, res, attempt, retry)
+                if delay is None:
+                    return res
+
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def _graphql(self, payload, channel):
+        """
+        Returns the decoded response to a GraphQL payload, from the response cache if possible.
+        """
+        data = self._get_cached_graphql(payload, channel)
+        if data is None:
+            res = await self._post("", json=payload, retry=True)
+            data = self._decode_graphql(payload, channel, res)
+        return data
+
+    async def contact_agent(
+        self,
+        listing_id,
+        from_address,
+        from_name,
+        message,
+        subject="",
+        from_phone="",
+    ):
+        """
+        Returns true if form was submitted successfully.
+        """
+        res = await self._post(
+            **self._get_contact_agent_request(
+                listing_id, from_address, from_name, message, subject, from_phone
+            )
+        )
+        return self._is_agent_contacted(res)
+
+    async def close(self):
+        if self._owns_client:
+            await self._client.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
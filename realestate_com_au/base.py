@@ -0,0 +1,96 @@
+"""
+Provides the request and response handling shared by the sync and asyncio clients
+"""
+from realestate_com_au.metrics import timer
+from realestate_com_au.utils.fast_json import loads
+
+
+class ClientBase(object):
+    """
+    Builds requests and handles responses for `RealestateComAu` and `AsyncRealestateComAu`,
+    which only differ in how they send requests and wait between retries.
+
+    Subclasses set `_cache`, `_retry_policy`, `_metrics` and `logger`.
+    """
+
+    def _on_response(self, url, res, attempt, retry=False):
+        """
+        Records a response, or None after a connection error, and returns how long to
+        wait before retrying the request, or None if it shouldn't be retried.
+
+        With `retry`, which is only safe for idempotent requests such as searches,
+        requests are retried according to the retry policy.
+        """
+        if self._metrics is not None:
+            self._metrics.increment("requests")
+            if res is not None:
+                self._metrics.increment("bytes_received", len(res.content))
+
+        if not retry or not self._retry_policy.should_retry(res, attempt):
+            return None
+
+        if self._metrics is not None:
+            self._metrics.increment("retries")
+        delay = self._retry_policy.get_delay(res, attempt)
+        self.logger.debug(
+            "Retrying %s in %.2fs (status %s)",
+            url,
+            delay,
+            res.status_code if res is not None else "connection error",
+        )
+        return delay
+
+    def _get_cached_graphql(self, payload, channel):
+        """
+        Returns the decoded cached response to a GraphQL payload, or None if it isn't cached.
+        """
+        if self._cache is None:
+            return None
+
+        content = self._cache.get(payload, channel)
+        if content is None:
+            return None
+
+        if self._metrics is not None:
+            self._metrics.increment("cache_hits")
+        with timer(self._metrics, "decode"):
+            return loads(content)
+
+    def _decode_graphql(self, payload, channel, res):
+        """
+        Returns the decoded response to a GraphQL payload, and caches it if it succeeded.
+        """
+        with timer(self._metrics, "decode"):
+            # decoded from the body once, and shared by parsing and pagination
+            data = loads(res.content)
+
+        if self._cache is not None and res.status_code == 200 and not data.get("errors"):
+            self._cache.put(payload, channel, res.content)
+
+        return data
+
+    def _get_contact_agent_request(
+        self, listing_id, from_address, from_name, message, subject="", from_phone=""
+    ):
+        """
+        Returns the arguments of the POST request that contacts a listing's agent.
+        """
+        return {
+            "uri": f"/contact-agent/listing/{listing_id}",
+            "base_url": self.AGENT_CONTACT_BASE_URL,
+            "json": {
+                "lookingTo": subject,
+                "name": from_name,
+                "fromAddress": from_address,
+                "fromPhone": from_phone,
+                "message": message,
+                "likeTo": [],
+            },
+        }
+
+    def _is_agent_contacted(self, res):
+        error = res.status_code != 201
+        if error:
+            self.logger.error("Error contacting agent: %s", res.text)
+
+        return not error
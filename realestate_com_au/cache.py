@@ -0,0 +1,124 @@
+"""
+Provides an on-disk cache of realestate.com.au api responses
+"""
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+import zlib
+
+from realestate_com_au.utils.size_limit import SizeLimit
+
+DEFAULT_TTLS = {
+    "buy": 60 * 60,
+    "rent": 60 * 60,
+    "sold": 7 * 24 * 60 * 60,  # sold listings don't change once they're sold
+}
+DEFAULT_MAX_SIZE = 256 * 1024 * 1024
+
+
+def get_cache_key(payload):
+    """
+    Returns a hash of a GraphQL payload that doesn't depend on key order,
+    including the key order of the JSON-encoded query variables.
+    """
+    variables = dict(payload.get("variables", {}))
+    if isinstance(variables.get("query"), str):
+        variables["query"] = json.loads(variables["query"])
+    canonical_payload = json.dumps(
+        {**payload, "variables": variables}, sort_keys=True, separators=(",", ":")
+    )
+    return hashlib.sha256(canonical_payload.encode("utf-8")).hexdigest()
+
+
+class ResponseCache(object):
+    """
+    SQLite-backed cache of compressed response bodies, keyed by GraphQL payload.
+
+    Entries expire after a per-channel TTL (in seconds), and the least recently
+    used entries are evicted once the compressed bodies exceed `max_size` bytes.
+    """
+
+    def __init__(self, path, ttls=None, max_size=DEFAULT_MAX_SIZE):
+        self.path = path
+        self.ttls = {**DEFAULT_TTLS, **(ttls or {})}
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.execute(
+            """
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                channel TEXT NOT NULL,
+                content BLOB NOT NULL,
+                size INTEGER NOT NULL,
+                created_at REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            )
+            """
+        )
+        self._connection.execute(
+            "CREATE INDEX IF NOT EXISTS responses_accessed_at ON responses (accessed_at)"
+        )
+        self._size_limit = SizeLimit(self._connection, "responses", "key", max_size)
+        self._connection.commit()
+
+    @property
+    def max_size(self):
+        return self._size_limit.max_size
+
+    @max_size.setter
+    def max_size(self, max_size):
+        self._size_limit.max_size = max_size
+
+    def get(self, payload, channel):
+        """
+        Returns the cached response body for a payload, or None if there is no fresh entry.
+        """
+        key = get_cache_key(payload)
+        now = time.time()
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT content, size, created_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+
+            content, size, created_at = row
+            if now - created_at > self.ttls.get(channel, 0):
+                self._connection.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self._size_limit.add(-size)
+                self._connection.commit()
+                return None
+
+            self._connection.execute(
+                "UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key)
+            )
+            self._connection.commit()
+
+        return zlib.decompress(content)
+
+    def put(self, payload, channel, content):
+        key = get_cache_key(payload)
+        compressed_content = zlib.compress(content)
+        now = time.time()
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT size FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            self._connection.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?)",
+                (key, channel, compressed_content, len(compressed_content), now, now),
+            )
+            self._size_limit.add(len(compressed_content) - (row[0] if row else 0))
+            self._size_limit.evict()
+            self._connection.commit()
+
+    def clear(self):
+        with self._lock:
+            self._connection.execute("DELETE FROM responses")
+            self._size_limit.reset()
+            self._connection.commit()
+
+    def close(self):
+        self._connection.close()
@@ -0,0 +1,308 @@
+"""
+Provides crawls of many searches across a pool of processes, which resume where they stopped
+"""
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field
+import json
+import logging
+import multiprocessing
+import os
+from queue import Empty
+import sqlite3
+import sys
+
+from realestate_com_au.realestate_com_au import RealestateComAu
+from realestate_com_au.store import ListingStore
+from realestate_com_au.sync import get_query_key
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CrawlResult:
+    listings: int = 0                                  # Listings written to the sink by this run
+    completed: list = field(default_factory=list)     # Keys of the jobs completed by this run
+    skipped: list = field(default_factory=list)       # Keys of the jobs already completed by an earlier run
+    failed: dict = field(default_factory=dict)        # Errors of the jobs that failed, by key
+
+
+class Checkpoint(object):
+    """
+    SQLite-backed record of the last page written for each job, how many listings
+    had been written by then, and which jobs are done.
+
+    A row is updated and committed (with a full fsync) after every page, so a crawl
+    that is interrupted at any point resumes from the page after the last one its
+    sink received.
+    """
+
+    def __init__(self, path=None):
+        self.path = path
+        self._connection = sqlite3.connect(path if path is not None else ":memory:")
+        self._connection.executescript(
+            """
+            PRAGMA synchronous = FULL;
+            CREATE TABLE IF NOT EXISTS jobs (
+                key TEXT PRIMARY KEY,
+                page INTEGER,
+                items INTEGER NOT NULL,
+                done INTEGER NOT NULL
+            );
+            """
+        )
+        self._connection.commit()
+
+    def _get_row(self, key):
+        return self._connection.execute(
+            "SELECT page, items, done FROM jobs WHERE key = ?", (key,)
+        ).fetchone()
+
+    def get_page(self, key):
+        row = self._get_row(key)
+        return row[0] if row else None
+
+    def get_items(self, key):
+        row = self._get_row(key)
+        return row[1] if row else 0
+
+    def is_done(self, key):
+        row = self._get_row(key)
+        return bool(row[2]) if row else False
+
+    def set_page(self, key, page, items):
+        """
+        Records that a job's listings up to `page`, `items` in all, have been written.
+        """
+        self._connection.execute(
+            "INSERT OR REPLACE INTO jobs VALUES (?, ?, ?, 0)", (key, page, items)
+        )
+        self._connection.commit()
+
+    def set_done(self, key):
+        self._connection.execute(
+            "INSERT OR IGNORE INTO jobs VALUES (?, NULL, 0, 0)", (key,)
+        )
+        self._connection.execute("UPDATE jobs SET done = 1 WHERE key = ?", (key,))
+        self._connection.commit()
+
+    def close(self):
+        self._connection.close()
+
+
+class JsonLinesSink(object):
+    """
+    Appends listings to a file, one JSON object per line.
+    """
+
+    def __init__(self, path):
+        self._file = open(path, "a")
+
+    def write(self, listings):
+        for listing in listings:
+            self._file.write(json.dumps(asdict(listing)) + "\n")
+        self._file.flush()
+
+    def close(self):
+        self._file.close()
+
+
+class ListingStoreSink(object):
+    """
+    Saves listings to a `ListingStore`.
+    """
+
+    def __init__(self, path):
+        self.store = ListingStore(path)
+
+    def write(self, listings):
+        self.store.save(listings)
+
+    def close(self):
+        self.store.close()
+
+
+def get_sink(path):
+    """
+    Returns the sink for an output path: a `ListingStore` for .db, .sqlite and .sqlite3 files,
+    and JSON lines otherwise.
+    """
+    if os.path.splitext(path)[1] in (".db", ".sqlite", ".sqlite3"):
+        return ListingStoreSink(path)
+    return JsonLinesSink(path)
+
+
+_api = None  # each worker process's client
+
+
+def _init_worker(client_factory):
+    global _api
+    _api = client_factory()
+
+
+class _LimitReached(Exception):
+    pass
+
+
+def _get_limit(job):
+    limits = [job.get("limit", -1)]
+    if job.get("channel", "buy") == "sold":
+        limits.append(job.get("sold_limit", -1))
+    limits = [limit for limit in limits if limit > -1]
+    return min(limits) if limits else -1
+
+
+def _run_job(key, job, start_page, items_count, queue):
+    listings = []
+    limit = _get_limit(job)
+
+    def on_page(page, results):
+        nonlocal items_count
+        items_count += len(listings)
+        queue.put(("page", key, page, list(listings)))
+        listings.clear()
+        # the search only counts its own listings, not those written before a resume
+        if limit > -1 and items_count >= limit:
+            raise _LimitReached()
+
+    try:
+        for listing in _api.search(
+            **{**job, "start_page": start_page}, stream=True, on_page=on_page
+        ):
+            listings.append(listing)
+    except _LimitReached:
+        pass
+    except Exception as e:
+        queue.put(("failed", key, repr(e)))
+        return
+    queue.put(("done", key))
+
+
+def crawl(
+    jobs,
+    sink,
+    checkpoint_path=None,
+    processes=None,
+    client_factory=RealestateComAu,
+):
+    """
+    Runs a list of searches, given as dicts of `search` keyword arguments, across
+    `processes` worker processes, and writes their listings to `sink` page by page.
+
+    Each worker builds its own client with `client_factory` (which must be picklable).
+    The sink only receives listings in this process, so it doesn't need to be.
+
+    With a `checkpoint_path`, jobs already done by an earlier crawl are skipped, and
+    jobs that were interrupted resume from the page after the last one written, with
+    the listings already written counting towards their `limit` and `sold_limit`.
+    """
+    checkpoint = Checkpoint(checkpoint_path)
+    try:
+        return _crawl(jobs, sink, checkpoint, processes, client_factory)
+    finally:
+        checkpoint.close()
+
+
+def _crawl(jobs, sink, checkpoint, processes, client_factory):
+    result = CrawlResult()
+
+    pending = {}
+    for job in jobs:
+        key = get_query_key(job)
+        if checkpoint.is_done(key):
+            result.skipped.append(key)
+        else:
+            pending[key] = job
+    if not pending:
+        return result
+
+    with multiprocessing.Manager() as manager, ProcessPoolExecutor(
+        processes, initializer=_init_worker, initargs=(client_factory,)
+    ) as executor:
+        queue = manager.Queue()
+        futures = {}
+        for key, job in pending.items():
+            page = checkpoint.get_page(key)
+            start_page = page + 1 if page is not None else job.get("start_page", 1)
+            futures[key] = executor.submit(
+                _run_job, key, job, start_page, checkpoint.get_items(key), queue
+            )
+
+        remaining = set(pending)
+        while remaining:
+            try:
+                message = queue.get(timeout=1)
+            except Empty:
+                # a worker that died without reporting back (e.g. killed) leaves its job unfinished.
+                # A job that returned normally has already queued its "done", so keep draining for it
+                for key in [key for key in remaining if futures[key].done()]:
+                    error = futures[key].exception()
+                    if error is not None:
+                        logger.error("Crawl job %s failed: %r", pending[key], error)
+                        result.failed[key] = repr(error)
+                        remaining.discard(key)
+                continue
+
+            kind, key = message[:2]
+            if kind == "page":
+                _, _, page, listings = message
+                sink.write(listings)
+                checkpoint.set_page(key, page, checkpoint.get_items(key) + len(listings))
+                result.listings += len(listings)
+            elif kind == "done":
+                checkpoint.set_done(key)
+                result.completed.append(key)
+                remaining.discard(key)
+            else:
+                logger.error("Crawl job %s failed: %s", pending[key], message[2])
+                result.failed[key] = message[2]
+                remaining.discard(key)
+
+    return result
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(
+        description="Crawl realestate.com.au searches across processes, resuming from a checkpoint."
+    )
+    parser.add_argument(
+        "jobs", help="JSON file with a list of searches, as `search` keyword arguments"
+    )
+    parser.add_argument(
+        "output", help="Output file: a ListingStore if .db/.sqlite, otherwise JSON lines"
+    )
+    parser.add_argument(
+        "--checkpoint", help="Checkpoint file (default: the output path + .checkpoint.sqlite)"
+    )
+    parser.add_argument("--processes", type=int, default=None)
+    parser.add_argument("--debug", action="store_true")
+    args = parser.parse_args(args)
+
+    logging.basicConfig(level=logging.DEBUG if args.debug else logging.INFO)
+
+    with open(args.jobs) as f:
+        jobs = json.load(f)
+
+    sink = get_sink(args.output)
+    try:
+        result = crawl(
+            jobs,
+            sink,
+            checkpoint_path=args.checkpoint or f"{args.output}.checkpoint.sqlite",
+            processes=args.processes,
+        )
+    finally:
+        sink.close()
+
+    logger.info(
+        "Wrote %d listings: %d jobs completed, %d already done, %d failed",
+        result.listings,
+        len(result.completed),
+        len(result.skipped),
+        len(result.failed),
+    )
+    return 1 if result.failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
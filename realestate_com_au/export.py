@@ -0,0 +1,219 @@
+"""
+Provides columnar storage and export of listings
+"""
+from array import array
+import csv
+from dataclasses import fields
+import math
+
+from realestate_com_au.objects.listing import Listing
+
+NUMERIC_FIELDS = ("price", "bedrooms", "bathrooms", "parking_spaces", "land_size")
+CATEGORICAL_FIELDS = (
+    "badge",
+    "suburb",
+    "state",
+    "postcode",
+    "property_type",
+    "building_size_unit",
+    "land_size_unit",
+    "listing_company_id",
+    "listing_company_name",
+    "listing_company_phone",
+)
+LIST_FIELDS = ("images", "images_floorplans", "listers", "inspections")
+COLUMNS = tuple(f.name for f in fields(Listing) if f.name not in LIST_FIELDS)
+
+DEFAULT_CHUNK_SIZE = 10000
+
+
+class ListingColumns(object):
+    """
+    Accumulates the scalar fields of listings into columns, rather than keeping listing objects.
+
+    Numeric fields are stored as float arrays (missing values are NaN), and
+    categorical fields are dictionary encoded: an int array of codes (missing
+    values are -1) into a list of the distinct values.
+    """
+
+    def __init__(self):
+        self.numeric = {name: array("d") for name in NUMERIC_FIELDS}
+        self.codes = {name: array("i") for name in CATEGORICAL_FIELDS}
+        self.categories = {name: [] for name in CATEGORICAL_FIELDS}
+        self._category_codes = {name: {} for name in CATEGORICAL_FIELDS}
+        self.text = {
+            name: []
+            for name in COLUMNS
+            if name not in NUMERIC_FIELDS and name not in CATEGORICAL_FIELDS
+        }
+
+    def __len__(self):
+        return len(self.text["id"])
+
+    def append(self, listing):
+        for name, column in self.numeric.items():
+            value = getattr(listing, name)
+            # land_size is -1 when a listing doesn't have one
+            if value is None or (name == "land_size" and value < 0):
+                value = math.nan
+            column.append(value)
+
+        for name, column in self.codes.items():
+            value = getattr(listing, name)
+            if value is None:
+                column.append(-1)
+                continue
+
+            category_codes = self._category_codes[name]
+            code = category_codes.get(value)
+            if code is None:
+                code = category_codes[value] = len(self.categories[name])
+                self.categories[name].append(value)
+            column.append(code)
+
+        for name, column in self.text.items():
+            column.append(getattr(listing, name))
+
+    def extend(self, listings):
+        for listing in listings:
+            self.append(listing)
+
+    def clear(self):
+        """
+        Empties the columns. The categories are kept, so codes are stable across chunks.
+        """
+        for column in self.numeric.values():
+            del column[:]
+        for column in self.codes.values():
+            del column[:]
+        for column in self.text.values():
+            column.clear()
+
+    def column(self, name):
+        """
+        Returns a column as a list of values, with None for missing values.
+        """
+        if name in self.numeric:
+            return [None if math.isnan(value) else value for value in self.numeric[name]]
+        if name in self.codes:
+            categories = self.categories[name]
+            return [None if code == -1 else categories[code] for code in self.codes[name]]
+        return self.text[name]
+
+    def to_dict(self):
+        """
+        Returns the columns in Listing field order, e.g. for `pandas.DataFrame(columns.to_dict())`.
+        """
+        return {name: self.column(name) for name in COLUMNS}
+
+    def rows(self):
+        return zip(*(self.column(name) for name in COLUMNS))
+
+    def to_arrow(self):
+        """
+        Returns the columns as a pyarrow Table, with categorical fields as dictionary arrays.
+        """
+        pa = _import_pyarrow()
+
+        arrays = []
+        for name in COLUMNS:
+            if name in self.numeric:
+                arrays.append(
+                    pa.array(self.numeric[name], type=pa.float64(), from_pandas=True)
+                )
+            elif name in self.codes:
+                indices = pa.array(
+                    self.codes[name],
+                    type=pa.int32(),
+                    mask=[code == -1 for code in self.codes[name]],
+                )
+                arrays.append(
+                    pa.DictionaryArray.from_arrays(
+                        indices, pa.array(self.categories[name], type=pa.string())
+                    )
+                )
+            else:
+                arrays.append(pa.array(self.text[name], type=pa.string()))
+
+        return pa.Table.from_arrays(arrays, names=list(COLUMNS))
+
+
+def _import_pyarrow():
+    try:
+        import pyarrow
+    except ImportError:
+        raise ImportError("pyarrow is required to export listings to Arrow or Parquet")
+    return pyarrow
+
+
+def _format_csv_value(value):
+    if value is None:
+        return ""
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    return value
+
+
+def _iter_chunks(listings, chunk_size):
+    columns = ListingColumns()
+    for listing in listings:
+        columns.append(listing)
+        if len(columns) >= chunk_size:
+            yield columns
+            columns.clear()
+    if len(columns):
+        yield columns
+
+
+def write_csv(listings, file, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Writes listings (e.g. from `search(stream=True)`) to a CSV file object, `chunk_size` listings at a time.
+    """
+    writer = csv.writer(file)
+    writer.writerow(COLUMNS)
+    for columns in _iter_chunks(listings, chunk_size):
+        writer.writerows(
+            [_format_csv_value(value) for value in row] for row in columns.rows()
+        )
+
+
+def write_parquet(listings, path, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Writes listings to a Parquet file, as one row group per `chunk_size` listings.
+    """
+    _import_pyarrow()
+    import pyarrow.parquet as pq
+
+    writer = None
+    try:
+        for columns in _iter_chunks(listings, chunk_size):
+            table = columns.to_arrow()
+            if writer is None:
+                writer = pq.ParquetWriter(path, table.schema)
+            writer.write_table(table)
+    finally:
+        if writer is not None:
+            writer.close()
+
+
+def write_arrow(listings, path, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Writes listings to an Arrow IPC file, as one record batch per `chunk_size` listings.
+    """
+    pa = _import_pyarrow()
+
+    writer = None
+    try:
+        for columns in _iter_chunks(listings, chunk_size):
+            table = columns.to_arrow()
+            if writer is None:
+                # categories only ever grow, so each chunk's dictionaries extend the last ones
+                writer = pa.ipc.new_file(
+                    path,
+                    table.schema,
+                    options=pa.ipc.IpcWriteOptions(emit_dictionary_deltas=True),
+                )
+            writer.write_table(table)
+    finally:
+        if writer is not None:
+            writer.close()
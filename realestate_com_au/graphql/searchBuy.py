@@ -1,3 +0,0 @@
-QUERY = """
-query searchByQuery($query:SearchQueryJson!$testListings:Boolean!$nullifyOptionals:Boolean!)@debug(testListings:$testListings nullifyOptionals:$nullifyOptionals){buySearch(query:$query){leadGen{...LeadGenData __typename}marketInsights{...ResultsMarketInsightsData __typename}exclusiveShowcase{...BuyExclusiveShowcaseData __typename}suggestedBuilders{...SuggestedBuildersData __typename}...BuyResultsMetaData resolvedQuery{...SearchMetadata ...ResultsHeading ...SeoFooterLinks ...Preferences ...ResultsLocalities ...SearchResultsBreadcrumb __typename}results{...SearchResultsTotalCount ...ResultsPagination ...ResultsSummary ...ResultsTracking ...ResultsSetHeader ...BuyResultsSet exact{items{listing{...ResidentialDetailsListingCache ...BuyResidentialListingDetailsAboveTheFold ...ProjectDetailsListingCache ...ProjectDetailsAboveTheFold ...PropertyCard __typename}__typename}__typename}surrounding{items{listing{...ResidentialDetailsListingCache ...BuyResidentialListingDetailsAboveTheFold ...ProjectDetailsListingCache ...ProjectDetailsAboveTheFold ...PropertyCard __typename}__typename}__typename}trackingData __typename}__typename}}fragment LeadGenData on LeadGen{actionUrl data{listingCompany{id name branding{primaryColour __typename}media{logo{templatedUrl __typename}__typename}__typename}__typename}__typename}fragment ResultsMarketInsightsData on MarketInsights{title suburbProfileUrl{href __typename}__typename}fragment BuyExclusiveShowcaseData on ExclusiveShowcase{...CommonExclusiveShowcaseData listings{...on BuyResidentialListing{inspections{display{shortLabel __typename}__typename}__typename}__typename}__typename}fragment CommonExclusiveShowcaseData on ExclusiveShowcase{listings{title id listingCompany{id name media{logo{templatedUrl __typename}__typename}branding{primaryColour textColour __typename}__typename}media{mainImage{templatedUrl __typename}images{templatedUrl __typename}__typename}address{suburb display{shortAddress __typename}__typename}listers{name photo{templatedUrl __typename}__typename}_links{trackedCanonical{path __typename}__typename}...PrimaryFeatures __typename}__typename}fragment PrimaryFeatures on ResidentialListing{...GeneralFeatures ...PropertySize __typename}fragment GeneralFeatures on ResidentialListing{generalFeatures{bedrooms{value __typename}bathrooms{value __typename}parkingSpaces{value __typename}__typename}__typename}fragment PropertySize on ResidentialListing{propertySizes{building{displayValue sizeUnit{displayValue __typename}__typename}land{displayValue sizeUnit{displayValue __typename}__typename}preferred{sizeType size{displayValue sizeUnit{displayValue __typename}__typename}__typename}__typename}__typename}fragment SuggestedBuildersData on SuggestedBuilders{callToAction{display url{href __typename}__typename}results{id name _links{canonical{href __typename}__typename}designs{id name price media{mainImage{templatedUrl __typename}__typename}generalFeaturesDisplay{bedrooms bathrooms parkingSpaces __typename}_links{canonical{href __typename}__typename}__typename}__typename}__typename}fragment BuyResultsMetaData on BuyResolvedSearch{resolvedQuery{localities{display __typename}__typename}results{__typename totalResultsCount pagination{moreResultsAvailable __typename}exact{items{listing{__typename ...on BuyResidentialListing{inspections{startTime endTime __typename}auction{dateTime{value __typename}__typename}_links{canonical{href __typename}__typename}__typename}...ResidentialListingAddressMetaData ...ProjectProfileAddressMetaData}__typename}__typename}}__typename}fragment ResidentialListingAddressMetaData on ResidentialListing{address{display{shortAddress fullAddress __typename}suburb state postcode __typename}__typename}fragment ProjectProfileAddressMetaData on ProjectProfile{address{display{shortAddress fullAddress __typename}suburb state postcode __typename}__typename}fragment SearchMetadata on ResolvedQuery{metadata{canonicalSearchId savedSearchQuery __typename}__typename}fragment ResultsHeading on ResolvedQuery{localities{display __typename}__typename}fragment SeoFooterLinks on ResolvedQuery{localities{display atlasId urlValue precision name __typename}__typename}fragment Preferences on ResolvedQuery{localities{state __typename}__typename}fragment ResultsLocalities on ResolvedQuery{localities{display precision __typename}__typename}fragment SearchResultsBreadcrumb on ResolvedQuery{localities{atlasId display name urlValue precision state parents{display name urlValue precision __typename}__typename}__typename}fragment SearchResultsTotalCount on SearchResults{totalResultsCount __typename}fragment ResultsPagination on SearchResults{pagination{maxPageNumberAvailable __typename}__typename}fragment ResultsSummary on SearchResults{totalResultsCount pagination{page pageSize __typename}__typename}fragment ResultsTracking on SearchResults{trackingData __typename}fragment ResultsSetHeader on SearchResults{totalResultsCount __typename}fragment BuyResultsSet on BuySearchResults{exact{items{listing{__typename}__typename}__typename}surrounding{totalCount items{listing{__typename}__typename}__typename}pagination{page __typename}__typename}fragment ResidentialDetailsListingCache on ResidentialListing{...ResidentialListingCache ...on BuyResidentialListing{parent{childListings{results{id __typename}__typename}listingCompany{id __typename}__typename}__typename}__typename}fragment ResidentialListingCache on ResidentialListing{id __typename}fragment BuyResidentialListingDetailsAboveTheFold on BuyResidentialListing{aboveTheFoldId:id id badge{...Badge __typename}...CanonicalLinkResidential ...Breadcrumb_BuyResidentialListing ...BrandingResidential ...BrandingOnContactAgentPanelConfig ...ListingCompanyHeaderBranding ...ParentProjectHeaderBranding ...IsChildListing ...Address ...PrimaryFeatures ...Price ...ResidentialStatementOfInformation ...AuctionsSummary ...InspectionsSummaryForBuy ...Hero ...AgentInfo ...AgencyInfo ...BuilderInfo ...ParentProjectInfo ...HeaderLeaderboard ...ResidentialShareListing ...HomeLoanCalculatorData ...BuyResidentialListingMetaData ...ResidentialContactAgentBranding ...ResidentialContactAgentBrandingForChildListing ...PropertyInfoPosterBoard __typename}fragment Badge on ListingBadge{colour label __typename}fragment CanonicalLinkResidential on ResidentialListing{_links{canonical{path __typename}__typename}__typename}fragment Breadcrumb_BuyResidentialListing on BuyResidentialListing{...Breadcrumb_ResidentialListing parent{name _links{canonical{path __typename}__typename}__typename}__typename}fragment Breadcrumb_ResidentialListing on ResidentialListing{__typename id address{suburb state postcode display{shortAddress __typename}__typename}propertyType{id display __typename}_links{canonical{path __typename}__typename}}fragment BrandingResidential on ResidentialListing{listingCompany{...Branding __typename}__typename}fragment Branding on ListingCompany{id name branding{primaryColour __typename}media{logo{templatedUrl __typename}__typename}__typename}fragment BrandingOnContactAgentPanelConfig on ResidentialListing{viewConfiguration{details{agencyBrandingOnSidePanel __typename}__typename}__typename}fragment ListingCompanyHeaderBranding on ResidentialListing{viewConfiguration{details{branding{header{size __typename}__typename}__typename}__typename}listingCompany{name branding{primaryColour __typename}_links{canonical{href __typename}__typename}media{logo{templatedUrl __typename}__typename}__typename}__typename}fragment ParentProjectHeaderBranding on BuyResidentialListing{viewConfiguration{details{branding{header{size __typename}__typename}__typename}__typename}parent{name branding{primaryColour __typename}media{logo{templatedUrl __typename}__typename}_links{canonical{href __typename}__typename}__typename}__typename}fragment IsChildListing on BuyResidentialListing{parent{id __typename}__typename}fragment Address on ResidentialListing{address{suburb postcode state display{shortAddress __typename}__typename}__typename}fragment Price on ResidentialListing{price{display __typename}__typename}fragment ResidentialStatementOfInformation on ResidentialListing{media{statementOfInformation{href __typename}__typename}__typename}fragment AuctionsSummary on BuyResidentialListing{auction{dateTime{display{shortDate time __typename}__typename}__typename}__typename}fragment InspectionsSummaryForBuy on BuyResidentialListing{inspections{display{longLabel __typename}__typename}__typename}fragment Hero on ResidentialListing{...HeroImage ...ResidentialMediaTypeBar __typename}fragment HeroImage on ResidentialListing{address{display{fullAddress __typename}__typename}viewConfiguration{details{posterBoard __typename}__typename}media{mainImage{templatedUrl __typename}images{templatedUrl __typename}floorplans{templatedUrl __typename}threeDimensionalTours{href __typename}videos{...on YouTubeVideo{id __typename}...on ExternalVideo{href __typename}__typename}__typename}__typename}fragment ResidentialMediaTypeBar on ResidentialListing{media{images{templatedUrl __typename}floorplans{templatedUrl __typename}threeDimensionalTours{href __typename}videos{...on YouTubeVideo{id __typename}...on ExternalVideo{href __typename}__typename}__typename}__typename}fragment AgentInfo on ResidentialListing{listers{name photo{templatedUrl __typename}preferredPhoneNumber _links{canonical{href __typename}__typename}__typename}listingCompany{id businessPhone __typename}__typename}fragment AgencyInfo on ResidentialListing{viewConfiguration{details{agencyInfo __typename}__typename}listingCompany{...on Agency{name __typename address{display{fullAddress __typename}__typename}_links{canonical{href __typename}__typename}}__typename}__typename}fragment BuilderInfo on ResidentialListing{listingCompany{...on Builder{name __typename _links{canonical{templated href __typename}__typename}homeDesigns{totalCount __typename}}__typename}__typename}fragment ParentProjectInfo on BuyResidentialListing{parent{name childListings{totalCount __typename}media{logo{templatedUrl __typename}__typename}_links{canonical{path __typename}__typename}__typename}__typename}fragment HeaderLeaderboard on ResidentialListing{viewConfiguration{details{adverts{headerLeaderboard __typename}__typename}__typename}__typename}fragment ResidentialShareListing on ResidentialListing{_links{canonical{href __typename}__typename}address{display{fullAddress __typename}__typename}__typename}fragment HomeLoanCalculatorData on BuyResidentialListing{id price{display __typename}propertyType{id display __typename}generalFeatures{bedrooms{value __typename}__typename}address{postcode state suburb __typename}viewConfiguration{details{homeLoanCalculator __typename}__typename}__typename}fragment BuyResidentialListingMetaData on BuyResidentialListing{...ResidentialListingMetaData inspections{startTime endTime __typename}auction{dateTime{value __typename}__typename}parent{name _links{canonical{path __typename}__typename}__typename}__typename}fragment ResidentialListingMetaData on ResidentialListing{__typename id description media{mainImage{templatedUrl __typename}images{__typename}__typename}_links{canonical{href path __typename}__typename}propertyType{id display __typename}address{display{shortAddress fullAddress __typename}suburb state postcode __typename}price{display __typename}generalFeatures{bedrooms{value __typename}__typename}propertySizes{land{displayValue sizeUnit{displayValue __typename}__typename}__typename}}fragment ResidentialContactAgentBranding on ResidentialListing{productDepth listingCompany{name branding{primaryColour __typename}media{logo{templatedUrl __typename}__typename}_links{canonical{href __typename}__typename}__typename}__typename}fragment ResidentialContactAgentBrandingForChildListing on BuyResidentialListing{productDepth parent{name branding{primaryColour __typename}media{logo{templatedUrl __typename}__typename}_links{canonical{path __typename}__typename}__typename}__typename}fragment PropertyInfoPosterBoard on ResidentialListing{viewConfiguration{details{posterBoard __typename}__typename}__typename}fragment ProjectDetailsListingCache on ProjectProfile{id __typename}fragment ProjectDetailsAboveTheFold on ProjectProfile{aboveTheFoldId:id id ...CanonicalLinkProject ...DetailsBranding ...ProjectHero ...ProjectOverview ...ProjectShareListing ...ProjectProfileStatementOfInformation childListings{results{...BuyResidentialListingDetailsAboveTheFold __typename}__typename}...ProjectListingPanelListingCompanyInfo ...ProjectListingCompanyPanelBranding ...ProjectProfileRequestInfoKit ...ProjectMetaData ...ProjectProfileBreadcrumb __typename}fragment CanonicalLinkProject on ProjectProfile{_links{canonical{path __typename}__typename}__typename}fragment DetailsBranding on ProjectProfile{name branding{primaryColour __typename}media{logo{templatedUrl __typename}__typename}__typename}fragment ProjectHero on ProjectProfile{...ProjectHeroImage ...ProjectMediaTypeBar __typename}fragment ProjectHeroImage on ProjectProfile{address{display{fullAddress __typename}__typename}media{mainImage{templatedUrl __typename}__typename}__typename}fragment ProjectMediaTypeBar on ProjectProfile{media{images{templatedUrl __typename}videos{...on YouTubeVideo{id __typename}...on ExternalVideo{href __typename}__typename}__typename}__typename}fragment ProjectOverview on ProjectProfile{name address{display{fullAddress __typename}suburb __typename}priceRange{display __typename}...ProjectProfileBookmark __typename}fragment ProjectProfileBookmark on ProjectProfile{id __typename}fragment ProjectShareListing on ProjectProfile{_links{canonical{href __typename}__typename}address{display{fullAddress __typename}__typename}__typename}fragment ProjectProfileStatementOfInformation on ProjectProfile{media{statementOfInformation{href __typename}__typename}__typename}fragment ProjectListingPanelListingCompanyInfo on ProjectProfile{name businessPhone __typename}fragment ProjectListingCompanyPanelBranding on ProjectProfile{name media{logo{templatedUrl __typename}__typename}branding{primaryColour __typename}listingCompany{name branding{primaryColour __typename}media{logo{templatedUrl __typename}__typename}_links{canonical{href __typename}__typename}__typename}__typename}fragment ProjectProfileRequestInfoKit on ProjectProfile{name media{enquiryDocuments(useAgentContactAPI:true){url{href __typename}__typename}__typename}__typename}fragment ProjectMetaData on ProjectProfile{name listingCompany{name __typename}_links{canonical{href path __typename}__typename}priceRange{display __typename}propertyType{id display __typename}address{suburb state postcode display{shortAddress __typename}__typename}displayLocation{nextAvailableOpeningHours{groupedByDay{times{startTime endTime __typename}__typename}__typename}__typename}media{images{templatedUrl __typename}mainImage{templatedUrl __typename}__typename}__typename}fragment ProjectProfileBreadcrumb on ProjectProfile{name address{suburb state postcode __typename}propertyType{id __typename}_links{canonical{path __typename}__typename}__typename}fragment PropertyCard on Listing{__typename ...ResidentialPropertyCard ...ProjectProfile}fragment ResidentialPropertyCard on ResidentialListing{...PropertyCardLayout ...BrandingOnSearchResultsConfig ...BrandingResidential badge{...Badge __typename}...ResidentialListingCardHero ...Price ...ResidentialListingCardAddress ...PropertyCardPropertyType ...PropertyCardDetailsLink ...PropertyCardAgentInfo ...ResidentialLaunchButtons ...ResidentialMediaViewerForResults ...ResidentialListingBookmark ...PrimaryFeatures ...PropertySize ...ResidentialListingCardInspection ...InspectionAuction ...DateSold ...ResidentialListingMoreButton ...ResidentialShareListing __typename}fragment PropertyCardLayout on ResidentialListing{productDepth __typename}fragment BrandingOnSearchResultsConfig on ResidentialListing{viewConfiguration{searchResults{agencyBranding __typename}__typename}productDepth __typename}fragment ResidentialListingCardHero on ResidentialListing{...PowerProfileSlide productDepth address{display{fullAddress __typename}__typename}media{mainImage{templatedUrl __typename}images{templatedUrl __typename}floorplans{templatedUrl __typename}__typename}__typename}fragment PowerProfileSlide on ResidentialListing{media{mainImage{templatedUrl __typename}__typename}_links{canonical{path __typename}__typename}listingCompany{name media{logo{templatedUrl __typename}__typename}branding{primaryColour __typename}_links{canonical{href __typename}__typename}__typename}listers{id agentId name jobTitle photo{templatedUrl __typename}_links{canonical{href __typename}__typename}showInMediaViewer __typename}__typename}fragment ResidentialListingCardAddress on ResidentialListing{address{suburb display{shortAddress __typename}__typename}__typename}fragment PropertyCardPropertyType on ResidentialListing{propertyType{display __typename}__typename}fragment PropertyCardDetailsLink on ResidentialListing{_links{canonical{path __typename}__typename}__typename}fragment PropertyCardAgentInfo on ResidentialListing{viewConfiguration{searchResults{agentPhoto agentName __typename}__typename}listers{name photo{templatedUrl __typename}__typename}listingCompany{branding{textColour __typename}__typename}__typename}fragment ResidentialLaunchButtons on ResidentialListing{media{threeDimensionalTours{href __typename}videos{...on YouTubeVideo{id __typename}...on ExternalVideo{href __typename}__typename}__typename}__typename}fragment ResidentialMediaViewerForResults on ResidentialListing{...ResultsAdConfiguration ...ResidentialSlides __typename}fragment ResultsAdConfiguration on ResidentialListing{viewConfiguration{searchResults{adverts{photoGallery __typename}__typename}__typename}__typename}fragment ResidentialSlides on ResidentialListing{...PowerProfileSlide ...MediaViewerEventTracking ...ThreeDimensionalTourSlide ...VideoSlide ...PhotoOverlayWithGallerySlide media{images{templatedUrl __typename}floorplans{templatedUrl __typename}__typename}__typename}fragment MediaViewerEventTracking on ResidentialListing{listers{id agentId __typename}__typename}fragment ThreeDimensionalTourSlide on ResidentialListing{media{threeDimensionalTours{href __typename}__typename}__typename}fragment VideoSlide on ResidentialListing{media{videos{...on YouTubeVideo{__typename id}__typename}__typename}__typename}fragment PhotoOverlayWithGallerySlide on ResidentialListing{...BuilderProfile ...ParentAndSiblings __typename}fragment BuilderProfile on ResidentialListing{media{mainImage{templatedUrl __typename}__typename}listingCompany{...on Builder{name _links{canonical{templated href __typename}__typename}homeDesigns{totalCount designs{name price houseSizeRange{min{displayValue value __typename}max{displayValue value __typename}__typename}generalFeaturesDisplay{bedrooms bathrooms parkingSpaces __typename}_links{canonical{href templated __typename}__typename}media{mainImage{templatedUrl __typename}__typename}__typename}__typename}__typename}__typename}__typename}fragment ParentAndSiblings on BuyResidentialListing{id media{mainImage{templatedUrl __typename}__typename}parent{name _links{canonical{path __typename}__typename}childListings{totalCount results{id media{mainImage{templatedUrl __typename}__typename}title price{display __typename}propertyType{display __typename}_links{canonical{path __typename}__typename}propertySizes{land{displayValue sizeUnit{id displayValue __typename}__typename}__typename}...PrimaryFeatures __typename}__typename}__typename}__typename}fragment ResidentialListingBookmark on ResidentialListing{id __typename}fragment ResidentialListingCardInspection on ResidentialListing{...on BuyResidentialListing{inspections{display{shortLabel longLabel __typename}__typename}__typename}...on RentResidentialListing{inspections{display{shortLabel longLabel __typename}__typename}__typename}__typename}fragment InspectionAuction on ResidentialListing{...PropertyCardAuctionDate ...ResidentialListingCardInspection __typename}fragment PropertyCardAuctionDate on BuyResidentialListing{auction{dateTime{display{shortDate __typename}__typename}__typename}__typename}fragment DateSold on ResidentialListing{...on SoldResidentialListing{dateSold{display __typename}__typename}__typename}fragment ResidentialListingMoreButton on ResidentialListing{id __typename}fragment ProjectProfile on ProjectProfile{badge{...Badge __typename}...ProjectProfileCardParentListing ...ProjectProfileCardAddress ...ProjectProfileCardHero ...ProjectProfileAgency ...ProjectProfileBranding ...ProjectProfileBookmark ...PropertyCardChildListings ...ProjectLaunchButtons ...ProjectProfileNextOpenTime __typename}fragment ProjectProfileCardParentListing on ProjectProfile{name title productDepth _links{canonical{path __typename}__typename}__typename}fragment ProjectProfileCardAddress on ProjectProfile{address{suburb display{shortAddress __typename}__typename}__typename}fragment ProjectProfileCardHero on ProjectProfile{productDepth address{display{fullAddress __typename}__typename}media{mainImage{templatedUrl __typename}images{templatedUrl __typename}__typename}__typename}fragment ProjectProfileAgency on ProjectProfile{listingCompany{id name media{logo{templatedUrl __typename}__typename}__typename}viewConfiguration{searchResults{agencyBranding __typename}__typename}__typename}fragment ProjectProfileBranding on ProjectProfile{name productDepth media{logo{templatedUrl __typename}__typename}branding{primaryColour __typename}__typename}fragment PropertyCardChildListings on ProjectProfile{productDepth _links{canonical{path __typename}__typename}childListings{totalCount results{id price{display __typename}media{mainImage{templatedUrl __typename}__typename}address{display{fullAddress __typename}__typename}title _links{canonical{path __typename}__typename}...PrimaryFeatures __typename}__typename}__typename}fragment ProjectLaunchButtons on ProjectProfile{media{videos{...on YouTubeVideo{id __typename}...on ExternalVideo{href __typename}__typename}__typename}__typename}fragment ProjectProfileNextOpenTime on ProjectProfile{displayLocation{nextAvailableOpeningHours{nextAvailable{display{shortLabel longLabel __typename}__typename}__typename}__typename}__typename}
-"""
@@ -0,0 +1,108 @@
+"""
+Builds minimal search query documents, selecting only the fields that get_listing reads
+"""
+from functools import lru_cache
+
+OPERATION_DEFINITIONS = {
+    "buy": "query searchByQuery($query:SearchQueryJson!$testListings:Boolean!$nullifyOptionals:Boolean!)@debug(testListings:$testListings nullifyOptionals:$nullifyOptionals){buySearch(query:$query)",
+    "rent": "query searchByQuery($query:SearchQueryJson!$recentHides:[ListingId!]){rentSearch(query:$query recentHides:$recentHides)",
+    "sold": "query searchByQuery($query:SearchQueryJson!$testListings:Boolean!)@debug(testListings:$testListings){soldSearch(query:$query)",
+}
+
+LISTING_TYPES = {
+    "buy": "BuyResidentialListing",
+    "rent": "RentResidentialListing",
+    "sold": "SoldResidentialListing",
+}
+
+RESIDENTIAL_LISTING_FIELDS = "id badge{label}_links{canonical{href}}address{suburb state postcode display{shortAddress fullAddress}}propertyType{id}listingCompany{id name businessPhone}generalFeatures{bedrooms{value}bathrooms{value}parkingSpaces{value}}propertySizes{building{displayValue sizeUnit{displayValue}}land{displayValue sizeUnit{displayValue}}}price{display}"
+
+CHANNEL_LISTING_FIELDS = {
+    "buy": "auction{dateTime{value}}",
+    "rent": "availableDate{display}",
+    "sold": "dateSold{display}",
+}
+
+PROJECT_PROFILE_FIELDS = "id badge{label}_links{canonical{href}}address{suburb state postcode display{shortAddress fullAddress}}propertyType{id}listingCompany{id name}"
+
+# Optional groups of fields, which can be left out of a search when they aren't wanted
+OPTIONAL_FIELDS = ("description", "media", "listers", "inspections")
+
+OPTIONAL_RESIDENTIAL_LISTING_FIELDS = {
+    "description": "description",
+    "media": "media{images{templatedUrl}floorplans{templatedUrl}}",
+}
+
+LISTER_FIELDS = "id name agentId jobTitle _links{canonical{href}}"
+
+# sold listers have a phoneNumber object rather than preferredPhoneNumber, as in the website's documents
+OPTIONAL_CHANNEL_LISTING_FIELDS = {
+    "listers": {
+        "buy": f"listers{{{LISTER_FIELDS} preferredPhoneNumber}}",
+        "rent": f"listers{{{LISTER_FIELDS} preferredPhoneNumber}}",
+        "sold": f"listers{{{LISTER_FIELDS} phoneNumber{{display}}}}",
+    },
+    "inspections": {
+        "buy": "inspections{startTime endTime display{shortLabel longLabel}}",
+        "rent": "inspections{startTime endTime display{shortLabel longLabel}}",
+    },
+}
+
+OPTIONAL_PROJECT_PROFILE_FIELDS = {
+    "media": "media{images{templatedUrl}}",
+}
+
+RESULTS_FIELDS = "totalResultsCount pagination{page pageSize moreResultsAvailable maxPageNumberAvailable}"
+
+
+@lru_cache(maxsize=None)
+def _get_search_query(channel, fields):
+    residential_listing_fields = [RESIDENTIAL_LISTING_FIELDS] + [
+        OPTIONAL_RESIDENTIAL_LISTING_FIELDS[name]
+        for name in fields
+        if name in OPTIONAL_RESIDENTIAL_LISTING_FIELDS
+    ]
+    channel_listing_fields = [CHANNEL_LISTING_FIELDS[channel]] + [
+        OPTIONAL_CHANNEL_LISTING_FIELDS[name][channel]
+        for name in fields
+        if channel in OPTIONAL_CHANNEL_LISTING_FIELDS.get(name, {})
+    ]
+    project_profile_fields = [PROJECT_PROFILE_FIELDS] + [
+        OPTIONAL_PROJECT_PROFILE_FIELDS[name]
+        for name in fields
+        if name in OPTIONAL_PROJECT_PROFILE_FIELDS
+    ]
+
+    return (
+        OPERATION_DEFINITIONS[channel]
+        + "{results{"
+        + RESULTS_FIELDS
+        + " exact{items{listing{...SearchListing}}}"
+        + "surrounding{items{listing{...SearchListing}}}"
+        + "}}}"
+        + "fragment SearchListing on Listing{"
+        + f"...on ResidentialListing{{{' '.join(residential_listing_fields)}}}"
+        + f"...on {LISTING_TYPES[channel]}{{{' '.join(channel_listing_fields)}}}"
+        + f"...on ProjectProfile{{{' '.join(project_profile_fields)}}}"
+        + "}"
+    )
+
+
+def get_search_query(channel, fields=None):
+    """
+    Returns a search query document for a channel ("buy", "rent" or "sold").
+
+    `fields` is the collection of OPTIONAL_FIELDS to select; all of them are
+    selected by default. Fields that are left out are None or empty on the
+    listings returned.
+    """
+    if fields is None:
+        fields = OPTIONAL_FIELDS
+
+    unknown_fields = set(fields) - set(OPTIONAL_FIELDS)
+    if unknown_fields:
+        raise ValueError(f"Unknown fields: {', '.join(sorted(unknown_fields))}")
+
+    return _get_search_query(
+        channel, tuple(name for name in OPTIONAL_FIELDS if name in fields)
+    )
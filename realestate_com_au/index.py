@@ -0,0 +1,244 @@
+"""
+Provides an in-memory index for querying crawled listings
+"""
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
+from itertools import chain
+
+HASH_FIELDS = {
+    "suburbs": "suburb",
+    "postcodes": "postcode",
+    "property_types": "property_type",
+    "listing_company_ids": "listing_company_id",
+}
+SORTED_FIELDS = ("price", "bedrooms", "land_size")
+
+
+def _get_sorted_value(listing, name):
+    value = getattr(listing, name)
+    # land_size is -1 when a listing doesn't have one
+    if value is None or (name == "land_size" and value < 0):
+        return None
+    return value
+
+
+def _in_range(value, minimum, maximum):
+    if value is None:
+        return False
+    return (minimum <= 0 or value >= minimum) and (maximum <= -1 or value <= maximum)
+
+
+class _SortedIndex(object):
+    """
+    Listing ids sorted by (value, listing_id), so both a value range and a single
+    entry can be found by bisection.
+    """
+
+    def __init__(self):
+        self.values = []
+        self.ids = []
+
+    def _find(self, value, listing_id):
+        start = bisect_left(self.values, value)
+        end = bisect_right(self.values, value, start)
+        return bisect_left(self.ids, listing_id, start, end)
+
+    def add(self, value, listing_id):
+        index = self._find(value, listing_id)
+        self.values.insert(index, value)
+        self.ids.insert(index, listing_id)
+
+    def update(self, entries):
+        """
+        Adds a batch of (value, listing_id) entries, with one sort rather than an insert each.
+        """
+        entries = sorted(entries)
+        if not entries:
+            return
+        if self.values:
+            # the existing entries are already a sorted run, so this is a merge
+            entries = sorted(chain(zip(self.values, self.ids), entries))
+        self.values = [value for value, _ in entries]
+        self.ids = [listing_id for _, listing_id in entries]
+
+    def remove(self, value, listing_id):
+        index = self._find(value, listing_id)
+        del self.values[index]
+        del self.ids[index]
+
+    def find_range(self, minimum=None, maximum=None):
+        """
+        Returns the start and end positions of the ids with values between minimum and maximum.
+        """
+        start = 0 if minimum is None else bisect_left(self.values, minimum)
+        end = len(self.values) if maximum is None else bisect_right(self.values, maximum)
+        return start, max(start, end)
+
+
+class ListingIndex(object):
+    """
+    Indexes listings by id, with hash indexes on suburb, postcode, property type and
+    agency, and sorted indexes on price, bedrooms and land size.
+    """
+
+    def __init__(self, listings=[]):
+        self._listings = {}
+        self._hash_indexes = {name: defaultdict(set) for name in HASH_FIELDS.values()}
+        self._sorted_indexes = {name: _SortedIndex() for name in SORTED_FIELDS}
+        self.update(listings)
+
+    def __len__(self):
+        return len(self._listings)
+
+    def __iter__(self):
+        return iter(self._listings.values())
+
+    def __contains__(self, listing_id):
+        return listing_id in self._listings
+
+    def get(self, listing_id):
+        return self._listings.get(listing_id)
+
+    def add(self, listing):
+        """
+        Adds a listing, replacing any listing already indexed with the same id.
+        """
+        self._add(listing)
+        for name, index in self._sorted_indexes.items():
+            value = _get_sorted_value(listing, name)
+            if value is not None:
+                index.add(value, listing.id)
+
+    def update(self, listings):
+        """
+        Adds listings, replacing any listings already indexed with the same ids.
+        """
+        # the last of several listings with the same id wins, as with add
+        listings = {listing.id: listing for listing in listings}
+        entries = {name: [] for name in self._sorted_indexes}
+        for listing in listings.values():
+            self._add(listing)
+            for name in entries:
+                value = _get_sorted_value(listing, name)
+                if value is not None:
+                    entries[name].append((value, listing.id))
+
+        for name, index in self._sorted_indexes.items():
+            index.update(entries[name])
+
+    def _add(self, listing):
+        if listing.id in self._listings:
+            self.remove(listing.id)
+
+        self._listings[listing.id] = listing
+        for name, index in self._hash_indexes.items():
+            index[getattr(listing, name)].add(listing.id)
+
+    def remove(self, listing_id):
+        listing = self._listings.pop(listing_id)
+        for name, index in self._hash_indexes.items():
+            ids = index[getattr(listing, name)]
+            ids.discard(listing_id)
+            if not ids:
+                del index[getattr(listing, name)]
+        for name, index in self._sorted_indexes.items():
+            value = _get_sorted_value(listing, name)
+            if value is not None:
+                index.remove(value, listing_id)
+        return listing
+
+    def find(
+        self,
+        suburbs=[],
+        postcodes=[],
+        property_types=[],
+        listing_company_ids=[],
+        min_price=0,
+        max_price=-1,
+        min_bedrooms=0,
+        max_bedrooms=-1,
+        min_land_size=0,
+        max_land_size=-1,
+        min_bathrooms=0,
+        min_carspaces=0,
+    ):
+        """
+        Returns the listings matching all the given filters, in no particular order.
+
+        Filters follow `RealestateComAu.search`: a maximum of -1 means no maximum,
+        and a listing without a value for a range that is filtered on doesn't match.
+        """
+        # each filter is (number of matches, function returning the matching ids, function checking a listing)
+        filters = []
+
+        for argument, values in [
+            ("suburbs", suburbs),
+            ("postcodes", postcodes),
+            ("property_types", property_types),
+            ("listing_company_ids", listing_company_ids),
+        ]:
+            if values:
+                name = HASH_FIELDS[argument]
+                index = self._hash_indexes[name]
+                values = set(values)
+                filters.append(
+                    (
+                        sum(len(index.get(value, ())) for value in values),
+                        lambda index=index, values=values: set().union(
+                            *(index.get(value, ()) for value in values)
+                        ),
+                        lambda listing, name=name, values=values: getattr(listing, name)
+                        in values,
+                    )
+                )
+
+        for name, minimum, maximum in [
+            ("price", min_price, max_price),
+            ("bedrooms", min_bedrooms, max_bedrooms),
+            ("land_size", min_land_size, max_land_size),
+        ]:
+            if minimum > 0 or maximum > -1:
+                index = self._sorted_indexes[name]
+                start, end = index.find_range(
+                    minimum if minimum > 0 else None,
+                    maximum if maximum > -1 else None,
+                )
+                filters.append(
+                    (
+                        end - start,
+                        lambda index=index, start=start, end=end: index.ids[start:end],
+                        lambda listing, name=name, minimum=minimum, maximum=maximum: _in_range(
+                            _get_sorted_value(listing, name), minimum, maximum
+                        ),
+                    )
+                )
+
+        if filters:
+            # only the most selective filter's matches are looked up, the rest are checked on them
+            filters.sort(key=lambda listing_filter: listing_filter[0])
+            _, get_ids, _ = filters[0]
+            checks = [check for _, _, check in filters[1:]]
+            listings = [
+                listing
+                for listing in map(self._listings.__getitem__, get_ids())
+                if all(check(listing) for check in checks)
+            ]
+        else:
+            listings = list(self._listings.values())
+
+        # bathrooms and carspaces aren't indexed, so are filtered on what's left
+        if min_bathrooms > 0:
+            listings = [
+                listing
+                for listing in listings
+                if listing.bathrooms is not None and listing.bathrooms >= min_bathrooms
+            ]
+        if min_carspaces > 0:
+            listings = [
+                listing
+                for listing in listings
+                if listing.parking_spaces is not None
+                and listing.parking_spaces >= min_carspaces
+            ]
+
+        return listings
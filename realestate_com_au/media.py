@@ -0,0 +1,253 @@
+"""
+Provides batch downloads of listing images and floorplans into a content-addressed cache
+"""
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+import hashlib
+import logging
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+
+from realestate_com_au.objects.listing import IMAGE_SIZE
+from realestate_com_au.transport import Transport
+from realestate_com_au.utils.size_limit import SizeLimit
+
+logger = logging.getLogger(__name__)
+
+SIZES = {
+    "thumbnail": "340x255-format=webp",  # TODO untested, which sizes the image server accepts
+    "full": IMAGE_SIZE,
+}
+DEFAULT_MAX_SIZE = 1024 * 1024 * 1024
+DEFAULT_WORKERS = 8
+DEFAULT_FLUSH_EVERY = 1000
+
+
+def get_media_url(media_item, size="full", sizes=SIZES):
+    """
+    Returns the link of an image or floorplan at another size, e.g. "thumbnail",
+    or a size template such as "800x600-format=webp".
+    """
+    if not media_item.link:
+        return None
+    return media_item.link.replace(IMAGE_SIZE, sizes.get(size, size))
+
+
+class MediaCache(object):
+    """
+    On-disk cache of media files, stored by the hash of their content so identical files
+    (e.g. the same photo at two urls) are only stored once.
+
+    A SQLite index maps each url to the hash of the file it was downloaded as, so a url
+    that has been downloaded before is never downloaded again. The least recently used
+    files are evicted once they exceed `max_size` bytes.
+
+    Access times recorded by `get` are written in batches, on the next `put`, once
+    `flush_every` have built up, or on `close`, rather than committed on every hit.
+    """
+
+    def __init__(self, directory, max_size=DEFAULT_MAX_SIZE, flush_every=DEFAULT_FLUSH_EVERY):
+        self.directory = directory
+        self.flush_every = flush_every
+        os.makedirs(os.path.join(directory, "objects"), exist_ok=True)
+        self._lock = threading.Lock()
+        self._accessed_at = {}  # access times not yet written, by digest
+        self._connection = sqlite3.connect(
+            os.path.join(directory, "index.sqlite"), check_same_thread=False
+        )
+        self._connection.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS urls (
+                url TEXT PRIMARY KEY,
+                digest TEXT NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS urls_digest ON urls (digest);
+            CREATE TABLE IF NOT EXISTS objects (
+                digest TEXT PRIMARY KEY,
+                size INTEGER NOT NULL,
+                accessed_at REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS objects_accessed_at ON objects (accessed_at);
+            """
+        )
+        self._size_limit = SizeLimit(self._connection, "objects", "digest", max_size)
+        self._connection.commit()
+
+    @property
+    def max_size(self):
+        return self._size_limit.max_size
+
+    @max_size.setter
+    def max_size(self, max_size):
+        self._size_limit.max_size = max_size
+
+    def _get_object_path(self, digest):
+        return os.path.join(self.directory, "objects", digest[:2], digest)
+
+    def get(self, url):
+        """
+        Returns the path of the file downloaded from a url, or None if it isn't cached.
+        """
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT digest FROM urls WHERE url = ?", (url,)
+            ).fetchone()
+            if row is None:
+                return None
+
+            path = self._get_object_path(row[0])
+            if not os.path.exists(path):
+                self._connection.execute("DELETE FROM urls WHERE url = ?", (url,))
+                self._connection.commit()
+                return None
+
+            self._accessed_at[row[0]] = time.time()
+            if len(self._accessed_at) >= self.flush_every:
+                self._write_accessed_at()
+                self._connection.commit()
+        return path
+
+    def __contains__(self, url):
+        return self.get(url) is not None
+
+    def put(self, url, content):
+        """
+        Stores the content downloaded from a url, and returns its path.
+        """
+        digest = hashlib.sha256(content).hexdigest()
+        path = self._get_object_path(digest)
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                f.write(content)
+            os.replace(temp_path, path)
+
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO urls VALUES (?, ?)", (url, digest)
+            )
+            inserted = self._connection.execute(
+                "INSERT OR IGNORE INTO objects VALUES (?, ?, ?)",
+                (digest, len(content), time.time()),
+            ).rowcount
+            if inserted:
+                self._size_limit.add(len(content))
+            else:
+                self._accessed_at[digest] = time.time()
+            # eviction goes by access time, so it has to see the latest ones
+            self._write_accessed_at()
+            self._evict()
+            self._connection.commit()
+        return path
+
+    def flush(self):
+        """
+        Writes the access times recorded by `get` since the last flush.
+        """
+        with self._lock:
+            self._write_accessed_at()
+            self._connection.commit()
+
+    def close(self):
+        self.flush()
+        self._connection.close()
+
+    def _write_accessed_at(self):
+        if self._accessed_at:
+            self._connection.executemany(
+                "UPDATE objects SET accessed_at = ? WHERE digest = ?",
+                [(accessed_at, digest) for digest, accessed_at in self._accessed_at.items()],
+            )
+            self._accessed_at.clear()
+
+    def _evict(self):
+        evicted_digests = self._size_limit.evict()
+        for digest in evicted_digests:
+            try:
+                os.remove(self._get_object_path(digest))
+            except FileNotFoundError:
+                pass
+        self._connection.executemany(
+            "DELETE FROM urls WHERE digest = ?", [(digest,) for digest in evicted_digests]
+        )
+
+
+class MediaPrefetcher(object):
+    """
+    Downloads the images and floorplans of listings into a `MediaCache`, `workers` at a time,
+    over a pooled keep-alive session.
+    """
+
+    def __init__(self, cache, transport=None, workers=DEFAULT_WORKERS, sizes=SIZES):
+        self.cache = cache
+        self.workers = workers
+        self.sizes = sizes
+        self._transport = (
+            transport if transport is not None else Transport(pool_size=workers)
+        )
+
+    def get_urls(self, listings, size="full", images=True, floorplans=True):
+        """
+        Returns the urls of the listings' media at a size, without duplicates, in order.
+        """
+        urls = {}
+        for listing in listings:
+            media_items = (listing.images if images else []) + (
+                listing.images_floorplans if floorplans else []
+            )
+            for media_item in media_items:
+                url = get_media_url(media_item, size, self.sizes)
+                if url:
+                    urls[url] = None
+        return list(urls)
+
+    def _download(self, url):
+        try:
+            res = self._transport.session.get(url)
+        except self._transport.connection_errors as e:
+            logger.warning("Error downloading %s: %s", url, e)
+            return None
+        if res.status_code != 200:
+            logger.warning("Error downloading %s: status %s", url, res.status_code)
+            return None
+        return self.cache.put(url, res.content)
+
+    def prefetch(self, listings, size="full", images=True, floorplans=True):
+        """
+        Downloads the listings' media that isn't already cached, and returns
+        the paths of all their media that is, by url.
+
+        `listings` can be a stream (e.g. from `search(stream=True)`): downloads
+        start as soon as listings arrive, with at most `workers` in flight.
+        """
+        paths = {}
+        requested_urls = set()
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            pending = deque()
+
+            def collect(url, future):
+                path = future.result()
+                if path is not None:
+                    paths[url] = path
+
+            for listing in listings:
+                for url in self.get_urls([listing], size, images, floorplans):
+                    if url in requested_urls:
+                        continue
+                    requested_urls.add(url)
+
+                    path = self.cache.get(url)
+                    if path is not None:
+                        paths[url] = path
+                        continue
+
+                    pending.append((url, executor.submit(self._download, url)))
+                    if len(pending) >= self.workers:
+                        collect(*pending.popleft())
+            while pending:
+                collect(*pending.popleft())
+        return paths
@@ -0,0 +1,125 @@
+"""
+Provides timings and counters of a client's requests and the stages of its searches
+"""
+from collections import defaultdict
+from contextlib import contextmanager, nullcontext
+import threading
+import time
+
+_NO_TIMER = nullcontext()
+
+
+class _Timing(object):
+    __slots__ = ("count", "total", "max")
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+
+class Metrics(object):
+    """
+    Records how long each stage of a search takes, and counts requests, retries,
+    bytes received, pages and listings.
+
+    Stages are `throttle` (waiting for the rate limiter, or Fajita's random sleeps),
+    `request` (each attempt, from sending to receiving the whole response),
+    `decode` (JSON decoding), `filter` (exclude_keywords) and `parse` (get_listing).
+
+    Every observation is also passed to each hook as `hook(name, value)`, where value
+    is a duration in seconds for stages and an increment for counters.
+    """
+
+    def __init__(self, hooks=[]):
+        self.hooks = list(hooks)
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.timings = defaultdict(_Timing)
+            self.counters = defaultdict(int)
+            self.started_at = time.monotonic()
+
+    def add_hook(self, hook):
+        self.hooks.append(hook)
+
+    def observe(self, stage, seconds):
+        with self._lock:
+            timing = self.timings[stage]
+            timing.count += 1
+            timing.total += seconds
+            timing.max = max(timing.max, seconds)
+        for hook in self.hooks:
+            hook(stage, seconds)
+
+    def increment(self, name, value=1):
+        with self._lock:
+            self.counters[name] += value
+        for hook in self.hooks:
+            hook(name, value)
+
+    @contextmanager
+    def time(self, stage):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(stage, time.perf_counter() - start)
+
+    def summary(self):
+        """
+        Returns the timings of each stage, the counters, and each counter's rate per second.
+        """
+        with self._lock:
+            elapsed = time.monotonic() - self.started_at
+            return {
+                "elapsed": elapsed,
+                "stages": {
+                    stage: {
+                        "count": timing.count,
+                        "total": timing.total,
+                        "mean": timing.total / timing.count,
+                        "max": timing.max,
+                    }
+                    for stage, timing in self.timings.items()
+                },
+                "counters": dict(self.counters),
+                "rates": {
+                    name: value / elapsed if elapsed else 0.0
+                    for name, value in self.counters.items()
+                },
+            }
+
+    def to_prometheus(self, prefix="realestate_com_au"):
+        """
+        Returns the metrics in the Prometheus text exposition format.
+        """
+        lines = []
+        with self._lock:
+            if self.timings:
+                lines += [
+                    f"# HELP {prefix}_stage_seconds Time spent in each stage of a search.",
+                    f"# TYPE {prefix}_stage_seconds summary",
+                ]
+                for stage, timing in sorted(self.timings.items()):
+                    lines += [
+                        f'{prefix}_stage_seconds_sum{{stage="{stage}"}} {timing.total!r}',
+                        f'{prefix}_stage_seconds_count{{stage="{stage}"}} {timing.count}',
+                    ]
+            for name, value in sorted(self.counters.items()):
+                lines += [
+                    f"# TYPE {prefix}_{name}_total counter",
+                    f"{prefix}_{name}_total {value}",
+                ]
+        return "\n".join(lines) + "\n"
+
+
+def timer(metrics, stage):
+    """
+    Returns a context manager timing a stage, which does nothing if metrics are disabled (None).
+    """
+    if metrics is None:
+        return _NO_TIMER
+    return metrics.time(stage)
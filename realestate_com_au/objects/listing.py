@@ -1,9 +1,46 @@
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
+from functools import partial
 import re
-from realestate_com_au.utils import delete_nulls
+import sys
 
 
-@dataclass
+def _getstate(self):
+    return [getattr(self, f.name) for f in fields(self)]
+
+
+def _setstate(self, state):
+    for f, value in zip(fields(self), state):
+        # frozen dataclasses can't use setattr
+        object.__setattr__(self, f.name, value)
+
+
+def _add_slots(cls):
+    """
+    Returns a copy of a dataclass with __slots__, as dataclass(slots=True) does from Python 3.10.
+    """
+    field_names = tuple(f.name for f in fields(cls))
+    cls_dict = dict(cls.__dict__)
+    cls_dict["__slots__"] = field_names
+    for name in field_names + ("__dict__", "__weakref__"):
+        # the fields' defaults are already in __init__, and would clash with the slots
+        cls_dict.pop(name, None)
+    cls_dict["__getstate__"] = _getstate
+    cls_dict["__setstate__"] = _setstate
+    return type(cls)(cls.__name__, cls.__bases__, cls_dict)
+
+
+def slots_dataclass(cls=None, **kwargs):
+    """
+    dataclass with __slots__, which keep the many small objects from a large search compact.
+    """
+    if cls is None:
+        return partial(slots_dataclass, **kwargs)
+    if sys.version_info >= (3, 10):
+        return dataclass(cls, slots=True, **kwargs)
+    return _add_slots(dataclass(cls, **kwargs))
+
+
+@slots_dataclass
 class Listing:
     id: str
     badge: str                                              #Captures Promotional text not held elsewhere, such as 'Under Contract'
@@ -36,7 +73,7 @@ class Listing:
     inspections: list = field(default_factory=list)         # Captures inspections
 
 
-@dataclass
+@slots_dataclass
 class Lister:
     id: str
     name: str
@@ -46,17 +83,23 @@ class Lister:
     phone: str
     email: str
 
-@dataclass
+@slots_dataclass
 class MediaItem:
     link: str
 
-@dataclass
+@slots_dataclass
 class Inspection:
     start_time: str
     end_time: str
     label: str
     label_short: str
 
+def intern_text(text):
+    """Shares one copy of strings that repeat across many listings, such as suburbs and agency names"""
+    if not isinstance(text, str):
+        return text
+    return sys.intern(text)
+
 def parse_availability(availability):
     if not availability:
         return None
@@ -98,117 +141,110 @@ def parse_description(description):
     # return description.replace("<br/>", "\n")
     return description
 
+def get_path(*keys):
+    """
+    Returns a function that looks up a path of keys in nested dicts, without copying them.
+    Returns None if any part of the path is missing or null.
+    """
+    def get(obj):
+        for key in keys:
+            if not obj:
+                return None
+            obj = obj.get(key)
+        return obj
+    return get
+
+get_canonical_url = get_path("_links", "canonical", "href")
+get_display_label = get_path("display", "longLabel")
+get_display_short_label = get_path("display", "shortLabel")
+get_badge = get_path("badge", "label")
+get_suburb = get_path("address", "suburb")
+get_state = get_path("address", "state")
+get_postcode = get_path("address", "postcode")
+get_short_address = get_path("address", "display", "shortAddress")
+get_full_address = get_path("address", "display", "fullAddress")
+get_property_type = get_path("propertyType", "id")
+get_bedrooms = get_path("generalFeatures", "bedrooms", "value")
+get_bathrooms = get_path("generalFeatures", "bathrooms", "value")
+get_parking_spaces = get_path("generalFeatures", "parkingSpaces", "value")
+get_building_size = get_path("propertySizes", "building", "displayValue")
+get_building_size_unit = get_path("propertySizes", "building", "sizeUnit", "displayValue")
+get_land_size = get_path("propertySizes", "land", "displayValue")
+get_land_size_unit = get_path("propertySizes", "land", "sizeUnit", "displayValue")
+get_price_text = get_path("price", "display")
+get_sold_date = get_path("dateSold", "display")
+get_auction_date = get_path("auction", "dateTime", "value")
+get_available_date = get_path("availableDate", "display")
+get_images = get_path("media", "images")
+get_floorplans = get_path("media", "floorplans")
+get_sold_lister_phone = get_path("phoneNumber", "display")
+
 def get_lister(lister):
-    lister = delete_nulls(lister)
-    lister_id = lister.get("id")
-    name = lister.get("name")
-    agent_id = lister.get("agentId")
-    job_title = lister.get("jobTitle")
-    url = lister.get("_links", {}).get("canonical", {}).get("href")
-    phone = parse_phone(lister.get("preferredPhoneNumber"))
-    email = lister.get("email")  # TODO untested, need to confirm
     return Lister(
-        id=lister_id,
-        name=name,
-        agent_id=agent_id,
-        job_title=job_title,
-        url=url,
-        phone=phone,
-        email=email,
+        id=lister.get("id"),
+        name=intern_text(lister.get("name")),
+        agent_id=lister.get("agentId"),
+        job_title=intern_text(lister.get("jobTitle")),
+        url=get_canonical_url(lister),
+        phone=parse_phone(lister.get("preferredPhoneNumber") or get_sold_lister_phone(lister)),
+        email=lister.get("email"),  # TODO untested, need to confirm
     )
 
+IMAGE_SIZE = '1144x888-format=webp'
+
 def get_image(media):
     """Creates an object representing an image from the listing. Replaces the {size} parameter with a known working varaible"""
-    size_to_insert_into_link = '1144x888-format=webp'
+    templated_url = media.get('templatedUrl')
     return MediaItem(
-        link=media.get('templatedUrl',{}).replace("{size}", size_to_insert_into_link)
+        link=templated_url.replace("{size}", IMAGE_SIZE) if templated_url else None
     )
 
 def get_inspection(inspection):
-    inspection = delete_nulls(inspection)
-    start_time = inspection.get("startTime")
-    end_time = inspection.get("endTime")
-    label = inspection.get("display", []).get("longLabel")
-    label_short = inspection.get("display", []).get("shortLabel")
     return Inspection(
-        start_time=start_time,
-        end_time=end_time,
-        label=label,
-        label_short=label_short
+        start_time=inspection.get("startTime"),
+        end_time=inspection.get("endTime"),
+        label=get_display_label(inspection),
+        label_short=get_display_short_label(inspection)
     )
 
+def parse_land_size(land_size):
+    if land_size is None:
+        return -1.0
+    return float(land_size.replace(",", ""))
+
 def get_listing(listing):
-    listing = delete_nulls(listing)
-    # delete null keys for convenience
-
-    property_id = listing.get("id")
-    badge = listing.get("badge", {}).get("label")
-    url = listing.get("_links", {}).get("canonical", {}).get("href")
-    address = listing.get("address", {})
-    suburb = address.get("suburb")
-    state = address.get("state")
-    postcode = address.get("postcode")
-    short_address = address.get("display", {}).get("shortAddress")
-    full_address = address.get("display", {}).get("fullAddress")
-    property_type = listing.get("propertyType", {}).get("id")
-    listing_company = listing.get("listingCompany", {})
-    listing_company_id = listing_company.get("id")
-    listing_company_name = listing_company.get("name")
-    listing_company_phone = parse_phone(listing_company.get("businessPhone"))
-    features = listing.get("generalFeatures", {})
-    bedrooms = features.get("bedrooms", {}).get("value")
-    bathrooms = features.get("bathrooms", {}).get("value")
-    parking_spaces = features.get("parkingSpaces", {}).get("value")
-    property_sizes = listing.get("propertySizes", {})
-    building_size = property_sizes.get("building", {}).get("displayValue")
-    building_size_unit = property_sizes.get(
-        "building", {}).get("sizeUnit", {}).get("displayValue")
-    land_size = float(''.join(property_sizes.get(
-        "land", {}).get("displayValue", '-1').split(',')))
-    land_size_unit = property_sizes.get("land", {}).get(
-        "sizeUnit", {}).get("displayValue")
-    price_text = listing.get("price", {}).get("display", "")
-    price = parse_price_text(price_text)
-    price_text = listing.get("price", {}).get("display")
-    sold_date = listing.get("dateSold", {}).get("display")
-    auction = listing.get("auction", {}) or {}
-    auction_date = auction.get("dateTime", {}).get("value")
-    available_date_text = listing.get("availableDate", {}).get("display")
-    available_date = parse_availability(available_date_text)
-    description = parse_description(listing.get("description"))
-    images = [get_image(media) for media in listing.get("media", []).get('images',[])]
-    images_floorplans = [get_image(media) for media in listing.get("media", []).get('floorplans',[])]
-    listers = [get_lister(lister) for lister in listing.get("listers", [])]
-    inspections = [get_inspection(inspection) for inspection in listing.get("inspections", [])]
+    # read straight from the response, rather than copying it to delete null keys
+    listing_company = listing.get("listingCompany") or {}
+    price_text = get_price_text(listing)
 
     return Listing(
-        id=property_id,
-        badge=badge,
-        url=url,
-        suburb=suburb,
-        state=state,
-        postcode=postcode,
-        short_address=short_address,
-        full_address=full_address,
-        property_type=property_type,
-        listing_company_id=listing_company_id,
-        listing_company_name=listing_company_name,
-        listing_company_phone=listing_company_phone,
-        bedrooms=bedrooms,
-        bathrooms=bathrooms,
-        parking_spaces=parking_spaces,
-        building_size=building_size,
-        building_size_unit=building_size_unit,
-        land_size=land_size,
-        land_size_unit=land_size_unit,
-        price=price,
+        id=listing.get("id"),
+        badge=intern_text(get_badge(listing)),
+        url=get_canonical_url(listing),
+        suburb=intern_text(get_suburb(listing)),
+        state=intern_text(get_state(listing)),
+        postcode=intern_text(get_postcode(listing)),
+        short_address=get_short_address(listing),
+        full_address=get_full_address(listing),
+        property_type=intern_text(get_property_type(listing)),
+        listing_company_id=intern_text(listing_company.get("id")),
+        listing_company_name=intern_text(listing_company.get("name")),
+        listing_company_phone=intern_text(parse_phone(listing_company.get("businessPhone"))),
+        bedrooms=get_bedrooms(listing),
+        bathrooms=get_bathrooms(listing),
+        parking_spaces=get_parking_spaces(listing),
+        building_size=get_building_size(listing),
+        building_size_unit=intern_text(get_building_size_unit(listing)),
+        land_size=parse_land_size(get_land_size(listing)),
+        land_size_unit=intern_text(get_land_size_unit(listing)),
+        price=parse_price_text(price_text or ""),
         price_text=price_text,
-        auction_date=auction_date,
-        available_date=available_date,
-        sold_date=sold_date,
-        description=description,
-        images=images,
-        images_floorplans=images_floorplans,
-        listers=listers,
-        inspections=inspections
+        auction_date=get_auction_date(listing),
+        available_date=parse_availability(get_available_date(listing)),
+        sold_date=get_sold_date(listing),
+        description=parse_description(listing.get("description")),
+        images=[get_image(media) for media in get_images(listing) or []],
+        images_floorplans=[get_image(media) for media in get_floorplans(listing) or []],
+        listers=[get_lister(lister) for lister in listing.get("listers") or []],
+        inspections=[get_inspection(inspection) for inspection in listing.get("inspections") or []]
     )
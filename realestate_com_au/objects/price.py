@@ -0,0 +1,89 @@
+from functools import lru_cache
+import re
+
+from realestate_com_au.objects.listing import slots_dataclass
+
+
+@slots_dataclass(frozen=True)
+class PriceRange:
+    minimum: int
+    maximum: int
+    midpoint: int
+    confident: bool                                         #False if the price is open-ended ('Offers over $1.2m') or has no figures
+
+
+# a multiplier can't run on into a longer word ('$5 months'), but units can follow a bare figure ('$550pw')
+AMOUNT = r"(\d[\d,]*(?:\.\d+)?)\s*(?:(k|m|mil|million)(?![a-z]))?"
+PRICE_PATTERN = re.compile(
+    r"\$\s*" + AMOUNT + r"(?:\s*(?:-|–|to)\s*\$?\s*" + AMOUNT + r")?",
+    re.IGNORECASE,
+)
+MINIMUM_PATTERN = re.compile(r"\b(?:over|above|from|starting|offers? (?:over|above|from))\b|\+", re.IGNORECASE)
+MAXIMUM_PATTERN = re.compile(r"\b(?:under|below|up to|offers? (?:under|below|to))\b", re.IGNORECASE)
+MULTIPLIERS = {"k": 1000, "m": 1000000, "mil": 1000000, "million": 1000000}
+PRICE_CACHE_SIZE = 65536
+
+NO_PRICE = PriceRange(minimum=None, maximum=None, midpoint=None, confident=False)
+
+
+def _parse_amount(amount, multiplier):
+    value = float(amount.replace(",", ""))
+    if multiplier:
+        value *= MULTIPLIERS[multiplier.lower()]
+    return value
+
+
+@lru_cache(maxsize=PRICE_CACHE_SIZE)
+def parse_price(price_text):
+    """
+    Returns the range of prices in a listing's price text, e.g. '$850k - $900k' or 'Offers over $1.2m'.
+    """
+    if not price_text:
+        return NO_PRICE
+
+    amounts = []
+    for match in PRICE_PATTERN.finditer(price_text):
+        amount, multiplier, range_amount, range_multiplier = match.groups()
+        if range_amount is None:
+            amounts.append(_parse_amount(amount, multiplier))
+            continue
+
+        value = _parse_amount(amount, multiplier)
+        range_value = _parse_amount(range_amount, range_multiplier)
+        if range_multiplier and not multiplier:
+            # '$1.1 - 1.2m': the second figure's multiplier applies to both, unless that puts the first above it
+            multiplied_value = _parse_amount(amount, range_multiplier)
+            if multiplied_value <= range_value:
+                value = multiplied_value
+        elif multiplier and not range_multiplier:
+            # '$1.1m - 1.2': the first figure's multiplier applies to both, if the second is otherwise below it
+            multiplied_range_value = _parse_amount(range_amount, multiplier)
+            if range_value < value <= multiplied_range_value:
+                range_value = multiplied_range_value
+        amounts.extend([value, range_value])
+
+    if not amounts:
+        return NO_PRICE
+
+    minimum = int(min(amounts))
+    maximum = int(max(amounts))
+    if len(amounts) == 1:
+        if MINIMUM_PATTERN.search(price_text):
+            return PriceRange(minimum=minimum, maximum=None, midpoint=minimum, confident=False)
+        if MAXIMUM_PATTERN.search(price_text):
+            return PriceRange(minimum=None, maximum=maximum, midpoint=maximum, confident=False)
+
+    return PriceRange(
+        minimum=minimum,
+        maximum=maximum,
+        midpoint=(minimum + maximum) // 2,
+        confident=True,
+    )
+
+
+def parse_prices(price_texts):
+    """
+    Returns the price ranges of a page, or a column, of price texts.
+    Repeated price texts (e.g. 'Contact agent') are only parsed once.
+    """
+    return [parse_price(price_text) for price_text in price_texts]
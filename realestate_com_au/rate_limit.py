@@ -0,0 +1,121 @@
+"""
+Provides rate limiting and retries for realestate.com.au api requests
+"""
+from email.utils import parsedate_to_datetime
+import random
+import threading
+import time
+
+THROTTLE_STATUS_CODES = (429, 503)
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+
+class RateLimiter(object):
+    """
+    Token bucket shared by all requests from a client, which adapts its rate to the server.
+
+    The rate (in requests per second) increases by `increase` after every
+    successful response, up to `max_rate`, and is multiplied by `decrease`
+    whenever the server throttles a request, down to `min_rate`.
+    """
+
+    def __init__(
+        self,
+        rate=1.0,
+        burst=1,
+        min_rate=0.1,
+        max_rate=10.0,
+        increase=0.05,
+        decrease=0.5,
+    ):
+        self.rate = rate
+        self.burst = burst
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.increase = increase
+        self.decrease = decrease
+        self._tokens = burst
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated_at) * self.rate)
+        self._updated_at = now
+
+    def acquire(self):
+        """
+        Blocks until a request can be sent.
+        """
+        while True:
+            with self._lock:
+                self._refill()
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+    def on_success(self):
+        with self._lock:
+            self._refill()
+            self.rate = min(self.max_rate, self.rate + self.increase)
+
+    def on_throttle(self):
+        with self._lock:
+            self._refill()
+            self.rate = max(self.min_rate, self.rate * self.decrease)
+
+
+def parse_retry_after(retry_after):
+    """
+    Returns the number of seconds to wait from a Retry-After header, which is either seconds or an HTTP date.
+    """
+    if not retry_after:
+        return None
+    try:
+        return max(0.0, float(retry_after))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(retry_after).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class RetryPolicy(object):
+    """
+    Retries failed requests with exponential backoff and full jitter, honouring Retry-After.
+    A response asking for a longer wait than `max_backoff` isn't retried.
+    """
+
+    def __init__(
+        self,
+        max_retries=5,
+        backoff=1.0,
+        max_backoff=60.0,
+        status_codes=RETRY_STATUS_CODES,
+    ):
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.status_codes = status_codes
+
+    def should_retry(self, res, attempt):
+        """
+        Returns true if a response (or None, if the request failed to connect) should be retried.
+        """
+        if attempt >= self.max_retries:
+            return False
+        if res is None:
+            return True
+        if res.status_code not in self.status_codes:
+            return False
+        retry_after = parse_retry_after(res.headers.get("Retry-After"))
+        return retry_after is None or retry_after <= self.max_backoff
+
+    def get_delay(self, res, attempt):
+        retry_after = parse_retry_after(res.headers.get("Retry-After")) if res is not None else None
+        if retry_after is not None:
+            return retry_after
+        return random.uniform(0, min(self.max_backoff, self.backoff * 2 ** attempt))
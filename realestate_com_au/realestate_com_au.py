@@ -5,13 +5,21 @@ import random
 import logging
 from time import sleep
 from urllib.parse import urlencode
-import json
-import re
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain, islice
 from fajita import Fajita
-
-import realestate_com_au.settings as settings
-from realestate_com_au.graphql import searchBuy, searchRent, searchSold
-from realestate_com_au.objects.listing import get_listing
+from fajita.fajita import default_evade
+
+from realestate_com_au.base import ClientBase
+from realestate_com_au.metrics import timer
+from realestate_com_au.rate_limit import THROTTLE_STATUS_CODES, RetryPolicy
+from realestate_com_au.search import (
+    DEFAULT_SEARCH_PAGE_SIZE,
+    MAX_SEARCH_PAGE_SIZE,
+    Search,
+)
+from realestate_com_au.transport import Transport
 
 logger = logging.getLogger(__name__)
 
@@ -23,7 +31,11 @@ common_user_agents = [
 ]
 
 
-class RealestateComAu(Fajita):
+def _no_evade():
+    pass
+
+
+class RealestateComAu(ClientBase, Fajita):
     """
     Class for accessing realestate.com.au API.
     """
@@ -37,24 +49,44 @@ class RealestateComAu(Fajita):
         "sec-fetch-site": "same-site",
         "user-agent": random.choice(common_user_agents),
     }
-    _MAX_SEARCH_PAGE_SIZE = 100  # TODO untested
-    _DEFAULT_SEARCH_PAGE_SIZE = 25
+    _MAX_SEARCH_PAGE_SIZE = MAX_SEARCH_PAGE_SIZE
+    _DEFAULT_SEARCH_PAGE_SIZE = DEFAULT_SEARCH_PAGE_SIZE
+    _MAX_SEARCH_RESULTS = 1000  # TODO untested, how far pagination goes before stopping
+    _SPLIT_PRICE = 1000000  # where to first split searches with no maximum price
+    _MIN_SPLIT_PRICE_RANGE = 10000
+    _MAX_SPLIT_BEDROOMS = 6
 
     def __init__(
         self,
         proxies={},
         debug=False,
+        cache=None,
+        rate_limiter=None,
+        retry_policy=None,
+        transport=None,
+        metrics=None,
     ):
+        if proxies and transport is not None:
+            raise ValueError("Pass proxies to the Transport rather than with a transport")
+
         Fajita.__init__(
             self,
             base_url=self.API_BASE_URL,
-            headers=self.REQUEST_HEADERS,
             proxies=proxies,
             debug=debug,
-            cookie_directory=settings.COOKIE_PATH,
         )
+        # a transport can be shared between clients, so they reuse its connections
+        self._transport = transport if transport is not None else Transport(proxies=proxies)
+        # Fajita opens a session of its own, which requests go around
+        self._client.session.close()
+        self._client.session = self._transport.session
         logging.basicConfig(level=logging.DEBUG if debug else logging.INFO)
         self.logger = logger
+        self._cache = cache
+        # the rate limiter, if there is one, paces requests instead of Fajita's random sleeps
+        self._rate_limiter = rate_limiter
+        self._retry_policy = retry_policy if retry_policy is not None else RetryPolicy()
+        self._metrics = metrics
 
     def search(
         self,
@@ -80,154 +112,315 @@ class RealestateComAu(Fajita):
         keywords=[],
         exclude_keywords=[],
         sort_type=None,
+        stream=False,
+        workers=1,
+        seen_ids=None,
+        fields=None,
+        on_page=None,
     ):
-        def get_query_variables(page=start_page):
-            query_variables = {
-                "channel": channel,
-                "page": page,
-                "pageSize": (
-                    min(limit, self._MAX_SEARCH_PAGE_SIZE)
-                    if limit
-                    else self._DEFAULT_SEARCH_PAGE_SIZE
-                ),
-                "localities": [{"searchLocation": location} for location in locations],
-                "filters": {
-                    "surroundingSuburbs": surrounding_suburbs,
-                    "excludeNoSalePrice": exclude_no_sale_price,
-                    "ex-under-contract": ex_under_contract,
-                    "furnished": furnished,
-                    "petsAllowed": pets_allowed,
-                },
-            }
-            if (max_price is not None and max_price > -1) or (
-                max_price is not None and min_price > 0
-            ):
-                price_filter = {}
-                if max_price > -1:
-                    price_filter["maximum"] = str(max_price)
-                if min_price > 0:
-                    price_filter["minimum"] = str(min_price)
-                query_variables["filters"]["priceRange"] = price_filter
-            if (max_bedrooms is not None and max_bedrooms > -1) or (
-                max_bedrooms is not None and min_bedrooms > 0
-            ):
-                beds_filter = {}
-                if max_bedrooms > -1:
-                    beds_filter["maximum"] = str(max_bedrooms)
-                if min_bedrooms > 0:
-                    beds_filter["minimum"] = str(min_bedrooms)
-                query_variables["filters"]["bedroomsRange"] = beds_filter
-            if property_types:
-                query_variables["filters"]["propertyTypes"] = property_types
-            if min_bathrooms is not None and min_bathrooms > 0:
-                query_variables["filters"]["minimumBathroom"] = str(min_bathrooms)
-            if min_carspaces is not None and min_carspaces > 0:
-                query_variables["filters"]["minimumCars"] = str(min_carspaces)
-            if min_land_size is not None and min_land_size > 0:
-                query_variables["filters"]["landSize"] = {"minimum": str(min_land_size)}
-            if construction_status:
-                query_variables["filters"]["constructionStatus"] = construction_status
-            if keywords:
-                query_variables["filters"]["keywords"] = {"terms": keywords}
-            if sort_type:
-                query_variables["sort_type"]=sort_type
-            return query_variables
-
-        def get_query():
-            if channel == "buy":
-                return searchBuy.QUERY
-
-            if channel == "sold":
-                return searchSold.QUERY
-
-            return searchRent.QUERY
-
-        def get_payload(query_variables):
-            payload = {
-                "operationName": "searchByQuery",
-                "variables": {
-                    "query": json.dumps(query_variables),
-                    "testListings": False,
-                    "nullifyOptionals": False,
-                },
-                "query": get_query(),
-            }
-
-            if channel == "rent":
-                payload["variables"]["recentHides"] = []
-
-            return payload
-
-        def parse_items(res):
-            data = res.json()
-            results = (
-                data.get("data", {}).get(f"{channel}Search", {}).get("results", {})
-            )
-
-            exact_listings = (results.get("exact", {}) or {}).get("items", [])
-            surrounding_listings = (results.get("surrounding", {}) or {}).get(
-                "items", []
-            )
-
-            listings = [
-                get_listing(listing.get("listing", {}) or {})
-                for listing in exact_listings + surrounding_listings
-            ]
-
-            # filter listings that contain exclude_keywords
-            if exclude_keywords:
-                pattern = re.compile("|".join(exclude_keywords))
-                listings = [
-                    listing
-                    for listing in listings
-                    if not re.search(pattern, str(listing.description))
-                ]
+        """
+        Search for listings.
+
+        Returns a list of listings, or if `stream` is set, a generator that
+        yields listings page by page as each response is parsed.
+
+        With `workers` > 1, the remaining pages are fetched concurrently (up to
+        `workers` at a time) once the first page reports how many pages there
+        are. Listings are still returned in page order.
+
+        `seen_ids` is an optional set of listing ids to skip. The ids of the
+        listings returned are added to it, so it can be shared between searches.
+
+        `fields` limits the optional groups of fields requested for each listing
+        (see `realestate_com_au.graphql.searchQuery.OPTIONAL_FIELDS`), e.g.
+        `fields=["description"]` to leave out media, listers and inspections.
+
+        `exclude_keywords` is a list of words, or a KeywordFilter, that exclude
+        listings whose description contains them.
+
+        `on_page` is called as `on_page(page, results)` once the listings of each
+        page have been returned, with the page's raw results (which include
+        `totalResultsCount` and `pagination`).
+        """
+
+        search = Search(
+            limit=limit,
+            start_page=start_page,
+            sold_limit=sold_limit,
+            channel=channel,
+            locations=locations,
+            surrounding_suburbs=surrounding_suburbs,
+            exclude_no_sale_price=exclude_no_sale_price,
+            furnished=furnished,
+            pets_allowed=pets_allowed,
+            ex_under_contract=ex_under_contract,
+            min_price=min_price,
+            max_price=max_price,
+            min_bedrooms=min_bedrooms,
+            max_bedrooms=max_bedrooms,
+            property_types=property_types,
+            min_bathrooms=min_bathrooms,
+            min_carspaces=min_carspaces,
+            min_land_size=min_land_size,
+            construction_status=construction_status,
+            keywords=keywords,
+            exclude_keywords=exclude_keywords,
+            sort_type=sort_type,
+            seen_ids=seen_ids,
+            fields=fields,
+            metrics=self._metrics,
+        )
 
+        listings = self._iter_search(search, workers=workers, on_page=on_page)
+        if stream:
             return listings
 
-        def get_current_page(**kwargs):
-            current_query_variables = json.loads(kwargs["json"]["variables"]["query"])
-            return current_query_variables["page"]
-
-        def next_page(**kwargs):
-            current_page = get_current_page(**kwargs)
-            kwargs["json"] = get_payload(get_query_variables(current_page + 1))
-
-            return kwargs
+        return list(listings)
+
+    def _iter_search(self, search, workers=1, on_page=None, first_page_data=None):
+        """
+        Yields the listings of a `Search` page by page. `first_page_data` is the
+        already decoded response to its first page, if it has been fetched.
+        """
+        start_page = search.start_page
+
+        def get_page(page):
+            return self._graphql(search.get_payload(page), search.channel)
+
+        def fetch_pages(first_page):
+            page = first_page
+            while True:
+                yield get_page(page)
+                page += 1
+
+        def fetch_pages_concurrently(first_page, last_page):
+            # Keep up to `workers` requests in flight, but hand responses back in page order
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                pending = deque()
+                try:
+                    for page in range(first_page, last_page + 1):
+                        pending.append(executor.submit(get_page, page))
+                        if len(pending) >= workers:
+                            yield pending.popleft().result()
+                    while pending:
+                        yield pending.popleft().result()
+                finally:
+                    for future in pending:
+                        future.cancel()
+
+        def fetch_remaining_pages(max_page):
+            if max_page:
+                yield from fetch_pages_concurrently(start_page + 1, max_page)
+                yield from fetch_pages(max(start_page, max_page) + 1)
+            else:
+                yield from fetch_pages(start_page + 1)
+
+        data = first_page_data if first_page_data is not None else get_page(start_page)
+        max_page = search.get_max_page(data) if workers > 1 else None
+        pages = fetch_remaining_pages(max_page)
+
+        items_count = 0
+        try:
+            for page, data in enumerate(chain([data], pages), start_page):
+                items = search.parse_items(data)
+                items_count += len(items)
+                yield from items
+
+                if on_page is not None:
+                    on_page(page, search.get_results(data))
+
+                if search.is_done(items_count, data):
+                    return
+        finally:
+            pages.close()
+
+    def search_many(self, queries, stream=False):
+        """
+        Run several searches, given as a list of dicts of `search` keyword arguments.
+
+        The searches share this client's session, and a listing that appears in
+        more than one of them (e.g. as a surrounding suburb result) is only
+        parsed and returned once.
+        """
+        seen_ids = set()
+
+        def scroll():
+            for query in queries:
+                yield from self.search(**query, stream=True, seen_ids=seen_ids)
+
+        listings = scroll()
+        if stream:
+            return listings
 
-        def is_done(items, res, **kwargs):
-            if not items:
-                return True
-            items_count = len(items)
+        return list(listings)
 
-            if limit > -1 and items_count >= limit:
-                return True
+    def _get(self, uri, **kwargs):
+        return self._request(Fajita._get, uri, **kwargs)
 
-            # Sold Listings Limit (Sold listings accumulate indefinetely. Enables data from X most recent sold listings only)
-            if channel == "sold" and sold_limit > -1 and items_count >= sold_limit:
-                return True
+    def _post(self, uri, **kwargs):
+        return self._request(Fajita._post, uri, **kwargs)
 
-            data = res.json()
-            results = (
-                data.get("data", {}).get(f"{channel}Search", {}).get("results", {})
+    def _request(self, send, uri, retry=False, **kwargs):
+        """
+        Sends a request through the rate limiter, retrying it if `retry` is set.
+        """
+        # Fajita's random sleeps are only needed without a rate limiter to pace requests
+        evade = kwargs.pop(
+            "evade", default_evade if self._rate_limiter is None else None
+        )
+        url = f"{kwargs.get('base_url') or self._base_url}{uri}"
+        # sent with each request rather than set on the transport's session, which other clients
+        # (e.g. a MediaPrefetcher downloading images) may share
+        kwargs["headers"] = {**self.REQUEST_HEADERS, **kwargs.get("headers", {})}
+
+        attempt = 0
+        while True:
+            # waits are timed on their own, so `request` only times the request itself
+            with timer(self._metrics, "throttle"):
+                if self._rate_limiter is not None:
+                    self._rate_limiter.acquire()
+                if evade is not None and not self._fresh:
+                    evade()
+
+            try:
+                with timer(self._metrics, "request"):
+                    res = send(self, uri, evade=_no_evade, **kwargs)
+            except self._transport.connection_errors:
+                delay = self._on_response(url, None, attempt, retry)
+                if delay is None:
+                    raise
+            else:
+                if self._rate_limiter is not None:
+                    if res.status_code in THROTTLE_STATUS_CODES:
+                        self._rate_limiter.on_throttle()
+                    elif res.status_code < 400:
+                        self._rate_limiter.on_success()
+
+                delay = self._on_response(url, res, attempt, retry)
+                if delay is None:
+                    return res
+
+            sleep(delay)
+            attempt += 1
+
+    def _graphql(self, payload, channel):
+        """
+        Returns the decoded response to a GraphQL payload, from the response cache if possible.
+        """
+        data = self._get_cached_graphql(payload, channel)
+        if data is None:
+            res = self._post("", json=payload, retry=True)
+            data = self._decode_graphql(payload, channel, res)
+        return data
+
+    def count(self, **search_kwargs):
+        """
+        Returns the total number of results for a search, by requesting a single listing.
+        """
+        totals = []
+
+        def on_page(page, results):
+            totals.append(results.get("totalResultsCount") or 0)
+
+        listings = self.search(
+            **{**search_kwargs, "limit": 1}, stream=True, on_page=on_page
+        )
+        for _ in listings:
+            pass
+
+        return totals[0] if totals else 0
+
+    def search_split(self, max_results=None, stream=False, **search_kwargs):
+        """
+        Search for listings, splitting the search into price bands small enough to page through.
+
+        Searches with more than `max_results` results are split into disjoint
+        price ranges (and then bedroom ranges, if a narrow price range is still
+        too big) until each range can be paged through completely. The ranges
+        share a set of seen listing ids, so listings are only returned once.
+        Listings are matched on realestate.com.au's search price, which may not
+        be displayed.
+
+        Whether a range needs splitting is decided from the total on the first
+        page of its results, which is then reused rather than fetched again.
+
+        `limit` and `sold_limit` apply to the listings of all the ranges together,
+        `seen_ids` is shared by all of them, and `on_page` is called for every page
+        of every range.
+        """
+        max_results = max_results or self._MAX_SEARCH_RESULTS
+        limit = search_kwargs.pop("limit", -1)
+        sold_limit = search_kwargs.pop("sold_limit", -1)
+        if search_kwargs.get("channel", "buy") == "sold" and sold_limit > -1:
+            limit = min(limit, sold_limit) if limit > -1 else sold_limit
+        workers = search_kwargs.pop("workers", 1)
+        on_page = search_kwargs.pop("on_page", None)
+        seen_ids = search_kwargs.pop("seen_ids", None)
+        if seen_ids is None:
+            seen_ids = set()
+
+        def split_bedrooms(query, search, data):
+            min_bedrooms = query.get("min_bedrooms", 0)
+            max_bedrooms = query.get("max_bedrooms", -1)
+            if max_bedrooms == -1:
+                max_bedrooms = max(min_bedrooms, self._MAX_SPLIT_BEDROOMS)
+            if min_bedrooms >= max_bedrooms:
+                self.logger.warning(
+                    "Search for %s still has more than %d results, some will be missing",
+                    query,
+                    max_results,
+                )
+                return [(search, data)]
+
+            bedrooms = list(range(min_bedrooms, max_bedrooms))
+            queries = [
+                {**query, "min_bedrooms": count, "max_bedrooms": count}
+                for count in bedrooms
+            ]
+            queries.append(
+                {
+                    **query,
+                    "min_bedrooms": max_bedrooms,
+                    "max_bedrooms": query.get("max_bedrooms", -1),
+                }
+            )
+            return [split_search for query in queries for split_search in split(query)]
+
+        def split(query):
+            search = Search(**query, seen_ids=seen_ids, metrics=self._metrics)
+            data = self._graphql(search.get_payload(), search.channel)
+            if (search.get_results(data).get("totalResultsCount") or 0) <= max_results:
+                return [(search, data)]
+
+            min_price = query.get("min_price", 0)
+            max_price = query.get("max_price", -1)
+            if max_price == -1:
+                split_price = max(min_price * 2, self._SPLIT_PRICE)
+            elif max_price - min_price > self._MIN_SPLIT_PRICE_RANGE:
+                split_price = (min_price + max_price) // 2
+            else:
+                return split_bedrooms(query, search, data)
+
+            return split({**query, "max_price": split_price}) + split(
+                {**query, "min_price": split_price + 1}
             )
 
-            pagination = results.get("pagination")
-            if not pagination.get("moreResultsAvailable"):
-                return True
+        searches = split(search_kwargs)
+        self.logger.debug("Split search into %d searches", len(searches))
 
-            return False
+        def scroll():
+            for search, data in searches:
+                yield from self._iter_search(
+                    search, workers=workers, on_page=on_page, first_page_data=data
+                )
 
-        listings = self._scroll(
-            "",
-            "POST",
-            parse_items,
-            next_page,
-            is_done,
-            json=get_payload(get_query_variables(1)),
-        )
+        listings = scroll()
+        if limit > -1:
+            listings = islice(listings, limit)
+        if stream:
+            return listings
 
-        return listings
+        return list(listings)
 
     """
     Returns true if form was submitted successfully.
@@ -242,23 +435,9 @@ class RealestateComAu(Fajita):
         subject="",
         from_phone="",
     ):
-        payload = {
-            "lookingTo": subject,
-            "name": from_name,
-            "fromAddress": from_address,
-            "fromPhone": from_phone,
-            "message": message,
-            "likeTo": [],
-        }
-
         res = self._post(
-            f"/contact-agent/listing/{listing_id}",
-            base_url=self.AGENT_CONTACT_BASE_URL,
-            json=payload,
+            **self._get_contact_agent_request(
+                listing_id, from_address, from_name, message, subject, from_phone
+            )
         )
-
-        error = res.status_code != 201
-        if error:
-            print("Error: ", res.text)
-
-        return not error
+        return self._is_agent_contacted(res)
@@ -0,0 +1,226 @@
+"""
+Provides the request payloads and response parsing of realestate.com.au searches,
+shared by the blocking and asyncio clients
+"""
+import json
+
+from realestate_com_au.graphql.searchQuery import get_search_query
+from realestate_com_au.metrics import timer
+from realestate_com_au.objects.listing import get_listing
+from realestate_com_au.utils.keyword_filter import KeywordFilter
+
+MAX_SEARCH_PAGE_SIZE = 100  # TODO untested
+DEFAULT_SEARCH_PAGE_SIZE = 25
+
+
+class Search(object):
+    """
+    The pages of a search: builds the payload for each page and parses the listings
+    out of each response, however the requests are sent.
+
+    Takes the same filters as `RealestateComAu.search`.
+    """
+
+    def __init__(
+        self,
+        limit=-1,
+        start_page=1,
+        sold_limit=-1,
+        channel="buy",
+        locations=[],
+        surrounding_suburbs=True,
+        exclude_no_sale_price=False,
+        furnished=False,
+        pets_allowed=False,
+        ex_under_contract=False,
+        min_price=0,
+        max_price=-1,
+        min_bedrooms=0,
+        max_bedrooms=-1,
+        property_types=[],
+        min_bathrooms=0,
+        min_carspaces=0,
+        min_land_size=0,
+        construction_status=None,
+        keywords=[],
+        exclude_keywords=[],
+        sort_type=None,
+        seen_ids=None,
+        fields=None,
+        metrics=None,
+    ):
+        self.limit = limit
+        self.start_page = start_page
+        self.sold_limit = sold_limit
+        self.channel = channel
+        self.locations = locations
+        self.surrounding_suburbs = surrounding_suburbs
+        self.exclude_no_sale_price = exclude_no_sale_price
+        self.furnished = furnished
+        self.pets_allowed = pets_allowed
+        self.ex_under_contract = ex_under_contract
+        self.min_price = min_price
+        self.max_price = max_price
+        self.min_bedrooms = min_bedrooms
+        self.max_bedrooms = max_bedrooms
+        self.property_types = property_types
+        self.min_bathrooms = min_bathrooms
+        self.min_carspaces = min_carspaces
+        self.min_land_size = min_land_size
+        self.construction_status = construction_status
+        self.keywords = keywords
+        self.sort_type = sort_type
+        self.seen_ids = seen_ids
+        self.metrics = metrics
+        self.query = get_search_query(channel, fields)
+        self.exclude_filter = (
+            exclude_keywords
+            if isinstance(exclude_keywords, KeywordFilter)
+            else KeywordFilter(exclude_keywords)
+        )
+        self.skipped_count = 0  # listings skipped as already seen
+
+    def get_query_variables(self, page=None):
+        query_variables = {
+            "channel": self.channel,
+            "page": self.start_page if page is None else page,
+            "pageSize": (
+                min(self.limit, MAX_SEARCH_PAGE_SIZE)
+                if self.limit
+                else DEFAULT_SEARCH_PAGE_SIZE
+            ),
+            "localities": [
+                {"searchLocation": location} for location in self.locations
+            ],
+            "filters": {
+                "surroundingSuburbs": self.surrounding_suburbs,
+                "excludeNoSalePrice": self.exclude_no_sale_price,
+                "ex-under-contract": self.ex_under_contract,
+                "furnished": self.furnished,
+                "petsAllowed": self.pets_allowed,
+            },
+        }
+        min_price, max_price = self.min_price, self.max_price
+        if (max_price is not None and max_price > -1) or (
+            max_price is not None and min_price > 0
+        ):
+            price_filter = {}
+            if max_price > -1:
+                price_filter["maximum"] = str(max_price)
+            if min_price > 0:
+                price_filter["minimum"] = str(min_price)
+            query_variables["filters"]["priceRange"] = price_filter
+        min_bedrooms, max_bedrooms = self.min_bedrooms, self.max_bedrooms
+        if (max_bedrooms is not None and max_bedrooms > -1) or (
+            max_bedrooms is not None and min_bedrooms > 0
+        ):
+            beds_filter = {}
+            if max_bedrooms > -1:
+                beds_filter["maximum"] = str(max_bedrooms)
+            if min_bedrooms > 0:
+                beds_filter["minimum"] = str(min_bedrooms)
+            query_variables["filters"]["bedroomsRange"] = beds_filter
+        if self.property_types:
+            query_variables["filters"]["propertyTypes"] = self.property_types
+        if self.min_bathrooms is not None and self.min_bathrooms > 0:
+            query_variables["filters"]["minimumBathroom"] = str(self.min_bathrooms)
+        if self.min_carspaces is not None and self.min_carspaces > 0:
+            query_variables["filters"]["minimumCars"] = str(self.min_carspaces)
+        if self.min_land_size is not None and self.min_land_size > 0:
+            query_variables["filters"]["landSize"] = {
+                "minimum": str(self.min_land_size)
+            }
+        if self.construction_status:
+            query_variables["filters"]["constructionStatus"] = self.construction_status
+        if self.keywords:
+            query_variables["filters"]["keywords"] = {"terms": self.keywords}
+        if self.sort_type:
+            query_variables["sort_type"] = self.sort_type
+        return query_variables
+
+    def get_payload(self, page=None):
+        payload = {
+            "operationName": "searchByQuery",
+            "variables": {
+                "query": json.dumps(self.get_query_variables(page)),
+                "testListings": False,
+                "nullifyOptionals": False,
+            },
+            "query": self.query,
+        }
+
+        if self.channel == "rent":
+            payload["variables"]["recentHides"] = []
+
+        return payload
+
+    def get_results(self, data):
+        return data.get("data", {}).get(f"{self.channel}Search", {}).get("results", {})
+
+    def parse_items(self, data):
+        results = self.get_results(data)
+
+        exact_listings = (results.get("exact", {}) or {}).get("items", [])
+        surrounding_listings = (results.get("surrounding", {}) or {}).get("items", [])
+
+        raw_listings = [
+            listing.get("listing", {}) or {}
+            for listing in exact_listings + surrounding_listings
+        ]
+
+        # filter listings that contain exclude_keywords, before paying to parse them
+        if self.exclude_filter:
+            with timer(self.metrics, "filter"):
+                raw_listings = [
+                    listing
+                    for listing in raw_listings
+                    if not self.exclude_filter.matches(listing.get("description"))
+                ]
+
+        # skip listings that have already been returned
+        if self.seen_ids is not None:
+            new_listings = []
+            for listing in raw_listings:
+                listing_id = listing.get("id")
+                if listing_id in self.seen_ids:
+                    self.skipped_count += 1
+                    continue
+                if listing_id is not None:
+                    self.seen_ids.add(listing_id)
+                new_listings.append(listing)
+            raw_listings = new_listings
+
+        with timer(self.metrics, "parse"):
+            listings = [get_listing(listing) for listing in raw_listings]
+
+        if self.metrics is not None:
+            self.metrics.increment("pages")
+            self.metrics.increment("listings", len(listings))
+        return listings
+
+    def get_max_page(self, data):
+        pagination = self.get_results(data).get("pagination", {}) or {}
+        return pagination.get("maxPageNumberAvailable")
+
+    def is_done(self, items_count, data):
+        # listings skipped as already seen still count towards the limit
+        items_count += self.skipped_count
+        if not items_count:
+            return True
+
+        if self.limit > -1 and items_count >= self.limit:
+            return True
+
+        # Sold Listings Limit (Sold listings accumulate indefinetely. Enables data from X most recent sold listings only)
+        if (
+            self.channel == "sold"
+            and self.sold_limit > -1
+            and items_count >= self.sold_limit
+        ):
+            return True
+
+        pagination = self.get_results(data).get("pagination")
+        if not pagination.get("moreResultsAvailable"):
+            return True
+
+        return False
@@ -1,4 +0,0 @@
-import os
-
-ROOT_DIR = os.path.dirname(os.path.abspath(__file__))
-COOKIE_PATH = os.path.join(ROOT_DIR, "cookies/")
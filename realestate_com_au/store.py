@@ -0,0 +1,181 @@
+"""
+Provides storage of listings in SQLite
+"""
+from collections import defaultdict
+from dataclasses import fields
+from itertools import islice
+import sqlite3
+
+from realestate_com_au.export import COLUMNS
+from realestate_com_au.objects.listing import Inspection, Listing, Lister, MediaItem
+
+LISTER_COLUMNS = tuple(f.name for f in fields(Lister))
+INSPECTION_COLUMNS = tuple(f.name for f in fields(Inspection))
+MEDIA_KINDS = {"image": "images", "floorplan": "images_floorplans"}
+DEFAULT_BATCH_SIZE = 1000
+
+SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS listings (
+    {", ".join(name + (" TEXT PRIMARY KEY" if name == "id" else "") for name in COLUMNS)}
+);
+CREATE INDEX IF NOT EXISTS listings_suburb ON listings (suburb);
+CREATE INDEX IF NOT EXISTS listings_price ON listings (price);
+CREATE INDEX IF NOT EXISTS listings_sold_date ON listings (sold_date);
+CREATE TABLE IF NOT EXISTS listers (
+    listing_id TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    {", ".join(f"lister_{name}" for name in LISTER_COLUMNS)},
+    PRIMARY KEY (listing_id, position)
+);
+CREATE TABLE IF NOT EXISTS inspections (
+    listing_id TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    {", ".join(INSPECTION_COLUMNS)},
+    PRIMARY KEY (listing_id, position)
+);
+CREATE TABLE IF NOT EXISTS media (
+    listing_id TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    link TEXT,
+    PRIMARY KEY (listing_id, kind, position)
+);
+"""
+
+
+class ListingStore(object):
+    """
+    SQLite store of listings, with their listers, inspections and media in their own tables.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._connection = sqlite3.connect(path)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.executescript(SCHEMA)
+        self._connection.commit()
+
+    def save(self, listings):
+        """
+        Inserts or replaces a batch of listings, in a single transaction.
+        """
+        # the last of several listings with the same id wins, as in ListingIndex.update
+        listings = list({listing.id: listing for listing in listings}.values())
+        listing_ids = [(listing.id,) for listing in listings]
+        with self._connection:
+            for table in ("listers", "inspections", "media"):
+                self._connection.executemany(
+                    f"DELETE FROM {table} WHERE listing_id = ?", listing_ids
+                )
+
+            self._connection.executemany(
+                f"INSERT OR REPLACE INTO listings ({', '.join(COLUMNS)}) VALUES ({', '.join('?' for _ in COLUMNS)})",
+                [
+                    tuple(getattr(listing, name) for name in COLUMNS)
+                    for listing in listings
+                ],
+            )
+            self._connection.executemany(
+                f"INSERT INTO listers VALUES ({', '.join('?' for _ in range(len(LISTER_COLUMNS) + 2))})",
+                [
+                    (listing.id, position)
+                    + tuple(getattr(lister, name) for name in LISTER_COLUMNS)
+                    for listing in listings
+                    for position, lister in enumerate(listing.listers)
+                ],
+            )
+            self._connection.executemany(
+                f"INSERT INTO inspections VALUES ({', '.join('?' for _ in range(len(INSPECTION_COLUMNS) + 2))})",
+                [
+                    (listing.id, position)
+                    + tuple(getattr(inspection, name) for name in INSPECTION_COLUMNS)
+                    for listing in listings
+                    for position, inspection in enumerate(listing.inspections)
+                ],
+            )
+            self._connection.executemany(
+                "INSERT INTO media VALUES (?, ?, ?, ?)",
+                [
+                    (listing.id, kind, position, media.link)
+                    for listing in listings
+                    for kind, name in MEDIA_KINDS.items()
+                    for position, media in enumerate(getattr(listing, name))
+                ],
+            )
+
+    def save_stream(self, listings, batch_size=DEFAULT_BATCH_SIZE):
+        """
+        Saves listings as they arrive (e.g. from `search(stream=True)`), `batch_size` at a time.
+        Returns the number of listings saved.
+        """
+        listings = iter(listings)
+        count = 0
+        while True:
+            batch = list(islice(listings, batch_size))
+            if not batch:
+                return count
+            self.save(batch)
+            count += len(batch)
+
+    def load(self, where="", parameters=()):
+        """
+        Returns the stored listings, optionally filtered by an SQL condition on the listings table,
+        e.g. `load("suburb = ? AND price < ?", ("Agnes Water", 800000))`.
+        """
+        condition = f" WHERE {where}" if where else ""
+        rows = self._connection.execute(
+            f"SELECT {', '.join(COLUMNS)} FROM listings{condition}", parameters
+        ).fetchall()
+        if not rows:
+            return []
+
+        id_condition = (
+            f" WHERE listing_id IN (SELECT id FROM listings{condition})" if where else ""
+        )
+
+        listers = defaultdict(list)
+        for listing_id, _, *values in self._connection.execute(
+            f"SELECT * FROM listers{id_condition} ORDER BY listing_id, position",
+            parameters,
+        ):
+            listers[listing_id].append(Lister(*values))
+
+        inspections = defaultdict(list)
+        for listing_id, _, *values in self._connection.execute(
+            f"SELECT * FROM inspections{id_condition} ORDER BY listing_id, position",
+            parameters,
+        ):
+            inspections[listing_id].append(Inspection(*values))
+
+        media = defaultdict(list)
+        for listing_id, kind, link in self._connection.execute(
+            f"SELECT listing_id, kind, link FROM media{id_condition} ORDER BY listing_id, kind, position",
+            parameters,
+        ):
+            media[listing_id, kind].append(MediaItem(link=link))
+
+        # COLUMNS are the fields of Listing in order, followed by its list fields
+        id_index = COLUMNS.index("id")
+        return [
+            Listing(
+                *row,
+                media[row[id_index], "image"],
+                media[row[id_index], "floorplan"],
+                listers[row[id_index]],
+                inspections[row[id_index]],
+            )
+            for row in rows
+        ]
+
+    def delete(self, listing_ids):
+        listing_ids = [(listing_id,) for listing_id in listing_ids]
+        with self._connection:
+            for table in ("listers", "inspections", "media"):
+                self._connection.executemany(
+                    f"DELETE FROM {table} WHERE listing_id = ?", listing_ids
+                )
+            self._connection.executemany("DELETE FROM listings WHERE id = ?", listing_ids)
+
+    def close(self):
+        self._connection.close()
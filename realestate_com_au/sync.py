@@ -0,0 +1,184 @@
+"""
+Provides incremental syncing of realestate.com.au search results
+"""
+from dataclasses import dataclass, field
+import hashlib
+import json
+import sqlite3
+import time
+
+DEFAULT_SYNC_SORT_TYPE = "new-desc"
+DEFAULT_STOP_AFTER_UNCHANGED = 25
+
+
+@dataclass
+class SyncResult:
+    added: list = field(default_factory=list)
+    updated: list = field(default_factory=list)
+    removed: list = field(default_factory=list)  # Captures listing ids, only known after a complete crawl
+    complete: bool = False                         # False if the crawl stopped early at listings already seen
+
+
+def get_query_key(search_kwargs):
+    return hashlib.sha256(
+        json.dumps(search_kwargs, sort_keys=True, default=str).encode("utf-8")
+    ).hexdigest()
+
+
+def get_listing_fingerprint(listing):
+    """
+    Returns a hash of the parts of a listing that change while it is on the market.
+    """
+    fields = [
+        listing.price_text,
+        listing.badge,
+        listing.auction_date,
+        listing.available_date,
+        listing.sold_date,
+        listing.description,
+        [
+            [inspection.start_time, inspection.end_time]
+            for inspection in listing.inspections
+        ],
+    ]
+    return hashlib.sha1(
+        json.dumps(fields, default=str).encode("utf-8")
+    ).hexdigest()
+
+
+class SyncState(object):
+    """
+    SQLite-backed record of the listings last seen for each search, and where each search got up to.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._connection = sqlite3.connect(path)
+        self._connection.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS queries (
+                query_key TEXT PRIMARY KEY,
+                watermark TEXT,
+                synced_at REAL NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS listings (
+                query_key TEXT NOT NULL,
+                listing_id TEXT NOT NULL,
+                fingerprint TEXT NOT NULL,
+                PRIMARY KEY (query_key, listing_id)
+            );
+            """
+        )
+        self._connection.commit()
+
+    def get_watermark(self, query_key):
+        row = self._connection.execute(
+            "SELECT watermark FROM queries WHERE query_key = ?", (query_key,)
+        ).fetchone()
+        return row[0] if row else None
+
+    def get_fingerprints(self, query_key):
+        return dict(
+            self._connection.execute(
+                "SELECT listing_id, fingerprint FROM listings WHERE query_key = ?",
+                (query_key,),
+            )
+        )
+
+    def save(self, query_key, watermark, fingerprints, removed_ids=[]):
+        self._connection.execute(
+            "INSERT OR REPLACE INTO queries VALUES (?, ?, ?)",
+            (query_key, watermark, time.time()),
+        )
+        self._connection.executemany(
+            "INSERT OR REPLACE INTO listings VALUES (?, ?, ?)",
+            [
+                (query_key, listing_id, fingerprint)
+                for listing_id, fingerprint in fingerprints.items()
+            ],
+        )
+        self._connection.executemany(
+            "DELETE FROM listings WHERE query_key = ? AND listing_id = ?",
+            [(query_key, listing_id) for listing_id in removed_ids],
+        )
+        self._connection.commit()
+
+    def close(self):
+        self._connection.close()
+
+
+def sync(
+    api,
+    state,
+    full=False,
+    stop_after_unchanged=DEFAULT_STOP_AFTER_UNCHANGED,
+    **search_kwargs,
+):
+    """
+    Returns the listings added, updated and removed since the last sync of a search.
+
+    Results are sorted newest first (unless `sort_type` is given), and paging
+    stops once the listing that was newest at the last sync, or
+    `stop_after_unchanged` listings in a row, are found unchanged. Removed
+    listings can only be found by a complete crawl, which can be forced with `full`.
+    """
+    search_kwargs.setdefault("sort_type", DEFAULT_SYNC_SORT_TYPE)
+    query_key = get_query_key(search_kwargs)
+    watermark = state.get_watermark(query_key)
+    known_fingerprints = state.get_fingerprints(query_key)
+
+    result = SyncResult(complete=True)
+    fingerprints = {}
+    newest_listing_id = None
+    unchanged_count = 0
+
+    listings = api.search(stream=True, **search_kwargs)
+    for listing in listings:
+        if newest_listing_id is None:
+            newest_listing_id = listing.id
+
+        fingerprint = get_listing_fingerprint(listing)
+        fingerprints[listing.id] = fingerprint
+        known_fingerprint = known_fingerprints.get(listing.id)
+
+        if known_fingerprint is None:
+            result.added.append(listing)
+            unchanged_count = 0
+        elif known_fingerprint != fingerprint:
+            result.updated.append(listing)
+            unchanged_count = 0
+        else:
+            unchanged_count += 1
+            if not full and (
+                listing.id == watermark or unchanged_count >= stop_after_unchanged
+            ):
+                # closing the generator stops it from requesting any more pages
+                listings.close()
+                result.complete = False
+                break
+
+    # a search stopped by `limit` or `sold_limit` didn't see the listings past it
+    limit = search_kwargs.get("limit", -1)
+    sold_limit = search_kwargs.get("sold_limit", -1)
+    if (limit > -1 and len(fingerprints) >= limit) or (
+        search_kwargs.get("channel") == "sold"
+        and sold_limit > -1
+        and len(fingerprints) >= sold_limit
+    ):
+        result.complete = False
+
+    if result.complete:
+        result.removed = [
+            listing_id
+            for listing_id in known_fingerprints
+            if listing_id not in fingerprints
+        ]
+
+    state.save(
+        query_key,
+        newest_listing_id or watermark,
+        fingerprints,
+        removed_ids=result.removed,
+    )
+
+    return result
@@ -0,0 +1,122 @@
+"""
+Provides pooled HTTP sessions that can be shared between RealestateComAu instances
+"""
+from http.cookiejar import LWPCookieJar
+import os
+import tempfile
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+
+DEFAULT_POOL_SIZE = 10
+
+
+def _get_accept_encoding():
+    encodings = ["gzip", "deflate"]
+    for module in ("brotli", "brotlicffi"):
+        try:
+            __import__(module)
+        except ImportError:
+            continue
+        encodings.append("br")
+        break
+    return ", ".join(encodings)
+
+
+def _import_httpx():
+    try:
+        import httpx
+    except ImportError:
+        raise ImportError(
+            "httpx is required for HTTP/2 and AsyncRealestateComAu (pip install httpx[http2])"
+        )
+    return httpx
+
+
+class Transport(object):
+    """
+    Keep-alive HTTP session with a connection pool, to be shared by any number of clients.
+
+    `pool_size` is the number of connections kept open per host, which should be
+    at least the number of threads sending requests through the transport.
+    With `http2`, requests go through an HTTP/2 httpx client instead of requests.
+
+    Cookies are kept in memory unless `cookie_path` is given, in which case they're
+    loaded from that file and written back to it by `save_cookies` (or `close`).
+    """
+
+    def __init__(
+        self,
+        pool_size=DEFAULT_POOL_SIZE,
+        http2=False,
+        proxies={},
+        cookie_path=None,
+    ):
+        self.pool_size = pool_size
+        self.http2 = http2
+        self.cookie_path = cookie_path
+        self._cookie_lock = threading.Lock()
+
+        cookies = None
+        if cookie_path is not None:
+            cookies = LWPCookieJar(cookie_path)
+            if os.path.exists(cookie_path):
+                cookies.load(ignore_discard=True, ignore_expires=True)
+
+        headers = {"accept-encoding": _get_accept_encoding()}
+        if http2:
+            httpx = _import_httpx()
+            limits = httpx.Limits(
+                max_connections=pool_size, max_keepalive_connections=pool_size
+            )
+            self.session = httpx.Client(
+                http2=True,
+                limits=limits,
+                headers=headers,
+                cookies=cookies,
+                proxy=next(iter(proxies.values()), None),
+            )
+            self.connection_errors = (httpx.TransportError,)
+        else:
+            self.session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+            self.session.mount("https://", adapter)
+            self.session.mount("http://", adapter)
+            self.session.headers.update(headers)
+            self.session.proxies.update(proxies)
+            if cookies is not None:
+                self.session.cookies.update(cookies)
+            self.connection_errors = (requests.ConnectionError, requests.Timeout)
+
+    def save_cookies(self):
+        """
+        Writes the session's cookies to `cookie_path`, replacing the file atomically
+        so other processes never read a partly written one.
+        """
+        if self.cookie_path is None:
+            return
+
+        directory = os.path.dirname(os.path.abspath(self.cookie_path))
+        with self._cookie_lock:
+            fd, path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+            os.close(fd)
+            try:
+                cookies = LWPCookieJar(path)
+                for cookie in self.session.cookies.jar if self.http2 else self.session.cookies:
+                    cookies.set_cookie(cookie)
+                cookies.save(ignore_discard=True, ignore_expires=True)
+                os.replace(path, self.cookie_path)
+            except BaseException:
+                os.remove(path)
+                raise
+
+    def close(self):
+        self.save_cookies()
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
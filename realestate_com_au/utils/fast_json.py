@@ -0,0 +1,14 @@
+"""
+Decodes JSON with orjson when it is installed, and the standard library otherwise
+"""
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+if orjson is not None:
+    loads = orjson.loads
+else:
+    loads = json.loads  # also accepts bytes, detecting their encoding
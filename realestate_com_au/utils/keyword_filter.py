@@ -0,0 +1,63 @@
+import re
+
+
+def _get_trie(keywords):
+    trie = {}
+    for keyword in keywords:
+        node = trie
+        for char in keyword:
+            node = node.setdefault(char, {})
+        node[""] = {}  # marks the end of a keyword
+    return trie
+
+
+def _get_trie_pattern(trie):
+    """
+    Returns a regex matching the keywords in a trie, with shared prefixes factored
+    out, so the regex engine never tries the same prefix twice.
+    """
+    alternatives = [
+        re.escape(char) + _get_trie_pattern(node)
+        for char, node in sorted(trie.items())
+        if char
+    ]
+    if not alternatives:
+        return ""
+
+    pattern = (
+        alternatives[0] if len(alternatives) == 1 else f"(?:{'|'.join(alternatives)})"
+    )
+    if "" in trie:
+        return f"(?:{pattern})?"
+    return pattern
+
+
+class KeywordFilter(object):
+    """
+    Matches text against a list of literal keywords, compiled once into a single trie-based regex.
+    """
+
+    def __init__(self, keywords, ignore_case=False, whole_words=False):
+        self.keywords = [keyword for keyword in keywords if keyword]
+        self.ignore_case = ignore_case
+        self.whole_words = whole_words
+
+        pattern = _get_trie_pattern(
+            _get_trie(
+                keyword.lower() if ignore_case else keyword for keyword in self.keywords
+            )
+        )
+        if whole_words:
+            pattern = rf"\b{pattern}\b"
+        self._pattern = re.compile(pattern, re.IGNORECASE if ignore_case else 0)
+
+    def __bool__(self):
+        return bool(self.keywords)
+
+    def matches(self, text):
+        """
+        Returns true if the text contains any of the keywords.
+        """
+        if not text or not self.keywords:
+            return False
+        return self._pattern.search(text) is not None
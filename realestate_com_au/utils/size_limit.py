@@ -0,0 +1,77 @@
+"""
+Provides least recently used eviction for SQLite tables with a size limit
+"""
+DEFAULT_EVICT_TO = 0.9
+
+
+class SizeLimit(object):
+    """
+    Keeps the total `size` of the rows of a SQLite table under `max_size`, by deleting
+    the rows with the oldest `accessed_at` first.
+
+    The total is kept in a `sizes` row, updated by `add` in the caller's transaction, so
+    puts don't have to sum the table. Eviction goes down to `evict_to` of `max_size`, so
+    it runs once per batch of puts rather than on every put once the table is full.
+    """
+
+    def __init__(self, connection, table, key_column, max_size, evict_to=DEFAULT_EVICT_TO):
+        self._connection = connection
+        self.table = table
+        self.key_column = key_column
+        self.max_size = max_size
+        self.evict_to = evict_to
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS sizes (name TEXT PRIMARY KEY, total INTEGER NOT NULL)"
+        )
+        connection.execute(
+            f"INSERT OR IGNORE INTO sizes SELECT ?, COALESCE(SUM(size), 0) FROM {table}",
+            (table,),
+        )
+
+    @property
+    def total_size(self):
+        (total_size,) = self._connection.execute(
+            "SELECT total FROM sizes WHERE name = ?", (self.table,)
+        ).fetchone()
+        return total_size
+
+    def add(self, size):
+        """
+        Records a change in the table's total size, e.g. the size of a row put minus the size
+        of the row it replaced, or minus the size of a row deleted.
+        """
+        if size:
+            self._connection.execute(
+                "UPDATE sizes SET total = total + ? WHERE name = ?", (size, self.table)
+            )
+
+    def reset(self):
+        self._connection.execute(
+            "UPDATE sizes SET total = 0 WHERE name = ?", (self.table,)
+        )
+
+    def evict(self):
+        """
+        Deletes the least recently used rows if the table is over its limit, and returns their keys.
+        """
+        total_size = self.total_size
+        if total_size <= self.max_size:
+            return []
+
+        target_size = self.max_size * self.evict_to
+        evicted_keys = []
+        evicted_size = 0
+        for key, size in self._connection.execute(
+            f"SELECT {self.key_column}, size FROM {self.table} ORDER BY accessed_at"
+        ):
+            if total_size - evicted_size <= target_size:
+                break
+            evicted_keys.append(key)
+            evicted_size += size
+
+        self._connection.executemany(
+            f"DELETE FROM {self.table} WHERE {self.key_column} = ?",
+            [(key,) for key in evicted_keys],
+        )
+        self.add(-evicted_size)
+        return evicted_keys
@@ -33,6 +33,10 @@ setuptools.setup(
     license="MIT",
     packages=setuptools.find_packages(),
     install_requires=["requests", "fajita"],
+    entry_points={
+        "console_scripts": ["realestate-com-au-crawl=realestate_com_au.crawl:main"]
+    },
+    extras_require={"arrow": ["pyarrow"], "async": ["httpx[http2]"], "http2": ["httpx[http2]"], "fast": ["orjson"]},
     classifiers=(
         "Programming Language :: Python :: 3",
         "License :: OSI Approved :: MIT License",
@@ -0,0 +1,146 @@
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+import threading
+import pytest
+
+from realestate_com_au import RealestateComAu
+
+
+class MockResponse:
+    def __init__(self, data, status_code=200):
+        self._data = data
+        self.status_code = status_code
+        self.headers = {}
+
+    @property
+    def text(self):
+        return json.dumps(self._data)
+
+    @property
+    def content(self):
+        return self.text.encode("utf-8")
+
+    def json(self):
+        return self._data
+
+
+def get_page(channel, page, listing_ids, more_results=True, max_page=None):
+    return MockResponse(
+        {
+            "data": {
+                f"{channel}Search": {
+                    "results": {
+                        "totalResultsCount": 0,
+                        "pagination": {
+                            "page": page,
+                            "moreResultsAvailable": more_results,
+                            "maxPageNumberAvailable": max_page,
+                        },
+                        "exact": {
+                            "items": [
+                                {"listing": {"id": listing_id}}
+                                for listing_id in listing_ids
+                            ]
+                        },
+                        "surrounding": None,
+                    }
+                }
+            }
+        }
+    )
+
+
+def get_mock_api():
+    """
+    Returns a client whose requests are answered with three pages of listings.
+    """
+    api = RealestateComAu()
+    api.requested_pages = []
+    api.pages = pages = {
+        1: ["1", "2"],
+        2: ["3", "4"],
+        3: ["5"],
+    }
+
+    def post(uri, **kwargs):
+        query = json.loads(kwargs["json"]["variables"]["query"])
+        page = query["page"]
+        api.requested_pages.append(page)
+        return get_page(
+            query["channel"], page, pages[page], page < len(pages), len(pages)
+        )
+
+    api._post = post
+    return api
+
+
+@pytest.fixture
+def api():
+    return get_mock_api()
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """
+    Answers POSTs with an empty GraphQL response and a cookie, with the statuses in
+    `server.statuses` in turn and then 200, and GETs with the body `server.get_body(path)`
+    returns, or 404 if it returns None.
+    """
+
+    protocol_version = "HTTP/1.1"
+
+    def setup(self):
+        super().setup()
+        self.server.connections += 1
+
+    def do_GET(self):
+        self.server.requested_paths.append(self.path)
+        body = self.server.get_body(self.path)
+        if body is None:
+            self._respond(404, b"")
+        else:
+            self._respond(200, body)
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("content-length", 0)))
+        self.server.requests += 1
+        self.server.request_headers = dict(self.headers)
+        status = self.server.statuses.pop(0) if self.server.statuses else 200
+        headers = {
+            "content-type": "application/json",
+            "set-cookie": "session=abc; Path=/; Max-Age=3600",
+        }
+        if status == 429:
+            headers["retry-after"] = "0"
+        self._respond(status, b'{"data": {}}', headers)
+
+    def _respond(self, status, body, headers={}):
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("content-length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    """
+    Local HTTP server answering with `StubHandler`, which counts the connections
+    and POSTs it receives and records the paths of GETs.
+    """
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    server.daemon_threads = True
+    server.connections = 0
+    server.requests = 0
+    server.request_headers = None  # of the last POST
+    server.statuses = []
+    server.requested_paths = []
+    server.get_body = lambda path: None
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
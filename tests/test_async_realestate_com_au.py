@@ -0,0 +1,121 @@
+import asyncio
+import json
+import pytest
+
+from realestate_com_au import AsyncRealestateComAu
+from realestate_com_au.rate_limit import RetryPolicy
+from conftest import MockResponse, get_page
+
+
+class MockAsyncClient:
+    def __init__(self, pages):
+        self.pages = pages
+        self.requested_pages = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.statuses = []  # statuses to respond with before the pages
+        self.requested_statuses = []
+
+    async def post(self, url, **kwargs):
+        if self.statuses:
+            self.requested_statuses.append(self.statuses[0])
+            return MockResponse({}, status_code=self.statuses.pop(0))
+        if url.startswith(AsyncRealestateComAu.AGENT_CONTACT_BASE_URL):
+            return MockResponse({}, status_code=201)
+
+        query = json.loads(kwargs["json"]["variables"]["query"])
+        page = query["page"]
+        self.requested_pages.append(page)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        return get_page(
+            query["channel"],
+            page,
+            self.pages[page],
+            page < len(self.pages),
+            len(self.pages),
+        )
+
+
+def get_client():
+    return MockAsyncClient({1: ["1", "2"], 2: ["3", "4"], 3: ["5"]})
+
+
+def test_search():
+    client = get_client()
+    api = AsyncRealestateComAu(client=client)
+    listings = asyncio.run(api.search(locations=["seventeen seventy, qld 4677"]))
+    assert [listing.id for listing in listings] == ["1", "2", "3", "4", "5"]
+    assert client.requested_pages == [1, 2, 3]
+
+
+def test_search_pages():
+    client = get_client()
+    api = AsyncRealestateComAu(client=client)
+
+    async def first_page():
+        async for listings in api.search_pages():
+            return [listing.id for listing in listings]
+
+    assert asyncio.run(first_page()) == ["1", "2"]
+    assert client.requested_pages == [1]
+
+
+def test_search_workers():
+    client = get_client()
+    api = AsyncRealestateComAu(client=client)
+    listings = asyncio.run(api.search(workers=2))
+    assert [listing.id for listing in listings] == ["1", "2", "3", "4", "5"]
+    assert client.max_in_flight == 2
+
+
+def test_default_semaphore():
+    client = get_client()
+    api = AsyncRealestateComAu(client=client, pool_size=1)
+    # the client outlives each event loop, with requests queueing on its semaphore in both
+    for _ in range(2):
+        listings = asyncio.run(api.search(workers=2))
+        assert len(listings) == 5
+    assert client.max_in_flight == 1
+
+
+def test_shared_semaphore():
+    client = get_client()
+
+    async def search_all():
+        semaphore = asyncio.Semaphore(1)
+        apis = [AsyncRealestateComAu(client=client, semaphore=semaphore) for _ in range(3)]
+        return await asyncio.gather(*(api.search(workers=2) for api in apis))
+
+    results = asyncio.run(search_all())
+    assert [len(listings) for listings in results] == [5, 5, 5]
+    assert client.max_in_flight == 1
+
+
+def test_contact_agent():
+    api = AsyncRealestateComAu(client=get_client())
+    assert asyncio.run(api.contact_agent("1", "a@example.com", "A", "Hello"))
+
+
+def test_search_retried():
+    client = get_client()
+    client.statuses = [502, 503]
+    api = AsyncRealestateComAu(client=client, retry_policy=RetryPolicy(backoff=0.0))
+    listings = asyncio.run(api.search())
+    assert [listing.id for listing in listings] == ["1", "2", "3", "4", "5"]
+    assert client.requested_statuses == [502, 503]
+
+
+def test_contact_agent_not_retried():
+    client = get_client()
+    client.statuses = [502]
+    api = AsyncRealestateComAu(client=client, retry_policy=RetryPolicy(backoff=0.0))
+    assert not asyncio.run(api.contact_agent("1", "a@example.com", "A", "Hello"))
+    assert client.requested_statuses == [502]
+
+
+def test_proxies_with_client():
+    with pytest.raises(ValueError):
+        AsyncRealestateComAu(client=get_client(), proxies={"https": "http://127.0.0.1:3128"})
@@ -0,0 +1,76 @@
+import zlib
+import pytest
+
+from realestate_com_au.cache import ResponseCache, get_cache_key
+
+
+PAYLOAD = {
+    "operationName": "searchByQuery",
+    "variables": {"query": '{"channel": "buy", "page": 1}'},
+}
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = ResponseCache(str(tmp_path / "cache.sqlite"))
+    yield cache
+    cache.close()
+
+
+def test_get_cache_key():
+    reordered_payload = {
+        "variables": {"query": '{"page": 1, "channel": "buy"}'},
+        "operationName": "searchByQuery",
+    }
+    assert get_cache_key(PAYLOAD) == get_cache_key(reordered_payload)
+
+
+def test_get_put(cache):
+    assert cache.get(PAYLOAD, "buy") is None
+    cache.put(PAYLOAD, "buy", b'{"data": {}}')
+    assert cache.get(PAYLOAD, "buy") == b'{"data": {}}'
+
+
+def test_ttl(cache):
+    cache.ttls["buy"] = -1
+    cache.put(PAYLOAD, "buy", b'{"data": {}}')
+    assert cache.get(PAYLOAD, "buy") is None
+
+
+def test_evict(cache):
+    cache.max_size = 1
+    cache.put(PAYLOAD, "buy", b'{"data": {}}')
+    assert cache.get(PAYLOAD, "buy") is None
+
+
+def test_evict_least_recently_used(cache):
+    payloads = [
+        {"variables": {"query": f'{{"channel": "buy", "page": {page}}}'}}
+        for page in range(1, 4)
+    ]
+    for payload in payloads:
+        cache.put(payload, "buy", b"x" * 1000)
+        cache.put(payload, "buy", b"x" * 1000)  # replacing an entry doesn't count it twice
+    size = cache._size_limit.total_size
+    assert size == 3 * len(zlib.compress(b"x" * 1000))
+
+    cache.get(payloads[0], "buy")
+    cache.max_size = size - 1
+    cache.put(payloads[2], "buy", b"x" * 1000)
+    assert cache.get(payloads[0], "buy") is not None
+    assert cache.get(payloads[1], "buy") is None
+    assert cache._size_limit.total_size == 2 * len(zlib.compress(b"x" * 1000))
+
+
+@pytest.fixture
+def cached_api(api, cache):
+    api._cache = cache
+    return api
+
+
+def test_search_cached(cached_api):
+    listings = cached_api.search()
+    assert cached_api.requested_pages == [1, 2, 3]
+
+    assert cached_api.search() == listings
+    assert cached_api.requested_pages == [1, 2, 3]
@@ -0,0 +1,75 @@
+import json
+
+from realestate_com_au.crawl import Checkpoint, JsonLinesSink, crawl
+from realestate_com_au.sync import get_query_key
+from conftest import get_mock_api
+
+JOBS = [
+    {"locations": ["seventeen seventy, qld 4677"]},
+    {"locations": ["agnes water, qld 4677"], "channel": "sold"},
+]
+
+
+class ListSink:
+    def __init__(self):
+        self.listings = []
+
+    def write(self, listings):
+        self.listings.extend(listings)
+
+
+def test_crawl(tmp_path):
+    checkpoint_path = str(tmp_path / "checkpoint.sqlite")
+    sink = ListSink()
+    result = crawl(
+        JOBS, sink, checkpoint_path=checkpoint_path, processes=2, client_factory=get_mock_api
+    )
+    assert result.listings == 10
+    assert sorted(listing.id for listing in sink.listings) == sorted(["1", "2", "3", "4", "5"] * 2)
+    assert not result.failed
+
+    checkpoint = Checkpoint(checkpoint_path)
+    assert all(checkpoint.is_done(get_query_key(job)) for job in JOBS)
+
+    # a completed crawl has nothing left to do
+    result = crawl(JOBS, ListSink(), checkpoint_path=checkpoint_path, client_factory=get_mock_api)
+    assert result.listings == 0
+    assert len(result.skipped) == 2
+
+
+def test_crawl_resume(tmp_path):
+    checkpoint_path = str(tmp_path / "checkpoint.sqlite")
+    checkpoint = Checkpoint(checkpoint_path)
+    checkpoint.set_page(get_query_key(JOBS[0]), 2, 4)
+    checkpoint.close()
+
+    sink = ListSink()
+    crawl(JOBS[:1], sink, checkpoint_path=checkpoint_path, client_factory=get_mock_api)
+    assert [listing.id for listing in sink.listings] == ["5"]
+
+
+def test_crawl_resume_limit(tmp_path):
+    job = {**JOBS[0], "limit": 3}
+    checkpoint_path = str(tmp_path / "checkpoint.sqlite")
+    checkpoint = Checkpoint(checkpoint_path)
+    checkpoint.set_page(get_query_key(job), 1, 2)
+    checkpoint.close()
+
+    # the 2 listings written before the resume count towards the limit
+    sink = ListSink()
+    crawl([job], sink, checkpoint_path=checkpoint_path, client_factory=get_mock_api)
+    assert [listing.id for listing in sink.listings] == ["3", "4"]
+
+    checkpoint = Checkpoint(checkpoint_path)
+    assert checkpoint.is_done(get_query_key(job))
+    assert checkpoint.get_items(get_query_key(job)) == 4
+
+
+def test_json_lines_sink(tmp_path):
+    path = tmp_path / "listings.jsonl"
+    sink = JsonLinesSink(str(path))
+    sink.write(get_mock_api().search())
+    sink.close()
+
+    lines = path.read_text().splitlines()
+    assert [json.loads(line)["id"] for line in lines] == ["1", "2", "3", "4", "5"]
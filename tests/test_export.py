@@ -0,0 +1,69 @@
+import csv
+import io
+import pytest
+
+from realestate_com_au.export import ListingColumns, write_arrow, write_csv, write_parquet
+from realestate_com_au.objects.listing import get_listing
+
+LISTINGS = [
+    get_listing(
+        {
+            "id": str(listing_id),
+            "address": {"suburb": suburb},
+            "generalFeatures": {"bedrooms": {"value": bedrooms}},
+            "price": {"display": price_text},
+        }
+    )
+    for listing_id, (suburb, bedrooms, price_text) in enumerate(
+        [
+            ("Agnes Water", 3, "$650,000"),
+            ("Seventeen Seventy", None, "Contact agent"),
+            ("Agnes Water", 4, "$1.2m"),
+        ]
+    )
+]
+
+
+def test_listing_columns():
+    columns = ListingColumns()
+    columns.extend(LISTINGS)
+    assert len(columns) == 3
+    assert list(columns.codes["suburb"]) == [0, 1, 0]
+    assert columns.categories["suburb"] == ["Agnes Water", "Seventeen Seventy"]
+    assert columns.column("bedrooms") == [3, None, 4]
+    assert columns.column("price") == [650000, None, 1200000]
+    assert columns.column("state") == [None, None, None]
+    # land_size's -1 for no land size is missing, not a value
+    assert [listing.land_size for listing in LISTINGS] == [-1, -1, -1]
+    assert columns.column("land_size") == [None, None, None]
+
+    columns.clear()
+    assert len(columns) == 0
+    assert columns.categories["suburb"] == ["Agnes Water", "Seventeen Seventy"]
+
+
+def test_write_csv():
+    file = io.StringIO()
+    write_csv(LISTINGS, file, chunk_size=2)
+    rows = list(csv.DictReader(io.StringIO(file.getvalue())))
+    assert [row["id"] for row in rows] == ["0", "1", "2"]
+    assert [row["bedrooms"] for row in rows] == ["3", "", "4"]
+    assert [row["suburb"] for row in rows] == ["Agnes Water", "Seventeen Seventy", "Agnes Water"]
+
+
+def test_write_parquet(tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+    path = str(tmp_path / "listings.parquet")
+    write_parquet(LISTINGS, path, chunk_size=2)
+    table = pq.read_table(path)
+    assert table.column("suburb").to_pylist() == ["Agnes Water", "Seventeen Seventy", "Agnes Water"]
+    assert table.column("bedrooms").to_pylist() == [3, None, 4]
+
+
+def test_write_arrow(tmp_path):
+    pa = pytest.importorskip("pyarrow")
+    path = str(tmp_path / "listings.arrow")
+    write_arrow(LISTINGS, path, chunk_size=2)
+    table = pa.ipc.open_file(path).read_all()
+    assert table.column("id").to_pylist() == ["0", "1", "2"]
+    assert table.column("suburb").to_pylist() == ["Agnes Water", "Seventeen Seventy", "Agnes Water"]
@@ -0,0 +1,6 @@
+from realestate_com_au.utils.fast_json import loads
+
+
+def test_loads():
+    assert loads(b'{"data": {"buySearch": null}}') == {"data": {"buySearch": None}}
+    assert loads('{"price": "$1.2m \\u2013 $1.3m"}') == {"price": "$1.2m – $1.3m"}
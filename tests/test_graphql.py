@@ -0,0 +1,30 @@
+import pytest
+
+from realestate_com_au.graphql.searchQuery import get_search_query
+
+
+@pytest.mark.parametrize("channel", ["buy", "rent", "sold"])
+def test_get_search_query(channel):
+    query = get_search_query(channel)
+    assert f"{channel}Search(" in query
+    assert query.count("{") == query.count("}")
+    assert "media{" in query and "listers{" in query
+
+
+def test_get_search_query_fields():
+    query = get_search_query("buy", fields=["description"])
+    assert "description" in query
+    assert "media{" not in query and "listers{" not in query
+    assert "inspections{" not in query
+
+
+def test_get_search_query_unknown_fields():
+    with pytest.raises(ValueError):
+        get_search_query("buy", fields=["leadGen"])
+
+
+def test_get_search_query_lister_phone():
+    assert "preferredPhoneNumber" in get_search_query("buy")
+    sold_query = get_search_query("sold")
+    assert "preferredPhoneNumber" not in sold_query
+    assert "phoneNumber{display}" in sold_query
@@ -0,0 +1,74 @@
+from realestate_com_au.index import ListingIndex
+from realestate_com_au.objects.listing import get_listing
+
+
+def get_test_listing(listing_id, suburb, price, bedrooms, land_size=None):
+    return get_listing(
+        {
+            "id": listing_id,
+            "address": {"suburb": suburb},
+            "price": {"display": f"${price:,}" if price else "Contact agent"},
+            "generalFeatures": {"bedrooms": {"value": bedrooms}},
+            "propertySizes": {"land": {"displayValue": land_size}} if land_size else None,
+        }
+    )
+
+
+LISTINGS = [
+    get_test_listing("1", "Agnes Water", 650000, 3, "800"),
+    get_test_listing("2", "Agnes Water", 900000, 4, "1,200"),
+    get_test_listing("3", "Seventeen Seventy", 1200000, 4),
+    get_test_listing("4", "Seventeen Seventy", None, 2),
+]
+
+
+def find_ids(index, **filters):
+    return sorted(listing.id for listing in index.find(**filters))
+
+
+def test_find():
+    index = ListingIndex(LISTINGS)
+    assert len(index) == 4
+    assert find_ids(index) == ["1", "2", "3", "4"]
+    assert find_ids(index, suburbs=["Agnes Water"]) == ["1", "2"]
+    assert find_ids(index, min_price=800000) == ["2", "3"]
+    assert find_ids(index, max_price=1000000) == ["1", "2"]
+    assert find_ids(index, min_bedrooms=4, suburbs=["Seventeen Seventy"]) == ["3"]
+    assert find_ids(index, min_land_size=1000) == ["2"]
+    assert find_ids(index, suburbs=["Agnes Water"], min_bedrooms=4, max_price=1000000) == ["2"]
+    assert find_ids(index, suburbs=["Rainbow Beach"]) == []
+
+
+def test_add_remove():
+    index = ListingIndex(LISTINGS)
+    index.remove("1")
+    assert "1" not in index
+    assert find_ids(index, suburbs=["Agnes Water"]) == ["2"]
+    assert find_ids(index, max_price=700000) == []
+
+    index.add(get_test_listing("2", "Agnes Water", 600000, 4))
+    assert len(index) == 3
+    assert find_ids(index, max_price=700000) == ["2"]
+    assert find_ids(index, min_price=800000) == ["3"]
+
+
+def test_update():
+    index = ListingIndex(LISTINGS)
+    index.update(
+        [
+            get_test_listing("5", "Agnes Water", 650000, 3),
+            get_test_listing("3", "Seventeen Seventy", 650000, 4),
+            get_test_listing("5", "Agnes Water", 700000, 3),
+        ]
+    )
+    assert len(index) == 5
+    assert index._sorted_indexes["price"].values == sorted(
+        index._sorted_indexes["price"].values
+    )
+    assert find_ids(index, min_price=650000, max_price=650000) == ["1", "3"]
+    assert find_ids(index, min_price=700000, max_price=700000) == ["5"]
+
+    # entries with equal values are removed by id
+    index.remove("3")
+    assert find_ids(index, min_price=650000, max_price=650000) == ["1"]
+    assert find_ids(index, min_bedrooms=4) == ["2"]
@@ -0,0 +1,30 @@
+from realestate_com_au.utils.keyword_filter import KeywordFilter
+
+
+def test_matches():
+    keyword_filter = KeywordFilter(["pool", "pools", "granny flat", "a+b"])
+    assert keyword_filter.matches("Resort style pool and deck")
+    assert keyword_filter.matches("A granny flat out the back")
+    assert keyword_filter.matches("Zoned a+b")
+    assert not keyword_filter.matches("Pool and deck")
+    assert not keyword_filter.matches("Zoned ab")
+    assert not keyword_filter.matches(None)
+
+
+def test_ignore_case():
+    keyword_filter = KeywordFilter(["Pool"], ignore_case=True)
+    assert keyword_filter.matches("POOL and deck")
+
+
+def test_whole_words():
+    keyword_filter = KeywordFilter(["pool", "pools"], whole_words=True)
+    assert keyword_filter.matches("Two pools")
+    assert keyword_filter.matches("A pool.")
+    assert not keyword_filter.matches("Whirlpool bath")
+    assert not keyword_filter.matches("Carpooling nearby")
+
+
+def test_empty():
+    keyword_filter = KeywordFilter([])
+    assert not keyword_filter
+    assert not keyword_filter.matches("Resort style pool")
@@ -0,0 +1,127 @@
+from dataclasses import FrozenInstanceError, dataclass, field
+import pickle
+import pytest
+
+from realestate_com_au.objects.listing import (
+    _add_slots,
+    Inspection,
+    Lister,
+    MediaItem,
+    get_lister,
+    get_listing,
+    get_path,
+)
+
+LISTING = {
+    "id": "143160680",
+    "badge": None,
+    "_links": {"canonical": {"href": "https://www.realestate.com.au/property-house-qld-seventeen+seventy-143160680"}},
+    "address": {
+        "suburb": "Seventeen Seventy",
+        "state": "Qld",
+        "postcode": "4677",
+        "display": {"shortAddress": "12 Captain Cook Drive", "fullAddress": None},
+    },
+    "propertyType": {"id": "house"},
+    "listingCompany": {"id": "QKZTBW", "name": "Agnes Water Real Estate", "businessPhone": "07 4974 9999"},
+    "generalFeatures": {"bedrooms": {"value": 4}, "bathrooms": {"value": 2}, "parkingSpaces": None},
+    "propertySizes": {"building": None, "land": {"displayValue": "1,012", "sizeUnit": {"displayValue": "m²"}}},
+    "price": {"display": "Offers over $1,250,000"},
+    "auction": None,
+    "description": "Moments from the beach",
+    "media": {"images": [{"templatedUrl": "https://i2.au.reastatic.net/{size}/image1.jpg"}], "floorplans": None},
+    "listers": [
+        {
+            "id": "2218406",
+            "agentId": None,
+            "name": "Jane Citizen",
+            "jobTitle": "Principal",
+            "preferredPhoneNumber": "0400 000 000",
+            "_links": None,
+        }
+    ],
+    "inspections": [
+        {"startTime": "2022-09-03T10:00:00+10:00", "endTime": None, "display": {"longLabel": "Saturday 3 Sep 10:00am"}}
+    ],
+}
+
+
+def test_get_path():
+    get_display = get_path("address", "display", "fullAddress")
+    assert get_display({"address": {"display": {"fullAddress": "12 Captain Cook Drive"}}}) == "12 Captain Cook Drive"
+    assert get_display({"address": {"display": None}}) is None
+    assert get_display({}) is None
+
+
+def test_get_listing():
+    listing = get_listing(LISTING)
+    assert listing.id == "143160680"
+    assert listing.badge is None
+    assert listing.suburb == "Seventeen Seventy"
+    assert listing.full_address is None
+    assert listing.listing_company_phone == "0749749999"
+    assert (listing.bedrooms, listing.bathrooms, listing.parking_spaces) == (4, 2, None)
+    assert listing.building_size is None
+    assert (listing.land_size, listing.land_size_unit) == (1012.0, "m²")
+    assert (listing.price, listing.price_text) == (1250000, "Offers over $1,250,000")
+    assert listing.auction_date is None
+    assert listing.images == [MediaItem(link="https://i2.au.reastatic.net/1144x888-format=webp/image1.jpg")]
+    assert listing.images_floorplans == []
+    assert listing.listers == [
+        Lister(
+            id="2218406",
+            name="Jane Citizen",
+            agent_id=None,
+            job_title="Principal",
+            url=None,
+            phone="0400000000",
+            email=None,
+        )
+    ]
+    assert listing.inspections == [
+        Inspection(
+            start_time="2022-09-03T10:00:00+10:00",
+            end_time=None,
+            label="Saturday 3 Sep 10:00am",
+            label_short=None,
+        )
+    ]
+
+
+def test_get_listing_empty():
+    listing = get_listing({})
+    assert listing.id is None
+    assert listing.land_size == -1.0
+    assert listing.price is None
+    assert listing.images == [] and listing.listers == [] and listing.inspections == []
+
+
+def test_listing_slots():
+    listing = get_listing(LISTING)
+    assert not hasattr(listing, "__dict__")
+    assert not hasattr(listing.listers[0], "__dict__")
+    assert pickle.loads(pickle.dumps(listing)) == listing
+
+
+# what slots_dataclass does before Python 3.10
+@_add_slots
+@dataclass(frozen=True)
+class Point:
+    x: int
+    y: int = 0
+    tags: list = field(default_factory=list)
+
+
+def test_add_slots():
+    point = Point(1)
+    assert not hasattr(point, "__dict__")
+    assert (point.y, point.tags) == (0, [])
+    assert pickle.loads(pickle.dumps(point)) == point
+    with pytest.raises(FrozenInstanceError):
+        point.x = 2
+
+
+def test_get_lister_phone():
+    assert get_lister({"preferredPhoneNumber": "0400 000 000"}).phone == "0400000000"
+    # sold listings' listers have a phoneNumber object instead
+    assert get_lister({"phoneNumber": {"display": "0400 000 001"}}).phone == "0400000001"
@@ -0,0 +1,92 @@
+import os
+import sqlite3
+import pytest
+
+from realestate_com_au.media import MediaCache, MediaPrefetcher, get_media_url
+from realestate_com_au.objects.listing import IMAGE_SIZE, Listing, MediaItem, get_image
+
+
+def get_image_body(path):
+    if "missing" in path:
+        return None
+    # images named "copy..." are the same file as the image they copy
+    return path.rsplit("/", 1)[-1].replace("copy", "image").encode("utf-8") * 100
+
+
+def get_listing_with_images(server, listing_id, names):
+    templated_url = f"http://127.0.0.1:{server.server_port}/{{size}}/{listing_id}/"
+    return Listing(
+        **{
+            **{name: None for name in Listing.__dataclass_fields__},
+            "id": listing_id,
+            "images": [get_image({"templatedUrl": templated_url + name}) for name in names],
+            "images_floorplans": [],
+            "listers": [],
+            "inspections": [],
+        }
+    )
+
+
+def test_get_media_url():
+    media_item = MediaItem(link=f"https://i2.au.reastatic.net/{IMAGE_SIZE}/abc/image1.jpg")
+    assert get_media_url(media_item) == media_item.link
+    assert get_media_url(media_item, "800x600-format=webp") == (
+        "https://i2.au.reastatic.net/800x600-format=webp/abc/image1.jpg"
+    )
+    assert get_media_url(MediaItem(link=None)) is None
+
+
+def test_prefetch(server, tmp_path):
+    server.get_body = get_image_body
+    cache = MediaCache(str(tmp_path))
+    prefetcher = MediaPrefetcher(cache, workers=2)
+    listings = [
+        get_listing_with_images(server, "1", ["image1.jpg", "image2.jpg", "missing.jpg"]),
+        get_listing_with_images(server, "2", ["image1.jpg", "copy1.jpg"]),
+    ]
+
+    paths = prefetcher.prefetch(iter(listings), size="thumbnail")
+    assert len(paths) == 4
+    assert len(server.requested_paths) == 5
+    assert all("340x255" in path for path in server.requested_paths)
+    # both listings' image1.jpg and copy1.jpg are the same file, so it is only stored once
+    assert len(set(paths.values())) == 2
+
+    # a re-crawl of the same listings doesn't download anything it already has
+    assert prefetcher.prefetch(listings, size="thumbnail") == paths
+    assert len(server.requested_paths) == 6  # only missing.jpg again
+
+
+def test_cache_eviction(tmp_path):
+    cache = MediaCache(str(tmp_path), max_size=250)
+    first = cache.put("http://example.com/1.jpg", b"1" * 100)
+    cache.put("http://example.com/2.jpg", b"2" * 100)
+    assert cache.get("http://example.com/1.jpg") == first
+
+    cache.put("http://example.com/3.jpg", b"3" * 100)
+    assert "http://example.com/1.jpg" in cache
+    assert "http://example.com/2.jpg" not in cache
+    assert os.path.exists(first)
+
+
+def test_cache_access_times(tmp_path):
+    cache = MediaCache(str(tmp_path), flush_every=2)
+    cache.put("http://example.com/1.jpg", b"1")
+    cache.put("http://example.com/2.jpg", b"2")
+    index = sqlite3.connect(str(tmp_path / "index.sqlite"))
+
+    def get_accessed_at():
+        return dict(index.execute("SELECT digest, accessed_at FROM objects"))
+
+    accessed_at = get_accessed_at()
+    cache.get("http://example.com/1.jpg")
+    # hits are only written in batches
+    assert get_accessed_at() == accessed_at
+    cache.get("http://example.com/2.jpg")
+    flushed_accessed_at = get_accessed_at()
+    assert all(flushed_accessed_at[digest] > accessed_at[digest] for digest in accessed_at)
+
+    # and on close
+    cache.get("http://example.com/1.jpg")
+    cache.close()
+    assert get_accessed_at() != flushed_accessed_at
@@ -0,0 +1,66 @@
+import time
+
+from realestate_com_au.metrics import Metrics, timer
+from realestate_com_au.rate_limit import RetryPolicy
+from conftest import MockResponse
+
+
+def test_search_metrics(api):
+    api._metrics = metrics = Metrics()
+    events = []
+    metrics.add_hook(lambda name, value: events.append(name))
+
+    api.search(exclude_keywords=["pool"])
+
+    summary = metrics.summary()
+    assert summary["counters"] == {"pages": 3, "listings": 5}
+    assert summary["stages"]["decode"]["count"] == 3
+    assert summary["stages"]["parse"]["count"] == 3
+    assert summary["stages"]["filter"]["count"] == 3
+    assert summary["rates"]["listings"] > 0
+    assert events.count("pages") == 3
+
+
+def test_request_metrics(api):
+    api._metrics = metrics = Metrics()
+    api._retry_policy = RetryPolicy(backoff=0)
+    responses = [MockResponse({}, status_code=503), MockResponse({})]
+
+    api._request(lambda api, uri, **kwargs: responses.pop(0), "", retry=True)
+
+    counters = metrics.summary()["counters"]
+    assert counters["requests"] == 2
+    assert counters["retries"] == 1
+    assert counters["bytes_received"] == 4
+    assert metrics.summary()["stages"]["request"]["count"] == 2
+
+
+def test_request_excludes_throttle(api):
+    api._metrics = metrics = Metrics()
+    api._fresh = False
+
+    def send(api, uri, evade, **kwargs):
+        evade()
+        return MockResponse({})
+
+    api._request(send, "", evade=lambda: time.sleep(0.05))
+
+    stages = metrics.summary()["stages"]
+    assert stages["throttle"]["total"] >= 0.05
+    assert stages["request"]["total"] < 0.05
+
+
+def test_to_prometheus():
+    metrics = Metrics()
+    with metrics.time("parse"):
+        pass
+    metrics.increment("listings", 25)
+
+    text = metrics.to_prometheus()
+    assert 'realestate_com_au_stage_seconds_count{stage="parse"} 1' in text
+    assert "realestate_com_au_listings_total 25" in text
+
+
+def test_disabled_timer():
+    with timer(None, "parse"):
+        pass
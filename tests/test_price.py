@@ -0,0 +1,33 @@
+import pytest
+
+from realestate_com_au.objects.price import PriceRange, parse_price, parse_prices
+
+
+@pytest.mark.parametrize(
+    "price_text,price_range",
+    [
+        ("$1,250,000", PriceRange(1250000, 1250000, 1250000, True)),
+        ("$850k - $900k", PriceRange(850000, 900000, 875000, True)),
+        ("Buyers $800,000 to $850,000", PriceRange(800000, 850000, 825000, True)),
+        ("$1.1 - 1.2m", PriceRange(1100000, 1200000, 1150000, True)),
+        ("$1.1m - 1.2", PriceRange(1100000, 1200000, 1150000, True)),
+        ("$950,000 - 1.1m", PriceRange(950000, 1100000, 1025000, True)),
+        ("$1.5 million", PriceRange(1500000, 1500000, 1500000, True)),
+        ("$550 per week", PriceRange(550, 550, 550, True)),
+        ("$550pw", PriceRange(550, 550, 550, True)),
+        ("$5 months free", PriceRange(5, 5, 5, True)),
+        ("Offers over $1.2m", PriceRange(1200000, None, 1200000, False)),
+        ("$600,000+", PriceRange(600000, None, 600000, False)),
+        ("Under $700,000", PriceRange(None, 700000, 700000, False)),
+        ("Contact agent", PriceRange(None, None, None, False)),
+        (None, PriceRange(None, None, None, False)),
+    ],
+)
+def test_parse_price(price_text, price_range):
+    assert parse_price(price_text) == price_range
+
+
+def test_parse_prices():
+    price_ranges = parse_prices(["$850k - $900k", "Contact agent", "$850k - $900k"])
+    assert [price_range.midpoint for price_range in price_ranges] == [875000, None, 875000]
+    assert price_ranges[0] is price_ranges[2]
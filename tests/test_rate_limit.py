@@ -0,0 +1,94 @@
+import time
+import pytest
+import requests
+
+from realestate_com_au import RealestateComAu
+from realestate_com_au.rate_limit import RateLimiter, RetryPolicy, parse_retry_after
+from conftest import MockResponse
+
+
+@pytest.fixture
+def rate_limiter():
+    return RateLimiter(rate=100, burst=10, max_rate=1000)
+
+
+@pytest.fixture
+def api(server, rate_limiter):
+    api = RealestateComAu(
+        rate_limiter=rate_limiter,
+        retry_policy=RetryPolicy(max_retries=2, backoff=0),
+    )
+    api._base_url = f"http://127.0.0.1:{server.server_port}"
+    return api
+
+
+def test_parse_retry_after():
+    assert parse_retry_after("2") == 2
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0
+    assert parse_retry_after("soon") is None
+    assert parse_retry_after(None) is None
+
+
+def test_retry(api, server, rate_limiter):
+    server.statuses = [429, 502]
+    res = api._post("/graphql", json={}, retry=True)
+    assert res.status_code == 200
+    assert server.requests == 3
+    assert rate_limiter.rate < 100
+
+
+def test_retry_gives_up(api, server):
+    server.statuses = [500, 500, 500, 500]
+    res = api._post("/graphql", json={}, retry=True)
+    assert res.status_code == 500
+    assert server.requests == 3
+
+
+def test_retry_connection_error(api):
+    api._base_url = "http://127.0.0.1:1"
+    with pytest.raises(requests.ConnectionError):
+        api._post("/graphql", json={}, retry=True)
+
+
+def test_contact_agent_not_retried(api, server):
+    # an enquiry that may have been received must not be sent to the agent again
+    api.AGENT_CONTACT_BASE_URL = api._base_url
+    server.statuses = [502]
+    assert not api.contact_agent("1", "a@example.com", "A", "Hello")
+    assert server.requests == 1
+
+
+def get_response(status_code, retry_after=None):
+    res = MockResponse({}, status_code=status_code)
+    if retry_after is not None:
+        res.headers["Retry-After"] = retry_after
+    return res
+
+
+def test_retry_after():
+    retry_policy = RetryPolicy(max_backoff=60)
+    assert retry_policy.should_retry(get_response(429, "30"), 0)
+    assert retry_policy.get_delay(get_response(429, "30"), 0) == 30
+    # the server asks for a longer wait than the policy allows, so give up rather than retry early
+    assert not retry_policy.should_retry(get_response(429, "120"), 0)
+    assert not retry_policy.should_retry(get_response(404), 0)
+
+
+def test_rate_limiter():
+    rate_limiter = RateLimiter(rate=50, burst=1, max_rate=50)
+    started_at = time.monotonic()
+    for _ in range(6):
+        rate_limiter.acquire()
+    assert time.monotonic() - started_at >= 0.09
+
+
+def test_rate_limiter_adapts():
+    rate_limiter = RateLimiter(rate=1, min_rate=0.5, max_rate=2, increase=0.5, decrease=0.5)
+    rate_limiter.on_success()
+    rate_limiter.on_success()
+    rate_limiter.on_success()
+    assert rate_limiter.rate == 2
+    rate_limiter.on_throttle()
+    rate_limiter.on_throttle()
+    rate_limiter.on_throttle()
+    assert rate_limiter.rate == 0.5
@@ -1,10 +1,150 @@
 import os
 import sys
+import json
 import pytest
 
 from realestate_com_au import RealestateComAu
+from conftest import get_page
 
 
 def test_constructor():
     api = RealestateComAu()
     assert api
+
+
+def test_search(api):
+    listings = api.search(locations=["seventeen seventy, qld 4677"])
+    assert [listing.id for listing in listings] == ["1", "2", "3", "4", "5"]
+    assert api.requested_pages == [1, 2, 3]
+
+
+def test_search_stream(api):
+    listings = api.search(locations=["seventeen seventy, qld 4677"], stream=True)
+    assert api.requested_pages == []
+
+    assert next(listings).id == "1"
+    assert api.requested_pages == [1]
+
+    assert [listing.id for listing in listings] == ["2", "3", "4", "5"]
+    assert api.requested_pages == [1, 2, 3]
+
+
+def test_search_limit(api):
+    listings = api.search(limit=3, stream=True)
+    assert [listing.id for listing in listings] == ["1", "2", "3", "4"]
+    assert api.requested_pages == [1, 2]
+
+
+def test_search_workers(api):
+    listings = api.search(workers=2)
+    assert [listing.id for listing in listings] == ["1", "2", "3", "4", "5"]
+    assert sorted(api.requested_pages) == [1, 2, 3]
+
+
+def test_search_workers_start_page(api):
+    listings = api.search(start_page=2, workers=2)
+    assert [listing.id for listing in listings] == ["3", "4", "5"]
+    assert sorted(api.requested_pages) == [2, 3]
+
+
+def test_search_many(api):
+    listings = api.search_many(
+        [
+            {"locations": ["seventeen seventy, qld 4677"]},
+            {"locations": ["agnes water, qld 4677"], "start_page": 2},
+        ]
+    )
+    assert [listing.id for listing in listings] == ["1", "2", "3", "4", "5"]
+    assert api.requested_pages == [1, 2, 3, 2, 3]
+
+
+@pytest.fixture
+def market_api():
+    api = RealestateComAu()
+    api.requested_queries = []
+    market = [(str(index), index * 100000, index % 3 + 1) for index in range(1, 11)]
+
+    def post(uri, **kwargs):
+        query = json.loads(kwargs["json"]["variables"]["query"])
+        api.requested_queries.append(query)
+        filters = query["filters"]
+        price_range = filters.get("priceRange", {})
+        bedrooms_range = filters.get("bedroomsRange", {})
+        matches = [
+            listing_id
+            for listing_id, price, bedrooms in market
+            if int(price_range.get("minimum", 0)) <= price <= int(price_range.get("maximum", 10 ** 9))
+            and int(bedrooms_range.get("minimum", 0)) <= bedrooms <= int(bedrooms_range.get("maximum", 100))
+        ]
+        page_size = query["pageSize"] if query["pageSize"] > 0 else 25
+        page = query["page"]
+        res = get_page(
+            query["channel"],
+            page,
+            matches[(page - 1) * page_size : page * page_size],
+            page * page_size < len(matches),
+        )
+        res.json()["data"][f"{query['channel']}Search"]["results"]["totalResultsCount"] = len(matches)
+        return res
+
+    api._post = post
+    return api
+
+
+def test_count(market_api):
+    assert market_api.count() == 10
+    assert market_api.count(min_price=250000, max_price=550000) == 3
+
+
+def test_search_split(market_api):
+    listings = market_api.search_split(max_results=3)
+    assert sorted(int(listing.id) for listing in listings) == list(range(1, 11))
+
+
+def test_search_split_reuses_first_page(market_api):
+    market_api.search_split(max_results=3)
+    queries = [json.dumps(query, sort_keys=True) for query in market_api.requested_queries]
+    assert len(queries) == len(set(queries))
+    assert all(query["pageSize"] != 1 for query in market_api.requested_queries)
+
+
+def test_search_split_limits(market_api):
+    assert len(market_api.search_split(max_results=3, limit=4)) == 4
+    assert len(market_api.search_split(max_results=3, channel="sold", sold_limit=4)) == 4
+    # sold_limit only applies to sold searches, as with search
+    assert len(market_api.search_split(max_results=3, sold_limit=4)) == 10
+
+
+def test_search_split_seen_ids(market_api):
+    seen_ids = {"1", "2"}
+    pages = []
+    listings = market_api.search_split(
+        max_results=3, seen_ids=seen_ids, on_page=lambda page, results: pages.append(page)
+    )
+    assert sorted(int(listing.id) for listing in listings) == list(range(3, 11))
+    assert len(seen_ids) == 10
+    assert pages
+
+
+def test_search_split_bedrooms(market_api):
+    market_api._MIN_SPLIT_PRICE_RANGE = 10 ** 7
+    listings = market_api.search_split(max_results=3)
+    assert sorted(int(listing.id) for listing in listings) == list(range(1, 11))
+    assert any("bedroomsRange" in query["filters"] for query in market_api.requested_queries)
+
+
+def test_search_exclude_keywords(api):
+    descriptions = {"1": "Resort style pool", "3": "Sparkling POOL"}
+
+    post = api._post
+
+    def post_with_descriptions(uri, **kwargs):
+        res = post(uri, **kwargs)
+        results = res.json()["data"]["buySearch"]["results"]
+        for item in results["exact"]["items"]:
+            item["listing"]["description"] = descriptions.get(item["listing"]["id"])
+        return res
+
+    api._post = post_with_descriptions
+    listings = api.search(exclude_keywords=["pool"])
+    assert [listing.id for listing in listings] == ["2", "3", "4", "5"]
@@ -0,0 +1,66 @@
+from dataclasses import replace
+import json
+import os
+import pytest
+
+from realestate_com_au.objects.listing import get_listing
+from realestate_com_au.store import ListingStore
+
+FIXTURE_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "benchmarks",
+    "fixtures",
+    "listing.json",
+)
+
+
+@pytest.fixture
+def listing():
+    with open(FIXTURE_PATH, encoding="utf8") as f:
+        return get_listing(json.load(f))
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = ListingStore(str(tmp_path / "listings.sqlite"))
+    yield store
+    store.close()
+
+
+def test_save_load(store, listing):
+    store.save([listing])
+    assert store.load() == [listing]
+
+
+def test_save_replaces(store, listing):
+    store.save([listing])
+    listing.price = 1100000
+    listing.listers = []
+    store.save([listing])
+    assert store.load() == [listing]
+
+
+def test_save_duplicates(store, listing):
+    updated = replace(listing, price=1100000)
+    store.save([listing, updated])
+    assert store.load() == [updated]
+
+
+def test_save_stream(store, listing):
+    def listings():
+        for listing_id in range(5):
+            suburb = "Agnes Water" if listing_id % 2 else "Seventeen Seventy"
+            yield replace(listing, id=str(listing_id), suburb=suburb)
+
+    assert store.save_stream(listings(), batch_size=2) == 5
+    assert len(store.load()) == 5
+
+    listings = store.load("suburb = ?", ("Agnes Water",))
+    assert sorted(listing.id for listing in listings) == ["1", "3"]
+    assert all(len(listing.images) == 3 for listing in listings)
+
+
+def test_delete(store, listing):
+    store.save([listing])
+    store.delete([listing.id])
+    assert store.load() == []
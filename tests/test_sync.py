@@ -0,0 +1,46 @@
+import pytest
+
+from realestate_com_au.sync import DEFAULT_SYNC_SORT_TYPE, SyncState, get_query_key, sync
+
+
+@pytest.fixture
+def state(tmp_path):
+    state = SyncState(str(tmp_path / "sync.sqlite"))
+    yield state
+    state.close()
+
+
+def test_sync(api, state):
+    result = sync(api, state, locations=["seventeen seventy, qld 4677"])
+    assert [listing.id for listing in result.added] == ["1", "2", "3", "4", "5"]
+    assert result.complete
+
+    api.requested_pages.clear()
+    result = sync(api, state, locations=["seventeen seventy, qld 4677"])
+    assert not result.added and not result.updated and not result.removed
+    assert not result.complete
+    assert api.requested_pages == [1]
+
+
+def test_sync_full(api, state):
+    sync(api, state)
+
+    api.pages[3] = ["6"]
+    result = sync(api, state, full=True)
+    assert [listing.id for listing in result.added] == ["6"]
+    assert result.removed == ["5"]
+    assert result.complete
+
+
+def test_sync_limit(api, state):
+    sync(api, state, full=True, limit=3)
+
+    # new listings push the ones last seen past the limit
+    api.pages[1] = ["6", "7"]
+    api.pages[2] = ["1", "2"]
+    result = sync(api, state, full=True, limit=3)
+    assert [listing.id for listing in result.added] == ["6", "7"]
+    assert not result.complete
+    assert result.removed == []
+    query_key = get_query_key({"limit": 3, "sort_type": DEFAULT_SYNC_SORT_TYPE})
+    assert {"3", "4"} <= set(state.get_fingerprints(query_key))
@@ -0,0 +1,57 @@
+import pytest
+
+from realestate_com_au import RealestateComAu
+from realestate_com_au.transport import Transport
+
+
+def get_api(server, transport):
+    api = RealestateComAu(transport=transport)
+    api._base_url = f"http://127.0.0.1:{server.server_port}"
+    return api
+
+
+def test_shared_transport(server):
+    transport = Transport(pool_size=2)
+    apis = [get_api(server, transport) for _ in range(3)]
+    for api in apis:
+        assert api._graphql({}, "buy") == {"data": {}}
+
+    # every client reused the same kept-alive connection
+    assert server.connections == 1
+    assert "gzip" in transport.session.headers["accept-encoding"]
+    # the clients' headers are sent with their requests, but not set for other users of the transport
+    assert server.request_headers["origin"] == RealestateComAu.REQUEST_HEADERS["origin"]
+    assert "origin" not in transport.session.headers
+
+
+def test_default_transport():
+    first, second = RealestateComAu(), RealestateComAu()
+    assert first._client.session is not second._client.session
+
+
+def test_proxies_with_transport():
+    with pytest.raises(ValueError):
+        RealestateComAu(proxies={"https": "http://127.0.0.1:3128"}, transport=Transport())
+
+
+def test_http2_transport(server):
+    httpx = pytest.importorskip("httpx")
+    pytest.importorskip("h2")
+    with Transport(pool_size=2, http2=True) as transport:
+        assert isinstance(transport.session, httpx.Client)
+        assert transport.connection_errors == (httpx.TransportError,)
+        apis = [get_api(server, transport) for _ in range(2)]
+        for api in apis:
+            assert api._graphql({}, "buy") == {"data": {}}
+
+    assert server.connections == 1
+
+
+def test_cookie_path(server, tmp_path):
+    cookie_path = str(tmp_path / "cookies.txt")
+    with Transport(cookie_path=cookie_path) as transport:
+        get_api(server, transport)._graphql({}, "buy")
+
+    transport = Transport(cookie_path=cookie_path)
+    assert transport.session.cookies.get("session") == "abc"
+    assert list(tmp_path.iterdir()) == [tmp_path / "cookies.txt"]